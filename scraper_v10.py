@@ -8,11 +8,41 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-from datetime import datetime
+from collections import namedtuple
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlparse
+from zoneinfo import ZoneInfo
+import argparse
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import multiprocessing
+import os
+import queue
 import re
+import requests
+import sqlite3
+import sys
+import threading
 import time
 
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None   # Only needed for poster thumbnails
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None   # Only needed for the Parquet archive
+
 def setup_driver():
     """Set up Selenium Chrome driver with options to appear more human-like"""
     
@@ -45,384 +75,971 @@ def setup_driver():
     return driver
 
 
-def scrape_vista_theater():
-    """Scrape film screenings from Vista Theater ticketing website"""
+class Event:
+    """One screening, as it moves through the pipeline"""
     
-    url = "https://ticketing.uswest.veezi.com/sessions/?siteToken=20xhpa3yt2hhkwt4zjvfcwsaww"
-    venue_name = "The Vista Theater"
-    venue_short = "Vista"
-    event_type = "film"
-    default_url = "https://ticketing.uswest.veezi.com/sessions/?siteToken=20xhpa3yt2hhkwt4zjvfcwsaww"
+    __slots__ = ('id', 'film_id', 'title', 'venue', 'venue_short', 'type', 'start', 'time_defaulted',
+                 'description', 'url', 'runtime', 'format', 'poster_url', 'poster')
     
-    print(f"Scraping {venue_name}...")
+    def __init__(self, title, venue, venue_short, event_type, start, description="", url="", time_defaulted=False,
+                 poster_url=""):
+        self.title = title
+        self.venue = sys.intern(venue)
+        self.venue_short = sys.intern(venue_short)
+        self.type = sys.intern(event_type)
+        self.start = start
+        self.time_defaulted = time_defaulted
+        self.description = description
+        self.url = url
+        self.poster_url = poster_url
+        self.id = event_id(self.venue_short, start, title)
+        self.film_id = None   # Set by the cluster stage
+        self.runtime = None   # Minutes; set by the enrich stage
+        self.format = ""      # e.g. "35mm"; set by the enrich stage
+        self.poster = None    # Local thumbnail path prefix; set by the posters stage
     
-    driver = None
-    try:
-        driver = setup_driver()
-        driver.get(url)
-        time.sleep(5)
-        
-        print(f"  Page loaded successfully")
+    @classmethod
+    def from_strings(cls, title, venue, venue_short, event_type, date_str, time_str, description="", url="",
+                     time_defaulted=False, poster_url=""):
+        """Build an event from a "2026-02-14" date and a "7:30 PM" time"""
         
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        events = []
-        current_year = datetime.now().year
-        
-        # Find all headers (h2, h3, h4 tags)
-        all_headers = soup.find_all(['h2', 'h3', 'h4'])
+        return cls(title, venue, venue_short, event_type, parse_start(date_str, time_str),
+                   description=description, url=url, time_defaulted=time_defaulted, poster_url=poster_url)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build an event from an events.json record"""
         
-        print(f"  Found {len(all_headers)} header elements")
+        event = cls.from_strings(data['title'], data['venue'], data['venueShort'], data['type'],
+                                 data['date'], data['time'], data.get('description', ''), data.get('url', ''),
+                                 data.get('timeDefaulted', False))
+        event.film_id = data.get('filmId')
+        event.runtime = data.get('runtime')
+        event.format = data.get('format', '')
+        event.poster = data.get('poster')
+        return event
+    
+    @classmethod
+    def from_record(cls, record):
+        return cls(*record)
+    
+    def to_record(self):
+        return [self.title, self.venue, self.venue_short, self.type, self.start,
+                self.description, self.url, self.time_defaulted, self.poster_url]
+    
+    @property
+    def date(self):
+        return local_time(self.start).strftime('%Y-%m-%d')
+    
+    @property
+    def time(self):
+        wall = local_time(self.start)
+        hour = wall.hour % 12 or 12
+        period = 'AM' if wall.hour < 12 else 'PM'
+        return f"{hour}:{wall.minute:02d} {period}"
+    
+    def __repr__(self):
+        return f"Event({self.title!r}, {self.venue_short!r}, {self.date} {self.time})"
+    
+    def to_dict(self):
+        """The events.json record for this event ("timeDefaulted" only when set)"""
         
-        for header in all_headers:
-            title = header.get_text(strip=True)
-            
-            if not title or len(title) < 3:
-                continue
-            
-            # Skip venue name
-            if 'vista' in title.lower() and 'theater' in title.lower():
-                continue
-            
-            # Skip if title STARTS with a day of the week (these are date headers)
-            days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-            if any(title.lower().startswith(day) for day in days):
-                continue
-            
-            # Skip common UI text
-            skip_terms = ['select', 'choose', 'tickets', 'sessions', 'showtimes', 'book now']
-            if any(term in title.lower() for term in skip_terms):
-                continue
-            
-            # Get surrounding text from parent container
-            parent = header.find_parent()
-            if not parent:
-                continue
-            
-            section_text = parent.get_text()
-            
-            # Look for date: "Thursday 22, January" or just "22, January"
-            date_pattern = r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)?\s*(\d{1,2}),?\s+(January|February|March|April|May|June|July|August|September|October|November|December)'
-            date_match = re.search(date_pattern, section_text, re.I)
-            
-            # Look for time: "7:15 PM"
-            time_pattern = r'(\d{1,2}:\d{2}\s*(?:am|pm))'
-            time_match = re.search(time_pattern, section_text, re.I)
-            
-            if date_match and time_match:
-                day = int(date_match.group(1))
-                month_name = date_match.group(2)
-                month_num = datetime.strptime(month_name, '%B').month
-                date_str = f"{current_year}-{month_num:02d}-{day:02d}"
-                
-                time_str = time_match.group(1).upper()
-                
-                # Try to find a link - look for <a> tags in the parent
-                event_url = default_url
-                links = parent.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    # Look for purchase links
-                    if 'purchase' in href or 'siteToken' in href:
-                        if href.startswith('http'):
-                            event_url = href
-                        else:
-                            event_url = f"https://ticketing.uswest.veezi.com{href}"
-                        break
-                
-                event = {
-                    "title": title,
-                    "venue": venue_name,
-                    "venueShort": venue_short,
-                    "type": event_type,
-                    "date": date_str,
-                    "time": time_str,
-                    "description": "",
-                    "url": event_url
-                }
+        record = {
+            "id": self.id,
+            "title": self.title,
+            "venue": self.venue,
+            "venueShort": self.venue_short,
+            "type": self.type,
+            "date": self.date,
+            "time": self.time,
+            "start": self.start,
+            "description": self.description,
+            "url": self.url,
+            "runtime": self.runtime,
+            "format": self.format,
+            "poster": self.poster,
+            "filmId": self.film_id
+        }
+        if self.time_defaulted:
+            record["timeDefaulted"] = True
+        return record
+
+
+def normalize_title(title):
+    """Lowercase a title and reduce it to words, for matching and IDs"""
+    
+    title = re.sub(r'[^\w\s]', ' ', title.lower())
+    return re.sub(r'\s+', ' ', title).strip()
+
+
+def event_id(venue_short, start, title):
+    """Stable 16-hex-digit ID from the normalized venue, start time and title"""
+    
+    wall_clock = local_time(start).strftime('%Y-%m-%dT%H:%M')
+    key = f"{normalize_title(venue_short)}|{wall_clock}|{normalize_title(title)}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+# All venues are in Los Angeles; showtimes are local wall-clock times there
+VENUE_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+
+def local_time(start):
+    """The Los Angeles wall-clock datetime of a start timestamp"""
+    
+    return datetime.fromtimestamp(start, VENUE_TIMEZONE)
+
+
+def parse_start(date_str, time_str):
+    """Turn "2026-02-14" and "7:30 PM" into a start timestamp (see Event)"""
+    
+    year, month, day = (int(part) for part in date_str.split('-'))
+    time_match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', time_str, re.I)
+    if not time_match:
+        raise ValueError(f"Unrecognized time: {time_str!r}")
+    
+    hours = int(time_match.group(1))
+    minutes = int(time_match.group(2))
+    period = time_match.group(3).upper()
+    
+    # Convert to 24-hour format
+    if period == 'PM' and hours != 12:
+        hours += 12
+    elif period == 'AM' and hours == 12:
+        hours = 0
+    
+    # datetime() validates the fields (e.g. rejects February 30)
+    return int(datetime(year, month, day, hours, minutes, tzinfo=VENUE_TIMEZONE).timestamp())
+
+
+# Only events within this many days from today are scraped; pagination and
+# card parsing stop at the horizon
+SCRAPE_HORIZON_DAYS = int(os.environ.get('SCRAPE_HORIZON_DAYS', '60'))
+
+
+def horizon_date():
+    """The first date past the scrape horizon, e.g. 2026-02-14"""
+    
+    today = datetime.now(VENUE_TIMEZONE).date()
+    return (today + timedelta(days=SCRAPE_HORIZON_DAYS + 1)).isoformat()
+
+
+def horizon_end():
+    """The first start timestamp past the scrape horizon"""
+    
+    return parse_start(horizon_date(), "12:00 AM")
+
+
+def page_beyond_horizon(dates):
+    """True if a page lists dates ("2026-02-14") and even the earliest is past the horizon"""
+    
+    dates = list(dates)
+    return bool(dates) and min(dates) >= horizon_date()
+
+
+CACHE_DIR = '.cache'
+CARD_CACHE_FILE = os.path.join(CACHE_DIR, 'card_cache.json')
+CARD_CACHE_VERSION = 5          # Bump when an extract_*_card function changes
+CACHE_MAX_AGE_DAYS = 14         # Drop cached cards/pages not seen for this long
+
+# Per-card extraction results, keyed by card_key(). Loaded once per parse
+# worker; results computed or reused during a parse are recorded in the
+# page's PageParse so the main process can merge them back.
+card_cache = {}
+
+
+class PageParse:
+    """What parsing one page records besides its events"""
+    
+    def __init__(self):
+        self.card_updates = {}
+        self.skipped = 0
+
+
+def normalize_html(html):
+    """Normalize markup so cosmetic differences don't change its hash"""
+    
+    html = re.sub(r'\snonce="[^"]*"', '', html)
+    return re.sub(r'\s+', ' ', html).strip()
+
+
+def card_key(venue_short, parts):
+    """Hash a card's normalized HTML (plus the venue and current year)"""
+    
+    digest = hashlib.sha1(f"{CARD_CACHE_VERSION}|{venue_short}|{datetime.now().year}".encode('utf-8'))
+    for part in parts:
+        digest.update(b'\0')
+        digest.update(normalize_html(str(part)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def skip_beyond_horizon(page, date_str):
+    """True (and counted as skipped in page) if a card dated date_str is past the horizon"""
+    
+    if date_str < horizon_date():
+        return False
+    page.skipped += 1
+    return True
+
+
+def extract_cards(page, venue_short, cards, extract):
+    """Run extract(*card) on each card, reusing cached results for unchanged cards"""
+    
+    events = []
+    reused = 0
+    end = horizon_end()
+    
+    for card in cards:
+        key = card_key(venue_short, card)
+        cached = card_cache.get(key)
+        if cached is not None:
+            card_events = [Event.from_record(record) for record in cached['events']]
+            reused += 1
+        else:
+            try:
+                card_events = extract(*card)
+            except ValueError as e:
+                # Impossible date or time on the page (e.g. "February 30")
+                print(f"    Skipping card: {e}")
+                card_events = []
+        page.card_updates[key] = [event.to_record() for event in card_events]
+        for event in card_events:
+            if event.start < end:
                 events.append(event)
-                print(f"    Found: {title} on {date_str} at {time_str}")
-        
-        print(f"✓ Successfully scraped {len(events)} events from {venue_name}")
-        return events
-        
+            else:
+                page.skipped += 1
+    
+    if cards:
+        print(f"    Reused {reused} of {len(cards)} cards from cache")
+    return events
+
+
+def drop_stale_entries(entries):
+    """Drop cache entries whose "seen" date is older than CACHE_MAX_AGE_DAYS"""
+    
+    cutoff = (datetime.now() - timedelta(days=CACHE_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+    return {key: entry for key, entry in entries.items() if entry['seen'] >= cutoff}
+
+
+def load_card_cache():
+    """Load the card cache from disk, dropping entries that have gone stale"""
+    
+    try:
+        with open(CARD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get('version') != CARD_CACHE_VERSION:
+        return {}
+    
+    return drop_stale_entries(cache.get('cards', {}))
+
+
+def save_card_cache(cards):
+    """Save the card cache to disk"""
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CARD_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": CARD_CACHE_VERSION, "cards": cards}, f, ensure_ascii=False)
     except Exception as e:
-        print(f"✗ Error scraping {venue_name}: {e}")
-        return []
-    finally:
-        if driver:
-            driver.quit()
+        print(f"✗ Error saving card cache: {e}")
 
 
-def scrape_new_beverly():
-    """Scrape film screenings from New Beverly Cinema website"""
+PAGE_CACHE_FILE = os.path.join(CACHE_DIR, 'page_cache.json')
+PAGE_CACHE_VERSION = 5
+
+
+def normalize_page_html(html):
+    """Normalize a whole page, dropping the parts that change on every load"""
     
-    url = "https://thenewbev.com/schedule/"
-    venue_name = "The New Beverly Theater"
-    venue_short = "New Bev"
-    event_type = "film"
-    default_url = "https://thenewbev.com/schedule/"
+    html = re.sub(r'<(script|style|noscript)\b.*?</\1>', '', html, flags=re.I | re.S)
+    html = re.sub(r'<(?:link|meta)\b[^>]*>', '', html, flags=re.I)
+    html = re.sub(r'<input[^>]*(?:csrf|_token|nonce)[^>]*>', '', html, flags=re.I)
+    html = re.sub(r'\b(?:data-)?(?:nonce|csrf[\w-]*|timestamp|ts)="[^"]*"', '', html, flags=re.I)
+    return normalize_html(html)
+
+
+def page_hash(html):
+    """Content hash of a normalized page (plus the current year, which parsers use)"""
     
-    print(f"Scraping {venue_name}...")
+    digest = hashlib.sha1(f"{PAGE_CACHE_VERSION}|{datetime.now().year}|".encode('utf-8'))
+    digest.update(normalize_page_html(html).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_page_cache():
+    """Load the page cache: {"<venue>|<url>": {"hash", "events", "seen"}}"""
     
-    driver = None
     try:
-        driver = setup_driver()
-        driver.get(url)
-        time.sleep(3)
+        with open(PAGE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get('version') != PAGE_CACHE_VERSION:
+        return {}
+    return drop_stale_entries(cache.get('pages', {}))
+
+
+def save_page_cache(pages):
+    """Save the page cache to disk"""
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(PAGE_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": PAGE_CACHE_VERSION, "pages": pages}, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"✗ Error saving page cache: {e}")
+
+
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, 'http')
+HTTP_CACHE_MAX_BYTES = 100 * 1024 * 1024   # LRU-evict responses beyond this size
+
+HttpResponse = namedtuple('HttpResponse', ['url', 'status', 'content', 'content_type', 'from_cache'])
+
+
+class HttpCache:
+    """Persistent HTTP response cache for plain (non-browser) fetches"""
+    
+    def __init__(self, directory=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_file = os.path.join(directory, 'index.json')
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.stats = {"fresh": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0, "bytes_fetched": 0}
         
-        print(f"  Page loaded successfully")
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+    
+    def _path(self, entry):
+        return os.path.join(self.directory, entry['file'])
+    
+    def _session(self):
+        """This thread's requests.Session (Sessions aren't thread-safe)"""
         
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            self.local.session = session
+        return session
+    
+    def _read(self, url, entry):
+        """The stored response for url, or None if its body is gone (lock held)"""
         
-        events = []
-        current_year = datetime.now().year
+        try:
+            with open(self._path(entry), 'rb') as f:
+                content = f.read()
+        except OSError:
+            if self.index.get(url) is entry:
+                del self.index[url]
+            return None
+        return HttpResponse(url, entry['status'], content, entry.get('content_type', ''), True)
+    
+    def get(self, url, timeout=20):
+        """GET a URL through the cache and return an HttpResponse"""
+        
+        now = time.time()
+        with self.lock:
+            entry = self.index.get(url)
+            if entry and not os.path.exists(self._path(entry)):
+                entry = None
+        
+        # Still fresh under Cache-Control/Expires: no request at all
+        if entry and not entry.get('no_cache') and entry.get('expires', 0) > now:
+            with self.lock:
+                cached = self._read(url, entry)
+                if cached is not None:
+                    entry['used'] = now
+                    self.stats['fresh'] += 1
+                    self.stats['bytes_saved'] += entry['size']
+                    return cached
+            # Evicted since the lookup: a plain miss
+            entry = None
+        
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
         
-        event_cards = soup.find_all('h4')
+        response = self._session().get(url, headers=headers, timeout=timeout)
         
-        print(f"  Found {len(event_cards)} potential event cards")
+        if response.status_code == 304 and entry:
+            with self.lock:
+                cached = self._read(url, entry)
+                if cached is not None:
+                    entry.update(self._freshness(response, now))
+                    entry['used'] = now
+                    self.stats['revalidated'] += 1
+                    self.stats['bytes_saved'] += entry['size']
+                    return cached
+            # Evicted while revalidating: fetch the whole response again
+            response = self._session().get(url, timeout=timeout)
         
-        for title_tag in event_cards:
+        content = response.content
+        content_type = response.headers.get('Content-Type', '')
+        with self.lock:
+            self.stats['misses'] += 1
+            self.stats['bytes_fetched'] += len(content)
+        
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if response.status_code == 200 and 'no-store' not in cache_control:
+            self._store(url, response, content, content_type, now)
+        
+        return HttpResponse(url, response.status_code, content, content_type, False)
+    
+    def _freshness(self, response, now):
+        """Validators and expiry time taken from a response's headers"""
+        
+        fields = {}
+        if response.headers.get('ETag'):
+            fields['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            fields['last_modified'] = response.headers['Last-Modified']
+        
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        fields['no_cache'] = 'no-cache' in cache_control
+        max_age = re.search(r'max-age=(\d+)', cache_control)
+        if max_age:
+            # max-age counts from when the origin sent it; Age is time spent in caches since
+            age = response.headers.get('Age', '')
+            fields['expires'] = now + int(max_age.group(1)) - (int(age) if age.isdigit() else 0)
+        elif response.headers.get('Expires'):
             try:
-                title = title_tag.get_text(strip=True)
-                
-                if not title or len(title) < 3:
-                    continue
-                
-                # Only go up 2 parent levels (not 3) to stay within this movie's card
-                parent = title_tag.find_parent()
-                for _ in range(2):
-                    if parent and parent.find_parent():
-                        parent = parent.find_parent()
-                
-                if not parent:
-                    continue
-                
-                section_text = parent.get_text()
-                
-                # Look for date pattern with day of week: "Fri, January 23"
-                date_pattern = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})'
-                date_match = re.search(date_pattern, section_text, re.I)
-                
-                if date_match:
-                    month_name = date_match.group(1)
-                    day = int(date_match.group(2))
-                    month_num = datetime.strptime(month_name, '%B').month
-                    date_str = f"{current_year}-{month_num:02d}-{day:02d}"
-                else:
-                    continue
-                
-                time_pattern = r'(\d{1,2}:\d{2}\s*(?:am|pm))'
-                times = re.findall(time_pattern, section_text, re.I)
-                
-                if times:
-                    time_str = times[0].upper()
-                else:
-                    time_str = "7:30 PM"
-                
-                # Try to find the event URL - look for link on the title
-                event_url = default_url
-                # Check if h4 is inside an <a> tag
-                link_parent = title_tag.find_parent('a', href=True)
-                if link_parent:
-                    href = link_parent.get('href', '')
-                    if href.startswith('http'):
-                        event_url = href
-                    elif href.startswith('/'):
-                        event_url = f"https://thenewbev.com{href}"
-                else:
-                    # Look for links near the title
-                    links = parent.find_all('a', href=True)
-                    for link in links:
-                        href = link.get('href', '')
-                        if 'program' in href or 'event' in href:
-                            if href.startswith('http'):
-                                event_url = href
-                            elif href.startswith('/'):
-                                event_url = f"https://thenewbev.com{href}"
-                            break
-                
-                event = {
-                    "title": title,
-                    "venue": venue_name,
-                    "venueShort": venue_short,
-                    "type": event_type,
-                    "date": date_str,
-                    "time": time_str,
-                    "description": "",
-                    "url": event_url
-                }
-                events.append(event)
-                print(f"    Found: {title} on {date_str} at {time_str}")
-                
-            except Exception as e:
-                continue
+                fields['expires'] = parsedate_to_datetime(response.headers['Expires']).timestamp()
+            except (TypeError, ValueError):
+                fields['expires'] = 0
+        else:
+            fields['expires'] = 0
+        return fields
+    
+    def _store(self, url, response, content, content_type, now):
+        filename = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        entry = {"file": filename, "status": response.status_code, "content_type": content_type,
+                 "size": len(content), "used": now}
+        entry.update(self._freshness(response, now))
         
-        print(f"✓ Successfully scraped {len(events)} events from {venue_name}")
-        return events
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, filename), 'wb') as f:
+                f.write(content)
+            self.index[url] = entry
+            self._evict()
+    
+    def _evict(self):
+        """Drop least recently used responses until the cache fits (lock held)"""
         
-    except Exception as e:
-        print(f"✗ Error scraping {venue_name}: {e}")
-        return []
-    finally:
-        if driver:
-            driver.quit()
+        total = sum(entry['size'] for entry in self.index.values())
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]['used']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(entry))
+            except OSError:
+                pass
+            del self.index[url]
+            total -= entry['size']
+    
+    def save(self):
+        """Write the cache index to disk"""
+        
+        with self.lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(self.index_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.index, f)
+            except Exception as e:
+                print(f"✗ Error saving HTTP cache: {e}")
+    
+    def report(self):
+        """Print this run's hit/miss counts and bytes saved"""
+        
+        stats = self.stats
+        requests_made = stats['fresh'] + stats['revalidated'] + stats['misses']
+        if not requests_made:
+            return
+        hits = stats['fresh'] + stats['revalidated']
+        print(f"HTTP cache: {hits}/{requests_made} hits "
+              f"({stats['fresh']} fresh, {stats['revalidated']} revalidated, {stats['misses']} misses)")
+        print(f"  {stats['bytes_saved'] / 1024:.1f} KB served from cache, "
+              f"{stats['bytes_fetched'] / 1024:.1f} KB downloaded")
+
 
+FETCH_WORKERS = 8       # Requests a HostPool makes at once, across all hosts
+FETCH_PER_HOST = 2      # ... and to any one host
 
-def scrape_vidiots():
-    """Scrape film screenings from Vidiots website"""
+
+class HostPool:
+    """Thread pool for plain fetches that caps concurrent requests per host"""
     
-    url = "https://vidiotsfoundation.org/coming-soon/"
-    venue_name = "Vidiots"
-    venue_short = "Vidiots"
-    event_type = "film"
-    default_url = "https://vidiotsfoundation.org/coming-soon/"
+    def __init__(self, workers=FETCH_WORKERS, per_host=FETCH_PER_HOST):
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.per_host = per_host
+        self.host_slots = {}
+        self.lock = threading.Lock()
+    
+    def submit(self, url, fetch):
+        return self.pool.submit(self._run, url, fetch)
+    
+    def _run(self, url, fetch):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            slot = self.host_slots[host]
+        with slot:
+            return fetch(url)
+    
+    def shutdown(self):
+        self.pool.shutdown()
+
+
+def find_poster_url(element, base_url, max_levels=0):
+    """URL of the first image in a card (or up to max_levels of its ancestors), or an empty string"""
+    
+    for _ in range(max_levels + 1):
+        if element is None:
+            return ""
+        img = element.find('img')
+        if img is not None:
+            break
+        element = element.parent
+    else:
+        return ""
+    
+    for attr in ('data-src', 'data-lazy-src', 'src'):
+        src = img.get(attr)
+        if src and not src.startswith('data:'):
+            return urljoin(base_url, src)
+    srcset = img.get('data-srcset') or img.get('srcset')
+    if srcset:
+        return urljoin(base_url, srcset.split(',')[0].split()[0])
+    return ""
+
+
+def init_parse_worker(cache):
+    """Process pool initializer: give the worker a copy of the card cache"""
+    
+    card_cache.update(cache)
+
+
+def parse_page(parse, html):
+    """Run a venue's parse function in a worker; returns (events, card updates, truncated)"""
     
-    print(f"Scraping {venue_name}...")
+    page = PageParse()
+    events = parse(html, page)
+    return events, page.card_updates, page.skipped > 0
+
+
+def fetch_vista_theater():
+    """Load the Vista Theater sessions page in the browser"""
+    
+    url = "https://ticketing.uswest.veezi.com/sessions/?siteToken=20xhpa3yt2hhkwt4zjvfcwsaww"
     
-    driver = None
+    driver = setup_driver()
     try:
-        driver = setup_driver()
         driver.get(url)
         time.sleep(5)
         
         print(f"  Page loaded successfully")
+        yield url, driver.page_source
+    finally:
+        driver.quit()
+
+
+def parse_vista_theater(html, page):
+    """Parse film screenings from a Vista Theater sessions page"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Find all headers (h2, h3, h4 tags)
+    all_headers = soup.find_all(['h2', 'h3', 'h4'])
+    
+    print(f"  Found {len(all_headers)} header elements")
+    
+    cards = []
+    for header in all_headers:
+        title = header.get_text(strip=True)
         
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        if not title or len(title) < 3:
+            continue
         
-        events = []
-        current_year = datetime.now().year
+        # Skip venue name
+        if 'vista' in title.lower() and 'theater' in title.lower():
+            continue
         
-        # Movie titles are in h2 tags
-        all_headers = soup.find_all('h2')
+        # Skip if title STARTS with a day of the week (these are date headers)
+        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+        if any(title.lower().startswith(day) for day in days):
+            continue
         
-        print(f"  Found {len(all_headers)} h2 elements")
-        print(f"  DEBUG: First 10 movie titles found:")
-        for i, header in enumerate(all_headers[:10]):
-            title = header.get_text(strip=True)
-            print(f"    {i+1}. {title}")
+        # Skip common UI text
+        skip_terms = ['select', 'choose', 'tickets', 'sessions', 'showtimes', 'book now']
+        if any(term in title.lower() for term in skip_terms):
+            continue
         
-        for header in all_headers:
-            title = header.get_text(strip=True)
-            
-            if not title or len(title) < 3:
-                continue
-            
-            # Only skip the main page header, not movie titles
-            if title.lower() == 'coming soon to vidiots':
-                continue
-            
-            # Get the parent - go up just 1 level to stay in the movie card
-            parent = header.find_parent()
-            if not parent:
-                continue
-            
-            # Go up 1 more level to get full movie card
-            if parent.find_parent():
-                parent = parent.find_parent()
-            
-            section_text = parent.get_text()
-            
-            # Look for date patterns - "Sat, Jan 24" format
-            date_pattern = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})'
-            date_match = re.search(date_pattern, section_text, re.I)
-            
-            if date_match:
-                # Convert abbreviated month to full month
-                month_abbr = date_match.group(1).capitalize()
-                month_map = {
-                    'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April',
-                    'May': 'May', 'Jun': 'June', 'Jul': 'July', 'Aug': 'August',
-                    'Sep': 'September', 'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-                }
-                month_name = month_map.get(month_abbr[:3], month_abbr)
-                day = int(date_match.group(2))
-                month_num = datetime.strptime(month_name, '%B').month
-                date_str = f"{current_year}-{month_num:02d}-{day:02d}"
-                
-                # DEBUG: Show what dates we're finding
-                if day == 24 and month_num == 1:
-                    print(f"  DEBUG: Found Jan 24 event: {title}")
-            else:
-                continue
-            
-            # Look for time
-            time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))'
-            time_match = re.search(time_pattern, section_text, re.I)
-            
-            if time_match:
-                time_str = time_match.group(1).upper()
-                
-                # DEBUG: Show Jan 24 events with times
-                if day == 24 and month_num == 1:
-                    print(f"    Time found: {time_str}")
-            else:
-                if day == 24 and month_num == 1:
-                    print(f"    No time found for: {title}")
-                continue
-            
-            # Try to find the event URL - look for links with "purchase" in them
-            event_url = default_url
-            links = parent.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                # Look for purchase links or ticket links
-                if 'purchase' in href or 'ticket' in href.lower():
-                    if href.startswith('http'):
-                        event_url = href
-                    elif href.startswith('/'):
-                        event_url = f"https://vidiotsfoundation.org{href}"
-                    break
-            
-            event = {
-                "title": title,
-                "venue": venue_name,
-                "venueShort": venue_short,
-                "type": event_type,
-                "date": date_str,
-                "time": time_str,
-                "description": "",
-                "url": event_url
-            }
-            events.append(event)
-            print(f"    Found: {title} on {date_str} at {time_str}")
-        
-        print(f"✓ Successfully scraped {len(events)} events from {venue_name}")
-        return events
+        # Get surrounding text from parent container
+        parent = header.find_parent()
+        if not parent:
+            continue
         
-    except Exception as e:
-        print(f"✗ Error scraping {venue_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
-    finally:
-        if driver:
-            driver.quit()
+        cards.append((header, parent))
+    
+    return extract_cards(page, "Vista", cards, extract_vista_card)
 
 
-def scrape_academy_museum():
-    """Scrape film screenings from Academy Museum of Motion Pictures"""
+def extract_vista_card(header, parent):
+    """Extract the screening for one Vista Theater film header and its container"""
     
-    base_url = "https://www.academymuseum.org/en/calendar?locale=en&programTypes=16i3uOYQwism7sMDhIQr2O"
-    venue_name = "Academy Museum"
-    venue_short = "Academy"
+    venue_name = "The Vista Theater"
+    venue_short = "Vista"
     event_type = "film"
-    default_url = "https://www.academymuseum.org/en/calendar?programTypes=16i3uOYQwism7sMDhIQr2O"
+    default_url = "https://ticketing.uswest.veezi.com/sessions/?siteToken=20xhpa3yt2hhkwt4zjvfcwsaww"
+    current_year = datetime.now().year
+    
+    title = header.get_text(strip=True)
+    section_text = parent.get_text()
+    
+    # Look for date: "Thursday 22, January" or just "22, January"
+    date_pattern = r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)?\s*(\d{1,2}),?\s+(January|February|March|April|May|June|July|August|September|October|November|December)'
+    date_match = re.search(date_pattern, section_text, re.I)
+    
+    # Look for time: "7:15 PM"
+    time_pattern = r'(\d{1,2}:\d{2}\s*(?:am|pm))'
+    time_match = re.search(time_pattern, section_text, re.I)
+    
+    if date_match and time_match:
+        day = int(date_match.group(1))
+        month_name = date_match.group(2)
+        month_num = datetime.strptime(month_name, '%B').month
+        date_str = f"{current_year}-{month_num:02d}-{day:02d}"
+        
+        time_str = time_match.group(1).upper()
+        
+        # Try to find a link - look for <a> tags in the parent
+        event_url = default_url
+        links = parent.find_all('a', href=True)
+        for link in links:
+            href = link.get('href', '')
+            # Look for purchase links
+            if 'purchase' in href or 'siteToken' in href:
+                if href.startswith('http'):
+                    event_url = href
+                else:
+                    event_url = f"https://ticketing.uswest.veezi.com{href}"
+                break
+        
+        event = Event.from_strings(title, venue_name, venue_short, event_type, date_str, time_str,
+                                   url=event_url, poster_url=find_poster_url(parent, default_url))
+        print(f"    Found: {title} on {date_str} at {time_str}")
+        return [event]
+    
+    return []
+
+
+def fetch_new_beverly():
+    """Load the New Beverly Cinema schedule page in the browser"""
     
-    print(f"Scraping {venue_name}...")
+    url = "https://thenewbev.com/schedule/"
     
-    driver = None
+    driver = setup_driver()
     try:
-        driver = setup_driver()
+        driver.get(url)
+        time.sleep(3)
         
-        all_events = []
-        page_num = 1
-        max_pages = 10  # Safety limit
+        print(f"  Page loaded successfully")
+        yield url, driver.page_source
+    finally:
+        driver.quit()
+
+
+def parse_new_beverly(html, page):
+    """Parse film screenings from the New Beverly Cinema schedule page"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    event_cards = soup.find_all('h4')
+    
+    print(f"  Found {len(event_cards)} potential event cards")
+    
+    cards = []
+    for title_tag in event_cards:
+        title = title_tag.get_text(strip=True)
         
-        while page_num <= max_pages:
+        if not title or len(title) < 3:
+            continue
+        
+        # Only go up 2 parent levels (not 3) to stay within this movie's card
+        parent = title_tag.find_parent()
+        for _ in range(2):
+            if parent and parent.find_parent():
+                parent = parent.find_parent()
+        
+        if not parent:
+            continue
+        
+        # The title link can sit above the card, so pass its href along with it
+        link_parent = title_tag.find_parent('a', href=True)
+        link_href = link_parent.get('href', '') if link_parent else None
+        
+        cards.append((title_tag, parent, link_href))
+    
+    return extract_cards(page, "New Bev", cards, extract_new_beverly_card)
+
+
+def extract_new_beverly_card(title_tag, parent, link_href):
+    """Extract the screening for one New Beverly title and its card"""
+    
+    venue_name = "The New Beverly Theater"
+    venue_short = "New Bev"
+    event_type = "film"
+    default_url = "https://thenewbev.com/schedule/"
+    current_year = datetime.now().year
+    
+    try:
+        title = title_tag.get_text(strip=True)
+        section_text = parent.get_text()
+        
+        # Look for date pattern with day of week: "Fri, January 23"
+        date_pattern = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})'
+        date_match = re.search(date_pattern, section_text, re.I)
+        
+        if date_match:
+            month_name = date_match.group(1)
+            day = int(date_match.group(2))
+            month_num = datetime.strptime(month_name, '%B').month
+            date_str = f"{current_year}-{month_num:02d}-{day:02d}"
+        else:
+            return []
+        
+        time_pattern = r'(\d{1,2}:\d{2}\s*(?:am|pm))'
+        times = re.findall(time_pattern, section_text, re.I)
+        
+        time_defaulted = not times
+        if times:
+            time_str = times[0].upper()
+        else:
+            time_str = "7:30 PM"
+        
+        # Try to find the event URL - look for link on the title
+        event_url = default_url
+        # Check if h4 is inside an <a> tag
+        if link_href is not None:
+            href = link_href
+            if href.startswith('http'):
+                event_url = href
+            elif href.startswith('/'):
+                event_url = f"https://thenewbev.com{href}"
+        else:
+            # Look for links near the title
+            links = parent.find_all('a', href=True)
+            for link in links:
+                href = link.get('href', '')
+                if 'program' in href or 'event' in href:
+                    if href.startswith('http'):
+                        event_url = href
+                    elif href.startswith('/'):
+                        event_url = f"https://thenewbev.com{href}"
+                    break
+        
+        event = Event.from_strings(title, venue_name, venue_short, event_type, date_str, time_str,
+                                   url=event_url, time_defaulted=time_defaulted,
+                                   poster_url=find_poster_url(parent, default_url))
+        print(f"    Found: {title} on {date_str} at {time_str}")
+        return [event]
+        
+    except Exception as e:
+        return []
+
+
+def fetch_vidiots():
+    """Load the Vidiots coming soon page in the browser"""
+    
+    url = "https://vidiotsfoundation.org/coming-soon/"
+    
+    driver = setup_driver()
+    try:
+        driver.get(url)
+        time.sleep(5)
+        
+        print(f"  Page loaded successfully")
+        yield url, driver.page_source
+    finally:
+        driver.quit()
+
+
+def parse_vidiots(html, page):
+    """Parse film screenings from the Vidiots coming soon page"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Movie titles are in h2 tags
+    all_headers = soup.find_all('h2')
+    
+    print(f"  Found {len(all_headers)} h2 elements")
+    print(f"  DEBUG: First 10 movie titles found:")
+    for i, header in enumerate(all_headers[:10]):
+        title = header.get_text(strip=True)
+        print(f"    {i+1}. {title}")
+    
+    cards = []
+    for header in all_headers:
+        title = header.get_text(strip=True)
+        
+        if not title or len(title) < 3:
+            continue
+        
+        # Only skip the main page header, not movie titles
+        if title.lower() == 'coming soon to vidiots':
+            continue
+        
+        # Get the parent - go up just 1 level to stay in the movie card
+        parent = header.find_parent()
+        if not parent:
+            continue
+        
+        # Go up 1 more level to get full movie card
+        if parent.find_parent():
+            parent = parent.find_parent()
+        
+        cards.append((header, parent))
+    
+    return extract_cards(page, "Vidiots", cards, extract_vidiots_card)
+
+
+def extract_vidiots_card(header, parent):
+    """Extract the screening for one Vidiots movie card"""
+    
+    venue_name = "Vidiots"
+    venue_short = "Vidiots"
+    event_type = "film"
+    default_url = "https://vidiotsfoundation.org/coming-soon/"
+    current_year = datetime.now().year
+    
+    title = header.get_text(strip=True)
+    section_text = parent.get_text()
+    
+    # Look for date patterns - "Sat, Jan 24" format
+    date_pattern = r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[a-z]*,?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})'
+    date_match = re.search(date_pattern, section_text, re.I)
+    
+    if date_match:
+        # Convert abbreviated month to full month
+        month_abbr = date_match.group(1).capitalize()
+        month_map = {
+            'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April',
+            'May': 'May', 'Jun': 'June', 'Jul': 'July', 'Aug': 'August',
+            'Sep': 'September', 'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
+        }
+        month_name = month_map.get(month_abbr[:3], month_abbr)
+        day = int(date_match.group(2))
+        month_num = datetime.strptime(month_name, '%B').month
+        date_str = f"{current_year}-{month_num:02d}-{day:02d}"
+        
+        # DEBUG: Show what dates we're finding
+        if day == 24 and month_num == 1:
+            print(f"  DEBUG: Found Jan 24 event: {title}")
+    else:
+        return []
+    
+    # Look for time
+    time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))'
+    time_match = re.search(time_pattern, section_text, re.I)
+    
+    if time_match:
+        time_str = time_match.group(1).upper()
+        
+        # DEBUG: Show Jan 24 events with times
+        if day == 24 and month_num == 1:
+            print(f"    Time found: {time_str}")
+    else:
+        if day == 24 and month_num == 1:
+            print(f"    No time found for: {title}")
+        return []
+    
+    # Try to find the event URL - look for links with "purchase" in them
+    event_url = default_url
+    links = parent.find_all('a', href=True)
+    for link in links:
+        href = link.get('href', '')
+        # Look for purchase links or ticket links
+        if 'purchase' in href or 'ticket' in href.lower():
+            if href.startswith('http'):
+                event_url = href
+            elif href.startswith('/'):
+                event_url = f"https://vidiotsfoundation.org{href}"
+            break
+    
+    event = Event.from_strings(title, venue_name, venue_short, event_type, date_str, time_str,
+                               url=event_url, poster_url=find_poster_url(parent, default_url))
+    print(f"    Found: {title} on {date_str} at {time_str}")
+    return [event]
+
+
+SHOWTIME_CLASS_PATTERN = re.compile(r'ShowtimeText')
+PROGRAM_DETAIL_PATTERN = re.compile(r'/programs/detail/')
+
+
+def program_card(title_link, max_levels=3):
+    """The card around an Academy Museum program title link"""
+    
+    href = title_link.get('href')
+    card = title_link.parent
+    for _ in range(max_levels):
+        parent = card.parent
+        # A few links are enough to tell: the card's own come first, or another program's does
+        if parent is None or any(link.get('href') != href
+                                 for link in parent.find_all('a', href=PROGRAM_DETAIL_PATTERN, limit=4)):
+            break
+        card = parent
+    return card
+
+
+def map_showtimes_to_programs(soup, showtime_elements, max_levels=10):
+    """Map each Academy Museum showtime element (by id()) to its program title link"""
+    
+    # Every detail link registers itself with each of its ancestors
+    container_links = {}
+    for link in soup.find_all('a', href=PROGRAM_DETAIL_PATTERN):
+        for ancestor in link.parents:
+            links = container_links.setdefault(id(ancestor), [])
+            if len(links) < 2:
+                links.append(link)
+    
+    program_links = {}
+    for showtime_el in showtime_elements:
+        parent = showtime_el.parent
+        for _ in range(max_levels):
+            if parent is None:
+                break
+            links = container_links.get(id(parent))
+            if links:
+                title_link = links[1] if len(links) >= 2 else links[0]
+                if title_link.get_text(strip=True):
+                    program_links[id(showtime_el)] = title_link
+                    break
+            parent = parent.parent
+    
+    return program_links
+
+
+def fetch_academy_museum():
+    """Load each page of the Academy Museum film calendar in the browser"""
+    
+    base_url = "https://www.academymuseum.org/en/calendar?locale=en&programTypes=16i3uOYQwism7sMDhIQr2O"
+    max_pages = 10  # Safety limit
+    
+    driver = setup_driver()
+    try:
+        for page_num in range(1, max_pages + 1):
             # Build URL with page parameter
             if page_num == 1:
                 url = base_url
@@ -441,151 +1058,144 @@ def scrape_academy_museum():
             time.sleep(1)
             
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
             
-            # Find all showtime text elements (they contain "Feb 6, 2026 | 2:30pm | 4K DCP")
-            showtime_elements = soup.find_all('p', class_=lambda c: c and 'ShowtimeText' in c)
-            
-            print(f"    Found {len(showtime_elements)} showtime elements on page {page_num}")
-            
-            # If no events found, we've gone past the last page
-            if len(showtime_elements) == 0:
+            # If no showtimes are on the page, we've gone past the last page
+            if 'ShowtimeText' not in page_source:
                 print(f"  No events on page {page_num}, stopping pagination")
                 break
             
-            events_on_page = 0
-            
-            for showtime_el in showtime_elements:
-                try:
-                    showtime_text = showtime_el.get_text(strip=True)
-                    
-                    # Parse: "Feb 6, 2026 | 2:30pm | 4K DCP"
-                    match = re.match(
-                        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})\s*\|\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)',
-                        showtime_text,
-                        re.I
-                    )
-                    
-                    if not match:
-                        continue
-                    
-                    month_name = match.group(1)
-                    day = int(match.group(2))
-                    year = int(match.group(3))
-                    hour = int(match.group(4))
-                    minutes = match.group(5) or "00"
-                    period = match.group(6).upper()
-                    
-                    # Convert month name to number
-                    month_map = {
-                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-                        'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-                        'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                    }
-                    month_num = month_map.get(month_name[:3].capitalize(), 1)
-                    
-                    date_str = f"{year}-{month_num:02d}-{day:02d}"
-                    time_str = f"{hour}:{minutes} {period}"
-                    
-                    # Find the title - go up to parent container and find the SECOND title link
-                    # (first link is usually the image, second is the actual title text)
-                    parent = showtime_el.parent
-                    title = None
-                    
-                    # Go up the DOM tree looking for the event container
-                    for _ in range(10):
-                        if parent is None:
-                            break
-                        
-                        # Find ALL links to /programs/detail/ in this container
-                        title_links = parent.find_all('a', href=lambda h: h and '/programs/detail/' in h)
-                        
-                        if len(title_links) >= 2:
-                            # The second link is typically the title (first is image)
-                            title_link = title_links[1]
-                            title = title_link.get_text(strip=True)
-                            if title:
-                                break
-                        elif len(title_links) == 1:
-                            # Only one link, use it
-                            title = title_links[0].get_text(strip=True)
-                            if title:
-                                break
-                        
-                        parent = parent.parent
-                    
-                    if not title:
-                        continue
-                    
-                    # Clean up title (remove extra whitespace)
-                    title = re.sub(r'\s+', ' ', title).strip()
-                    
-                    # Fix missing space before format suffixes (e.g., "Wizard of Ozin 4K" -> "Wizard of Oz in 4K")
-                    title = re.sub(r'(\w)(in\s+(?:4K|35mm|DCP|Dolby Vision|Dolby Atmos|IMAX|70mm))', r'\1 \2', title, flags=re.I)
-                    
-                    # Skip if title looks like it grabbed too much (contains common non-title words)
-                    if any(word in title.lower() for word in ['screenings', 'in person:', 'special guest']):
-                        # Try to extract just the movie name - typically before "In person" or after certain patterns
-                        # Look for pattern like "Movie Title in 4K" or "Movie Title in 35mm"
-                        clean_match = re.match(r'^(.+?(?:\s+in\s+(?:4K|35mm|DCP))?)\s*$', title.split('In person')[0].split('Selected by')[0], re.I)
-                        if clean_match:
-                            title = clean_match.group(1).strip()
-                    
-                    event = {
-                        "title": title,
-                        "venue": venue_name,
-                        "venueShort": venue_short,
-                        "type": event_type,
-                        "date": date_str,
-                        "time": time_str,
-                        "description": "",
-                        "url": default_url
-                    }
-                    all_events.append(event)
-                    events_on_page += 1
-                    print(f"    Found: {title} on {date_str} at {time_str}")
-                    
-                except Exception as e:
-                    continue
+            if page_beyond_horizon(academy_museum_dates(page_source)):
+                print(f"  Page {page_num} starts past the {SCRAPE_HORIZON_DAYS}-day horizon, stopping pagination")
+                break
             
-            # Move to next page
-            page_num += 1
+            yield url, page_source
+    finally:
+        driver.quit()
+
+
+# "Feb 6, 2026 | 2:30pm", as in the showtime text
+ACADEMY_DATE_PATTERN = re.compile(
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})\s*\|', re.I)
+MONTH_NUMBERS = {month: number for number, month in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+
+def academy_museum_dates(text):
+    """Showtime dates ("2026-02-06") found in raw Academy Museum HTML or text"""
+    
+    for month_name, day, year in ACADEMY_DATE_PATTERN.findall(text):
+        yield f"{year}-{MONTH_NUMBERS[month_name.capitalize()]:02d}-{int(day):02d}"
+
+
+def parse_academy_museum(html, page):
+    """Parse film screenings from one Academy Museum calendar page"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Find all showtime text elements (they contain "Feb 6, 2026 | 2:30pm | 4K DCP")
+    showtime_elements = soup.find_all('p', class_=SHOWTIME_CLASS_PATTERN)
+    
+    print(f"    Found {len(showtime_elements)} showtime elements")
+    
+    # Drop showtimes past the horizon before pairing them with programs
+    showtime_elements = [
+        showtime_el for showtime_el in showtime_elements
+        if not any(skip_beyond_horizon(page, date_str)
+                   for date_str in academy_museum_dates(showtime_el.get_text(strip=True)))
+    ]
+    
+    # Pair each showtime with the program link it belongs to. The program's
+    # image sits in the card around its title link, outside both elements, so
+    # its URL is part of the card too.
+    program_links = map_showtimes_to_programs(soup, showtime_elements)
+    cards = []
+    for showtime_el in showtime_elements:
+        title_link = program_links.get(id(showtime_el))
+        if title_link is not None:
+            poster_url = find_poster_url(program_card(title_link), "https://www.academymuseum.org")
+            cards.append((showtime_el, title_link, poster_url))
+    
+    return extract_cards(page, "Academy", cards, extract_academy_museum_card)
+
+
+def extract_academy_museum_card(showtime_el, title_link, poster_url):
+    """Extract the screening for one Academy Museum showtime and its program link"""
+    
+    venue_name = "Academy Museum"
+    venue_short = "Academy"
+    event_type = "film"
+    
+    try:
+        showtime_text = showtime_el.get_text(strip=True)
+        
+        # Parse: "Feb 6, 2026 | 2:30pm | 4K DCP"
+        match = re.match(
+            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})\s*\|\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)',
+            showtime_text,
+            re.I
+        )
         
-        # Remove duplicates (same title, date, time)
-        seen = set()
-        unique_events = []
-        for event in all_events:
-            key = (event['title'], event['date'], event['time'])
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
+        if not match:
+            return []
         
-        print(f"✓ Successfully scraped {len(unique_events)} events from {venue_name}")
-        return unique_events
+        month_name = match.group(1)
+        day = int(match.group(2))
+        year = int(match.group(3))
+        hour = int(match.group(4))
+        minutes = match.group(5) or "00"
+        period = match.group(6).upper()
+        
+        # Convert month name to number
+        month_map = {
+            'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+            'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+            'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+        }
+        month_num = month_map.get(month_name[:3].capitalize(), 1)
+        
+        date_str = f"{year}-{month_num:02d}-{day:02d}"
+        time_str = f"{hour}:{minutes} {period}"
+        
+        title = title_link.get_text(strip=True)
+        href = title_link.get('href', '')
+        event_url = href if href.startswith('http') else f"https://www.academymuseum.org{href}"
+        
+        if not title:
+            return []
+        
+        # Clean up title (remove extra whitespace)
+        title = re.sub(r'\s+', ' ', title).strip()
+        
+        # Fix missing space before format suffixes (e.g., "Wizard of Ozin 4K" -> "Wizard of Oz in 4K")
+        title = re.sub(r'(\w)(in\s+(?:4K|35mm|DCP|Dolby Vision|Dolby Atmos|IMAX|70mm))', r'\1 \2', title, flags=re.I)
+        
+        # Skip if title looks like it grabbed too much (contains common non-title words)
+        if any(word in title.lower() for word in ['screenings', 'in person:', 'special guest']):
+            # Try to extract just the movie name - typically before "In person" or after certain patterns
+            # Look for pattern like "Movie Title in 4K" or "Movie Title in 35mm"
+            clean_match = re.match(r'^(.+?(?:\s+in\s+(?:4K|35mm|DCP))?)\s*$', title.split('In person')[0].split('Selected by')[0], re.I)
+            if clean_match:
+                title = clean_match.group(1).strip()
+        
+        event = Event.from_strings(title, venue_name, venue_short, event_type, date_str, time_str,
+                                   url=event_url, poster_url=poster_url)
+        print(f"    Found: {title} on {date_str} at {time_str}")
+        return [event]
         
     except Exception as e:
-        print(f"✗ Error scraping {venue_name}: {e}")
-        import traceback
-        traceback.print_exc()
         return []
-    finally:
-        if driver:
-            driver.quit()
 
 
-def scrape_american_cinematheque():
-    """Scrape film screenings from American Cinematheque - Los Feliz 3"""
+def fetch_american_cinematheque():
+    """Load each page of the Los Feliz 3 listing, clicking through the pagination"""
     
     base_url = "https://www.americancinematheque.com/now-showing/?event_location=102&view_type=list"
-    venue_name = "American Cinematheque at Los Feliz 3"
-    venue_short = "Los Feliz 3"
-    event_type = "film"
+    max_pages = 10  # Safety limit
     
-    print(f"Scraping {venue_name}...")
+    from selenium.webdriver.common.by import By
     
-    driver = None
+    driver = setup_driver()
     try:
-        driver = setup_driver()
         driver.get(base_url)
         time.sleep(6)  # Wait for JavaScript to load
         
@@ -597,232 +1207,17 @@ def scrape_american_cinematheque():
         
         print(f"  Page loaded successfully")
         
-        all_events = []
         page_num = 1
-        max_pages = 10  # Safety limit
-        
-        from selenium.webdriver.common.by import By
         
         while page_num <= max_pages:
             print(f"  Scraping page {page_num}...")
             
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            events_found_on_page = 0
-            processed_events = set()
-            
-            # Find all "View Event Details" links - these mark event cards
-            view_details_links = soup.find_all('a', string=lambda t: t and 'view event' in t.lower())
-            
-            # Also try finding links that contain the event URL pattern
-            if not view_details_links:
-                view_details_links = soup.find_all('a', href=lambda h: h and '/now-showing/' in h and '?' not in h and h != '/now-showing/')
-            
-            print(f"    Found {len(view_details_links)} event links on page {page_num}")
-            
-            for link in view_details_links:
-                try:
-                    href = link.get('href', '')
-                    
-                    # Skip navigation links
-                    if not href or href == '/now-showing/' or 'event_location=' in href:
-                        continue
-                    
-                    # Build full URL
-                    event_url = href if href.startswith('http') else f"https://www.americancinematheque.com{href}"
-                    
-                    # Skip if we've already processed this URL
-                    if event_url in processed_events:
-                        continue
-                    processed_events.add(event_url)
-                    
-                    # Debug: print the URL being processed
-                    print(f"      Processing URL: {href}")
-                    
-                    # Find the parent container (the event card)
-                    parent = link.parent
-                    card_container = None
-                    
-                    # Go up the DOM to find the card container
-                    for _ in range(10):
-                        if parent is None:
-                            break
-                        
-                        # Check if this container has a heading (title) and date info
-                        has_heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                        has_date = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', parent.get_text())
-                        
-                        if has_heading and has_date:
-                            card_container = parent
-                            break
-                        
-                        parent = parent.parent
-                    
-                    if not card_container:
-                        continue
-                    
-                    # Get ONLY this card's text for date/time parsing
-                    container_text = card_container.get_text(separator=' ', strip=True)
-                    
-                    # Find the title from a heading element
-                    title = None
-                    for heading in card_container.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
-                        heading_text = heading.get_text(strip=True)
-                        # Skip if it's a date or time or "View Event Details"
-                        if heading_text and len(heading_text) > 2:
-                            if not re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d)', heading_text):
-                                continue
-                            if 'view event' in heading_text.lower():
-                                continue
-                            # This looks like a title
-                            title = heading_text
-                            break
-                    
-                    # If no heading found, try to extract title from the URL
-                    if not title:
-                        # URL like /now-showing/twin-peaks-season-1-ep-5-2-10-26-630pm/
-                        url_match = re.search(r'/now-showing/([^/]+)/?$', href)
-                        if url_match:
-                            # Convert slug to title
-                            slug = url_match.group(1)
-                            # Remove date/time suffix - matches patterns like:
-                            # -2-10-26-630pm, -2-12-26-700pm, -12-25-26-1pm, etc.
-                            slug = re.sub(r'-\d{1,2}-\d{1,2}-\d{2,4}-\d{1,4}(?:am|pm)?$', '', slug, flags=re.I)
-                            # Also try simpler pattern without time
-                            slug = re.sub(r'-\d{1,2}-\d{1,2}-\d{2,4}$', '', slug, flags=re.I)
-                            # Convert dashes to spaces and title case
-                            title = slug.replace('-', ' ').title()
-                            # Fix common abbreviations
-                            title = re.sub(r'\bEp\b', 'Ep.', title)
-                    
-                    if not title:
-                        continue
-                    
-                    # Parse date and time FROM THE URL first (most reliable)
-                    # URL formats:
-                    # - With time: /now-showing/twin-peaks-season-1-ep-5-2-10-26-630pm/
-                    # - Without time: /now-showing/in-order-of-disappearance-2-13-26/
-                    date_str = None
-                    time_str = None
-                    
-                    # Try matching URL with time first
-                    url_date_match = re.search(r'-(\d{1,2})-(\d{1,2})-(\d{2,4})-(\d{1,4})(am|pm)/?$', href, re.I)
-                    if url_date_match:
-                        month = int(url_date_match.group(1))
-                        day = int(url_date_match.group(2))
-                        year = int(url_date_match.group(3))
-                        if year < 100:
-                            year += 2000  # Convert 26 to 2026
-                        
-                        time_num = url_date_match.group(4)
-                        period = url_date_match.group(5).upper()
-                        
-                        # Parse time: 630 -> 6:30, 1000 -> 10:00, 1 -> 1:00
-                        if len(time_num) <= 2:
-                            hour = int(time_num)
-                            minutes = "00"
-                        elif len(time_num) == 3:
-                            hour = int(time_num[0])
-                            minutes = time_num[1:3]
-                        else:
-                            hour = int(time_num[:-2])
-                            minutes = time_num[-2:]
-                        
-                        date_str = f"{year}-{month:02d}-{day:02d}"
-                        time_str = f"{hour}:{minutes} {period}"
-                    else:
-                        # Try matching URL without time (e.g., -2-13-26/)
-                        url_date_match = re.search(r'-(\d{1,2})-(\d{1,2})-(\d{2,4})/?$', href)
-                        if url_date_match:
-                            month = int(url_date_match.group(1))
-                            day = int(url_date_match.group(2))
-                            year = int(url_date_match.group(3))
-                            if year < 100:
-                                year += 2000
-                            date_str = f"{year}-{month:02d}-{day:02d}"
-                            # Time will be parsed from container text below
-                    
-                    if date_str:
-                        print(f"        URL date parsed: {date_str}" + (f" at {time_str}" if time_str else " (no time in URL)"))
-                    else:
-                        print(f"        URL date NOT matched for: {href}")
-                    
-                    # Parse time from container text if not found in URL
-                    if not time_str:
-                        time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', container_text)
-                        if time_match:
-                            hour = int(time_match.group(1))
-                            minutes = time_match.group(2)
-                            period = time_match.group(3).upper()
-                            time_str = f"{hour}:{minutes} {period}"
-                        else:
-                            time_str = "7:30 PM"  # Default
-                    
-                    # Fallback to parsing date from container text if URL parsing failed
-                    if not date_str:
-                        print(f"        Falling back to container text parsing")
-                        date_patterns = [
-                            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
-                            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
-                            r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\w*\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2})',
-                            r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})(?:st|nd|rd|th)?',
-                        ]
-                        
-                        for pattern in date_patterns:
-                            date_match = re.search(pattern, container_text, re.I)
-                            if date_match:
-                                groups = date_match.groups()
-                                month_name = groups[0][:3].capitalize()
-                                day = int(groups[1])
-                                year = int(groups[2]) if len(groups) > 2 and groups[2] else datetime.now().year
-                                
-                                month_map = {
-                                    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-                                    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-                                    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                                }
-                                month_num = month_map.get(month_name, 1)
-                                date_str = f"{year}-{month_num:02d}-{day:02d}"
-                                break
-                    
-                    if not date_str:
-                        continue
-                    
-                    # Parse time from container if not already set from URL
-                    if not time_str:
-                        time_str = "7:30 PM"  # Default
-                        time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', container_text)
-                        if time_match:
-                            hour = int(time_match.group(1))
-                            minutes = time_match.group(2)
-                            period = time_match.group(3).upper()
-                            time_str = f"{hour}:{minutes} {period}"
-                    
-                    # Create unique key to avoid duplicates
-                    event_key = (title, date_str, time_str)
-                    if event_key in processed_events:
-                        continue
-                    processed_events.add(event_key)
-                    
-                    event = {
-                        "title": title,
-                        "venue": venue_name,
-                        "venueShort": venue_short,
-                        "type": event_type,
-                        "date": date_str,
-                        "time": time_str,
-                        "description": "",
-                        "url": event_url
-                    }
-                    all_events.append(event)
-                    events_found_on_page += 1
-                    print(f"    Found: {title} on {date_str} at {time_str}")
-                    
-                except Exception as e:
-                    continue
+            if page_beyond_horizon(american_cinematheque_dates(page_source)):
+                print(f"  Page {page_num} starts past the {SCRAPE_HORIZON_DAYS}-day horizon, stopping pagination")
+                break
             
-            print(f"    Events found on page {page_num}: {events_found_on_page}")
+            yield f"{base_url}&page={page_num}", page_source
             
             # Try to find and click the next page number
             try:
@@ -863,137 +1258,2350 @@ def scrape_american_cinematheque():
             except Exception as e:
                 print(f"  Pagination error: {e}")
                 break
-        
-        # Remove duplicates (same title, date, time)
-        seen = set()
-        unique_events = []
-        for event in all_events:
-            key = (event['title'], event['date'], event['time'])
-            if key not in seen:
-                seen.add(key)
-                unique_events.append(event)
-        
-        print(f"✓ Successfully scraped {len(unique_events)} events from {venue_name}")
-        return unique_events
-        
-    except Exception as e:
-        print(f"✗ Error scraping {venue_name}: {e}")
-        import traceback
-        traceback.print_exc()
-        return []
     finally:
-        if driver:
-            driver.quit()
+        driver.quit()
+
 
+# Event links end in the date, e.g. /now-showing/thief-2-13-26/ or
+# /now-showing/twin-peaks-season-1-ep-5-2-10-26-630pm/
+CINEMATHEQUE_URL_DATE_PATTERN = re.compile(r'-(\d{1,2})-(\d{1,2})-(\d{2,4})(?:-\d{1,4}(?:am|pm))?/?$', re.I)
+CINEMATHEQUE_PAGE_DATE_PATTERN = re.compile(
+    r'/now-showing/[\w-]+?-(\d{1,2})-(\d{1,2})-(\d{2,4})(?:-\d{1,4}(?:am|pm))?/?["\']', re.I)
 
-def scrape_all_venues():
-    """Scrape all venues and combine events"""
+
+def cinematheque_date(month, day, year):
+    """Date string for the month, day and (maybe 2-digit) year of an event URL"""
     
-    print("=" * 60)
-    print("Starting LA Events Calendar Scraper v10")
-    print("=" * 60)
-    print()
+    year = int(year)
+    if year < 100:
+        year += 2000
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def american_cinematheque_dates(html):
+    """Event dates ("2026-02-13") found in the links of raw Los Feliz 3 HTML"""
     
-    all_events = []
+    for month, day, year in CINEMATHEQUE_PAGE_DATE_PATTERN.findall(html):
+        yield cinematheque_date(month, day, year)
+
+
+def parse_american_cinematheque(html, page):
+    """Parse film screenings from one page of the Los Feliz 3 listing"""
     
-    # Vista Theater, New Beverly, Vidiots, Academy Museum, and American Cinematheque
-    venues = [
-        scrape_vista_theater,
-        scrape_new_beverly,
-        scrape_vidiots,
-        scrape_academy_museum,
-        scrape_american_cinematheque
-    ]
+    soup = BeautifulSoup(html, 'html.parser')
+    processed_events = set()
     
-    for scraper in venues:
-        events = scraper()
-        all_events.extend(events)
-        print()
-        time.sleep(2)
+    # Find all "View Event Details" links - these mark event cards
+    view_details_links = soup.find_all('a', string=lambda t: t and 'view event' in t.lower())
     
-    # Filter out past events - use Pacific Time and check if event has already happened
-    from datetime import timezone, timedelta
-    pst = timezone(timedelta(hours=-8))
-    now_pst = datetime.now(pst)
-    today = now_pst.date()
-    current_time_minutes = now_pst.hour * 60 + now_pst.minute
+    # Also try finding links that contain the event URL pattern
+    if not view_details_links:
+        view_details_links = soup.find_all('a', href=lambda h: h and '/now-showing/' in h and '?' not in h and h != '/now-showing/')
     
-    future_events = []
-    past_events_count = 0
+    print(f"    Found {len(view_details_links)} event links")
     
-    for event in all_events:
+    cards = []
+    for link in view_details_links:
         try:
-            event_date = datetime.strptime(event['date'], '%Y-%m-%d').date()
-            
-            # If event is in the future (tomorrow or later), include it
-            if event_date > today:
-                future_events.append(event)
-            # If event is today, check if it hasn't happened yet
-            elif event_date == today:
-                # Parse event time to check if it's in the future
-                time_match = re.match(r'(\d{1,2}):(\d{2})\s*(AM|PM)', event['time'], re.I)
-                if time_match:
-                    hours = int(time_match.group(1))
-                    minutes = int(time_match.group(2))
-                    period = time_match.group(3).upper()
-                    
-                    # Convert to 24-hour format
-                    if period == 'PM' and hours != 12:
-                        hours += 12
-                    elif period == 'AM' and hours == 12:
-                        hours = 0
-                    
-                    event_time_minutes = hours * 60 + minutes
-                    
-                    # Only include if event hasn't started yet (with 30-minute buffer)
-                    if event_time_minutes > current_time_minutes - 30:
-                        future_events.append(event)
-                    else:
-                        past_events_count += 1
-                else:
-                    # If we can't parse the time, include it to be safe
-                    future_events.append(event)
-            else:
-                # Event was yesterday or earlier
-                past_events_count += 1
-        except:
-            # If we can't parse the date, include it to be safe
-            future_events.append(event)
-    
-    if past_events_count > 0:
+            href = link.get('href', '')
+            
+            # Skip navigation links
+            if not href or href == '/now-showing/' or 'event_location=' in href:
+                continue
+            
+            # Build full URL
+            event_url = href if href.startswith('http') else f"https://www.americancinematheque.com{href}"
+            
+            # Skip if we've already processed this URL
+            if event_url in processed_events:
+                continue
+            processed_events.add(event_url)
+            
+            # Skip events past the horizon before looking for their card
+            url_date_match = CINEMATHEQUE_URL_DATE_PATTERN.search(href)
+            if url_date_match and skip_beyond_horizon(page, cinematheque_date(*url_date_match.groups())):
+                continue
+            
+            # Debug: print the URL being processed
+            print(f"      Processing URL: {href}")
+            
+            # Find the parent container (the event card)
+            parent = link.parent
+            card_container = None
+            
+            # Go up the DOM to find the card container
+            for _ in range(10):
+                if parent is None:
+                    break
+                
+                # Check if this container has a heading (title) and date info
+                has_heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5'])
+                has_date = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', parent.get_text())
+                
+                if has_heading and has_date:
+                    card_container = parent
+                    break
+                
+                parent = parent.parent
+            
+            if not card_container:
+                continue
+            
+            cards.append((href, card_container))
+            
+        except Exception as e:
+            continue
+    
+    return extract_cards(page, "Los Feliz 3", cards, extract_american_cinematheque_card)
+
+
+def extract_american_cinematheque_card(href, card_container):
+    """Extract the screening for one Los Feliz 3 event link and its card"""
+    
+    venue_name = "American Cinematheque at Los Feliz 3"
+    venue_short = "Los Feliz 3"
+    event_type = "film"
+    
+    try:
+        event_url = href if href.startswith('http') else f"https://www.americancinematheque.com{href}"
+        
+        # Get ONLY this card's text for date/time parsing
+        container_text = card_container.get_text(separator=' ', strip=True)
+        
+        # Find the title from a heading element
+        title = None
+        for heading in card_container.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
+            heading_text = heading.get_text(strip=True)
+            # Skip if it's a date or time or "View Event Details"
+            if heading_text and len(heading_text) > 2:
+                if not re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|\d)', heading_text):
+                    continue
+                if 'view event' in heading_text.lower():
+                    continue
+                # This looks like a title
+                title = heading_text
+                break
+        
+        # If no heading found, try to extract title from the URL
+        if not title:
+            # URL like /now-showing/twin-peaks-season-1-ep-5-2-10-26-630pm/
+            url_match = re.search(r'/now-showing/([^/]+)/?$', href)
+            if url_match:
+                # Convert slug to title
+                slug = url_match.group(1)
+                # Remove date/time suffix - matches patterns like:
+                # -2-10-26-630pm, -2-12-26-700pm, -12-25-26-1pm, etc.
+                slug = re.sub(r'-\d{1,2}-\d{1,2}-\d{2,4}-\d{1,4}(?:am|pm)?$', '', slug, flags=re.I)
+                # Also try simpler pattern without time
+                slug = re.sub(r'-\d{1,2}-\d{1,2}-\d{2,4}$', '', slug, flags=re.I)
+                # Convert dashes to spaces and title case
+                title = slug.replace('-', ' ').title()
+                # Fix common abbreviations
+                title = re.sub(r'\bEp\b', 'Ep.', title)
+        
+        if not title:
+            return []
+        
+        # Parse date and time FROM THE URL first (most reliable)
+        # URL formats:
+        # - With time: /now-showing/twin-peaks-season-1-ep-5-2-10-26-630pm/
+        # - Without time: /now-showing/in-order-of-disappearance-2-13-26/
+        date_str = None
+        time_str = None
+        time_defaulted = False
+        
+        # Try matching URL with time first
+        url_date_match = re.search(r'-(\d{1,2})-(\d{1,2})-(\d{2,4})-(\d{1,4})(am|pm)/?$', href, re.I)
+        if url_date_match:
+            month = int(url_date_match.group(1))
+            day = int(url_date_match.group(2))
+            year = int(url_date_match.group(3))
+            if year < 100:
+                year += 2000  # Convert 26 to 2026
+            
+            time_num = url_date_match.group(4)
+            period = url_date_match.group(5).upper()
+            
+            # Parse time: 630 -> 6:30, 1000 -> 10:00, 1 -> 1:00
+            if len(time_num) <= 2:
+                hour = int(time_num)
+                minutes = "00"
+            elif len(time_num) == 3:
+                hour = int(time_num[0])
+                minutes = time_num[1:3]
+            else:
+                hour = int(time_num[:-2])
+                minutes = time_num[-2:]
+            
+            date_str = f"{year}-{month:02d}-{day:02d}"
+            time_str = f"{hour}:{minutes} {period}"
+        else:
+            # Try matching URL without time (e.g., -2-13-26/)
+            url_date_match = re.search(r'-(\d{1,2})-(\d{1,2})-(\d{2,4})/?$', href)
+            if url_date_match:
+                month = int(url_date_match.group(1))
+                day = int(url_date_match.group(2))
+                year = int(url_date_match.group(3))
+                if year < 100:
+                    year += 2000
+                date_str = f"{year}-{month:02d}-{day:02d}"
+                # Time will be parsed from container text below
+        
+        if date_str:
+            print(f"        URL date parsed: {date_str}" + (f" at {time_str}" if time_str else " (no time in URL)"))
+        else:
+            print(f"        URL date NOT matched for: {href}")
+        
+        # Parse time from container text if not found in URL
+        if not time_str:
+            time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', container_text)
+            if time_match:
+                hour = int(time_match.group(1))
+                minutes = time_match.group(2)
+                period = time_match.group(3).upper()
+                time_str = f"{hour}:{minutes} {period}"
+            else:
+                time_str = "7:30 PM"  # Default
+                time_defaulted = True
+        
+        # Fallback to parsing date from container text if URL parsing failed
+        if not date_str:
+            print(f"        Falling back to container text parsing")
+            date_patterns = [
+                r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
+                r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
+                r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\w*\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(\d{1,2})',
+                r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})(?:st|nd|rd|th)?',
+            ]
+            
+            for pattern in date_patterns:
+                date_match = re.search(pattern, container_text, re.I)
+                if date_match:
+                    groups = date_match.groups()
+                    month_name = groups[0][:3].capitalize()
+                    day = int(groups[1])
+                    year = int(groups[2]) if len(groups) > 2 and groups[2] else datetime.now().year
+                    
+                    month_map = {
+                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+                        'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+                        'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+                    }
+                    month_num = month_map.get(month_name, 1)
+                    date_str = f"{year}-{month_num:02d}-{day:02d}"
+                    break
+        
+        if not date_str:
+            return []
+        
+        # Parse time from container if not already set from URL
+        if not time_str:
+            time_str = "7:30 PM"  # Default
+            time_match = re.search(r'(\d{1,2}):(\d{2})\s*(am|pm|AM|PM)', container_text)
+            if time_match:
+                hour = int(time_match.group(1))
+                minutes = time_match.group(2)
+                period = time_match.group(3).upper()
+                time_str = f"{hour}:{minutes} {period}"
+        
+        event = Event.from_strings(title, venue_name, venue_short, event_type, date_str, time_str,
+                                   url=event_url, time_defaulted=time_defaulted,
+                                   poster_url=find_poster_url(card_container, event_url))
+        print(f"    Found: {title} on {date_str} at {time_str}")
+        return [event]
+        
+        
+    except Exception as e:
+        return []
+
+
+# Vista Theater, New Beverly, Vidiots, Academy Museum, and American Cinematheque
+# Each venue has a fetch stage (browser I/O, yields (page_url, html)) and a
+# pure parse stage (html -> events) that runs in the parse process pool
+VENUES = [
+    {"name": "The Vista Theater", "short": "Vista",
+     "fetch": fetch_vista_theater, "parse": parse_vista_theater},
+    {"name": "The New Beverly Theater", "short": "New Bev",
+     "fetch": fetch_new_beverly, "parse": parse_new_beverly},
+    {"name": "Vidiots", "short": "Vidiots",
+     "fetch": fetch_vidiots, "parse": parse_vidiots},
+    {"name": "Academy Museum", "short": "Academy",
+     "fetch": fetch_academy_museum, "parse": parse_academy_museum},
+    {"name": "American Cinematheque at Los Feliz 3", "short": "Los Feliz 3",
+     "fetch": fetch_american_cinematheque, "parse": parse_american_cinematheque},
+]
+
+PARSE_WORKERS = 2       # Processes parsing pages while the browser loads the next ones
+PAGE_QUEUE_SIZE = 4     # Fetched pages allowed to wait for a parse worker
+
+
+def fetch_pages(venues, page_queue):
+    """Fetch stage: load every venue's pages and put the raw HTML on the queue"""
+    
+    for venue in venues:
+        print(f"Scraping {venue['name']}...")
+        ok = True
+        try:
+            for page_url, html in venue['fetch']():
+                page_queue.put((venue, page_url, html))
+        except Exception as e:
+            print(f"✗ Error scraping {venue['name']}: {e}")
+            ok = False
+        page_queue.put((venue, None, ok))
+        time.sleep(2)
+    
+    page_queue.put(None)
+
+
+class PipelineRun:
+    """State the stages of one run share, passed to each stage with the events"""
+    
+    def __init__(self, http_cache=None):
+        self.scrape_status = {}
+        self.identity_index = None
+        self.output_sizes = {}
+        self._http_cache = http_cache
+    
+    @property
+    def http_cache(self):
+        if self._http_cache is None:
+            self._http_cache = HttpCache()
+        return self._http_cache
+    
+    def close(self):
+        """Save and report the HTTP cache, if the run used it"""
+        
+        if self._http_cache is not None:
+            self._http_cache.save()
+            self._http_cache.report()
+
+
+def scrape_venues(venues, run):
+    """Run the fetch and parse stages side by side and yield (venue, events)"""
+    
+    page_queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+    fetcher = threading.Thread(target=fetch_pages, args=(venues, page_queue), daemon=True)
+    
+    cards = load_card_cache()
+    pages = load_page_cache()
+    page_stats = {}   # venue short name -> [hits, pages]
+    today = datetime.now().strftime('%Y-%m-%d')
+    horizon = horizon_date()
+    end = horizon_end()
+    
+    # Spawn (rather than fork) the workers, since the fetch thread is running
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=context,
+                             initializer=init_parse_worker, initargs=(cards,)) as pool:
+        fetcher.start()
+        
+        pending = []     # (page_key, content_hash, future) in page order
+        in_flight = []   # futures not yet known to be done
+        
+        while True:
+            # Backpressure: wait for a parse slot before taking the next page
+            in_flight = [f for f in in_flight if not f.done()]
+            if len(in_flight) >= PARSE_WORKERS * 2:
+                wait(in_flight, return_when=FIRST_COMPLETED)
+                continue
+            
+            item = page_queue.get()
+            if item is None:
+                break
+            
+            venue, page_url, html = item
+            stats = page_stats.setdefault(venue['short'], [0, 0])
+            
+            if page_url is None:
+                # Venue finished fetching: collect its parsed pages
+                run.scrape_status[venue['short']] = html
+                events = []
+                for page_key, content_hash, future in pending:
+                    try:
+                        page_events, card_updates, truncated = future.result()
+                        events.extend(page_events)
+                        for key, card_events in card_updates.items():
+                            cards[key] = {"events": card_events, "seen": today}
+                        pages[page_key] = {"hash": content_hash, "seen": today,
+                                           "events": [event.to_record() for event in page_events]}
+                        if truncated:
+                            # Only valid while the horizon doesn't move past this one
+                            pages[page_key]["horizon"] = horizon
+
+                    except Exception as e:
+                        print(f"✗ Error parsing {venue['name']}: {e}")
+                        run.scrape_status[venue['short']] = False
+                pending = []
+                
+                if stats[1]:
+                    print(f"  Page cache: {stats[0]} of {stats[1]} pages unchanged")
+                print(f"✓ Successfully scraped {len(events)} events from {venue['name']}")
+                print()
+                yield venue, events
+                continue
+            
+            stats[1] += 1
+            page_key = f"{venue['short']}|{page_url}"
+            content_hash = page_hash(html)
+            cached = pages.get(page_key)
+            
+            if (cached is not None and cached['hash'] == content_hash
+                    and cached.get('horizon', horizon) >= horizon):
+                # Identical page: reuse last run's events without parsing
+                stats[0] += 1
+                cached['seen'] = today
+                page_events = [Event.from_record(record) for record in cached['events']]
+                upcoming = [event for event in page_events if event.start < end]
+                future = Future()
+                future.set_result((upcoming, {}, 'horizon' in cached or len(upcoming) < len(page_events)))
+            else:
+                future = pool.submit(parse_page, venue['parse'], html)
+                in_flight.append(future)
+            pending.append((page_key, content_hash, future))
+        
+        fetcher.join()
+    
+    save_card_cache(cards)
+    save_page_cache(pages)
+    
+    if page_stats:
+        print("Page cache hit rate by venue:")
+        for venue_short, (hits, total) in page_stats.items():
+            rate = f"{hits / total:.0%}" if total else "n/a"
+            print(f"  {venue_short}: {hits}/{total} ({rate})")
+        print()
+
+
+def iter_scraped_events(venues, run):
+    """Source stage: stream events from each venue as soon as it finishes"""
+    
+    for venue, events in scrape_venues(venues, run):
+        yield from events
+
+
+def normalize_events(events, run):
+    """Collapse whitespace in titles and drop events without one"""
+    
+    for event in events:
+        title = re.sub(r'\s+', ' ', event.title).strip()
+        if not title:
+            continue
+        event.title = title
+        yield event
+
+
+def earliest_upcoming_start():
+    """The earliest start an event can have and still be listed"""
+    
+    now = datetime.now(VENUE_TIMEZONE)
+    today_start = int(now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+    return max(today_start, int(now.timestamp()) - 30 * 60 + 1)
+
+
+def filter_past_events(events, run):
+    """Drop events that have already started (with a 30-minute buffer)"""
+    
+    earliest = earliest_upcoming_start()
+    
+    past_events_count = 0
+    for event in events:
+        if event.start >= earliest:
+            yield event
+        else:
+            past_events_count += 1
+    
+    if past_events_count > 0:
         print(f"Filtered out {past_events_count} past events")
+
+
+def dedupe_events(events, run):
+    """Remove duplicates (same event ID, i.e. same venue, start and title)"""
+    
+    seen = set()
+    duplicates_count = 0
+    
+    for event in events:
+        if event.id not in seen:
+            seen.add(event.id)
+            yield event
+        else:
+            duplicates_count += 1
+    
+    if duplicates_count > 0:
+        print(f"Removed {duplicates_count} duplicate events")
+
+
+IDENTITY_INDEX_FILE = os.path.join(CACHE_DIR, 'identity_index.json')
+IDENTITY_INDEX_MAX_AGE_DAYS = 90   # Forget events not seen for this long
+
+
+class IdentityIndex:
+    """Persistent index from event ID to the last record seen for it"""
+    
+    def __init__(self, filename=IDENTITY_INDEX_FILE):
+        self.filename = filename
+        self.new_ids = set()
+        self.updated_ids = set()
+        self.seen_ids = set()
+        self.today = datetime.now().strftime('%Y-%m-%d')
+        
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def observe(self, event):
+        """Record an event and return its status: new, updated or unchanged"""
+        
+        record = event.to_dict()
+        entry = self.entries.get(event.id)
+        self.seen_ids.add(event.id)
+        
+        if entry is None:
+            self.entries[event.id] = {"record": record, "first_seen": self.today, "last_seen": self.today}
+            self.new_ids.add(event.id)
+            return "new"
+        
+        entry['last_seen'] = self.today
+        if entry['record'] != record:
+            entry['record'] = record
+            self.updated_ids.add(event.id)
+            return "updated"
+        return "unchanged"
+    
+    def changed(self, event_id):
+        """True if the event is new or updated in this run"""
+        
+        return event_id in self.new_ids or event_id in self.updated_ids
+    
+    def save(self):
+        cutoff = (datetime.now() - timedelta(days=IDENTITY_INDEX_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+        entries = {key: entry for key, entry in self.entries.items() if entry['last_seen'] >= cutoff}
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"✗ Error saving identity index: {e}")
+
+
+def index_events(events, run):
+    """Record every event in the run's identity index, passing them through"""
+    
+    index = run.identity_index = IdentityIndex()
+    
+    for event in events:
+        index.observe(event)
+        yield event
+    
+    index.save()
+    unchanged = len(index.seen_ids) - len(index.new_ids) - len(index.updated_ids)
+    print(f"Identity index: {len(index.new_ids)} new, {len(index.updated_ids)} updated, {unchanged} unchanged events")
+
+
+# Presentation formats and other suffixes that don't change which film it is
+FILM_FORMAT_PATTERN = r'(?:4k(?:\s+restoration)?|35\s?mm|70\s?mm|16\s?mm|dcp|imax|dolby\s+(?:vision|atmos)|3-?d)'
+# "Wizard of Ozin 4K": a format whose "in" lost its space, or just "Berlin 4K"
+FILM_GLUED_FORMAT_PATTERN = re.compile(rf'(\w)in(\s+{FILM_FORMAT_PATTERN})\b')
+FILM_ARTICLES = {'the', 'a', 'an'}
+FILM_MATCH_THRESHOLD = 0.8      # Minimum trigram similarity to merge two titles
+FILM_BLOCK_MAX_SIZE = 50        # Ignore tokens shared by more titles than this
+
+
+def film_key(title, keys=()):
+    """Reduce a screening title to a key for the film it shows"""
+    
+    key = title.lower()
+    if keys:
+        unglued = FILM_GLUED_FORMAT_PATTERN.sub(r'\1 in\2', key)
+        if unglued != key and film_key(unglued) in keys:
+            return film_key(unglued)
+    key = re.sub(rf'\s*[\(\[-]?\s*(?:\b(?:in|on)\s+)?\b{FILM_FORMAT_PATTERN}\b\s*[\)\]]?', ' ', key)
+    key = normalize_title(key)
+    
+    words = key.split()
+    if len(words) > 1 and words[0] in FILM_ARTICLES:
+        words = words[1:]
+    return ' '.join(words)
+
+
+def sequel_markers(key):
+    """Numbers and roman numerals in a key ("Part 2", "III", "Ep. 5")"""
+    
+    return {word for word in key.split() if word.isdigit() or re.fullmatch(r'[ivx]{2,4}', word)}
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def cluster_films(titles):
+    """Group title variants into films and return {title: film_id}"""
+    
+    plain_keys = {film_key(title) for title in titles}
+    title_keys = {title: film_key(title, plain_keys) for title in titles}
+    keys = sorted(set(title_keys.values()) - {''})
+    grams = {key: trigrams(key) for key in keys}
+    parent = {key: key for key in keys}
+    
+    def find(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+    
+    blocks = {}
+    for key in keys:
+        for word in set(key.split()):
+            blocks.setdefault(word, []).append(key)
+    
+    compared = set()
+    for block in blocks.values():
+        if len(block) < 2 or len(block) > FILM_BLOCK_MAX_SIZE:
+            continue
+        for i, key in enumerate(block):
+            for other in block[i + 1:]:
+                if (key, other) in compared:
+                    continue
+                compared.add((key, other))
+                # Sequels and episodes differ by little more than a number
+                if sequel_markers(key) != sequel_markers(other):
+                    continue
+                similarity = len(grams[key] & grams[other]) / len(grams[key] | grams[other])
+                if similarity >= FILM_MATCH_THRESHOLD:
+                    root, other_root = find(key), find(other)
+                    if root != other_root:
+                        # Keep the alphabetically first key as the root so IDs are stable
+                        parent[max(root, other_root)] = min(root, other_root)
+    
+    film_ids = {}
+    for title in titles:
+        key = title_keys[title]
+        root = find(key) if key else normalize_title(title)
+        film_ids[title] = hashlib.sha1(root.encode('utf-8')).hexdigest()[:12]
+    return film_ids
+
+
+def cluster_events(events, run):
+    """Give each event the film ID shared by every screening of the same film"""
+    
+    events = list(events)
+    film_ids = cluster_films({event.title for event in events})
+    
+    venues_by_film = {}
+    for event in events:
+        event.film_id = film_ids[event.title]
+        venues_by_film.setdefault(event.film_id, set()).add(event.venue_short)
+    
+    shared = sum(1 for venues in venues_by_film.values() if len(venues) > 1)
+    print(f"Clustered {len(events)} screenings into {len(venues_by_film)} films "
+          f"({shared} playing at more than one venue)")
+    
+    yield from events
+
+
+ENRICHMENT_CACHE_FILE = os.path.join(CACHE_DIR, 'enrichment.json')
+ENRICHMENT_CACHE_VERSION = 3    # Bump when parse_detail_page changes
+
+# Runtimes like "104 min", "104 minutes" or "1 hr 44 min", "1h 44m"
+RUNTIME_MINUTES_PATTERN = re.compile(r'\b(\d{2,3})\s*(?:min|mins|minutes)\b', re.I)
+RUNTIME_HOURS_PATTERN = re.compile(r'\b(\d)\s*(?:h|hr|hrs|hours?)\.?\s*(\d{1,2})\s*(?:m|min|mins|minutes)\b', re.I)
+RUNTIME_LABEL_PATTERN = re.compile(r'\b(?:run\s?time|running time|length)\b', re.I)
+DETAIL_FORMAT_PATTERN = re.compile(r'\b(70\s?mm|35\s?mm|16\s?mm|4K|DCP|IMAX)\b', re.I)
+DETAIL_YEAR_PATTERN = re.compile(r'\b(?:18|19|20)\d{2}\b')
+# Site chrome around a detail page's own content
+DETAIL_BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form']
+DETAIL_BLOCK_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'dt', 'dd', 'td', 'div', 'section']
+DETAIL_TITLE_BLOCKS = 4         # Blocks from the title on that count as next to it
+DETAIL_SHORT_BLOCK = 40         # ... and how long one may be to give a runtime (not a sentence)
+
+
+def detail_blocks(body):
+    """Text of each block element in body that has no block elements inside it, in page order"""
+    
+    blocks = []
+    for element in body.find_all(DETAIL_BLOCK_TAGS):
+        if element.find(DETAIL_BLOCK_TAGS) is None:
+            text = element.get_text(' ', strip=True)
+            if text:
+                blocks.append((element.name, text))
+    return blocks
+
+
+def parse_detail_page(html, url):
+    """Extract description, runtime, format and canonical URL from an event's detail page"""
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    canonical = soup.find('link', rel='canonical') or soup.find('meta', property='og:url')
+    canonical_url = (canonical.get('href') or canonical.get('content') or '') if canonical else ''
+    
+    image = soup.find('meta', property='og:image')
+    poster_url = urljoin(url, image['content']) if image and image.get('content') else ''
+    
+    meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', property='og:description')
+    meta_description = meta.get('content', '') if meta else ''
+    
+    body = soup.find('main') or soup.find('article') or soup.find(attrs={'role': 'main'}) or soup.body or soup
+    for element in body(DETAIL_BOILERPLATE_TAGS):
+        element.decompose()
+    blocks = detail_blocks(body)
+    
+    credits = [text for _, text in blocks
+               if DETAIL_YEAR_PATTERN.search(text)
+               and (RUNTIME_MINUTES_PATTERN.search(text) or RUNTIME_HOURS_PATTERN.search(text)
+                    or DETAIL_FORMAT_PATTERN.search(text))]
+    title_index = next((index for index, (name, _) in enumerate(blocks) if name == 'h1'), None)
+    near_title = ([text for _, text in blocks[title_index:title_index + DETAIL_TITLE_BLOCKS]]
+                  if title_index is not None else [])
+    labelled = [text for _, text in blocks if RUNTIME_LABEL_PATTERN.search(text)]
+    short_near_title = [text for text in near_title if len(text) <= DETAIL_SHORT_BLOCK]
+    
+    runtime = None
+    for text in credits + short_near_title + labelled:
+        hours_match = RUNTIME_HOURS_PATTERN.search(text)
+        minutes_match = RUNTIME_MINUTES_PATTERN.search(text)
+        if hours_match:
+            runtime = int(hours_match.group(1)) * 60 + int(hours_match.group(2))
+        elif minutes_match:
+            runtime = int(minutes_match.group(1))
+        if runtime is not None:
+            break
+    
+    film_format = ''
+    for text in credits + near_title:
+        format_match = DETAIL_FORMAT_PATTERN.search(text)
+        if format_match:
+            film_format = re.sub(r'\s', '', format_match.group(1))
+            film_format = film_format.lower() if film_format.lower().endswith('mm') else film_format.upper()
+            break
+    
+    # First paragraph of real prose in the content, else the meta description
+    description = next((text for name, text in blocks if name == 'p' and len(text) >= 80), '')
+    from_meta = not description and bool(meta_description)
+    
+    return {
+        "description": re.sub(r'\s+', ' ', description or meta_description).strip(),
+        "description_from_meta": from_meta,
+        "runtime": runtime,
+        "format": film_format,
+        "url": urljoin(url, canonical_url) if canonical_url else url,
+        "poster_url": poster_url,
+    }
+
+
+class DetailFetcher:
+    """Fetches detail pages for the enrich stage through a HostPool"""
+    
+    def __init__(self, http_cache):
+        self.http_cache = http_cache
+        self.pool = HostPool()
+        self.lock = threading.Lock()
+        self.driver = None
+        self.driver_lock = threading.Lock()
+        self.browser_failed = False
+        self.stats = {"http": 0, "browser": 0, "failed": 0}
+    
+    def submit(self, url):
+        """Start fetching and parsing url; returns a Future of parse_detail_page's dict"""
+        
+        return self.pool.submit(url, self._fetch)
+    
+    def _fetch(self, url):
+        try:
+            response = self.http_cache.get(url)
+            if response.status == 200:
+                details = parse_detail_page(response.content.decode('utf-8', errors='replace'), url)
+                if details['description'] or details['runtime']:
+                    self._count("http")
+                    return details
+        except requests.RequestException:
+            pass
+        
+        try:
+            details = parse_detail_page(self._browser_get(url), url)
+            self._count("browser")
+            return details
+        except Exception as e:
+            print(f"    ✗ Could not load {url}: {e}")
+            self._count("failed")
+            return None
+    
+    def _browser_get(self, url):
+        with self.driver_lock:
+            if self.driver is None:
+                if self.browser_failed:
+                    raise RuntimeError("browser unavailable")
+                try:
+                    self.driver = setup_driver()
+                except Exception:
+                    self.browser_failed = True
+                    raise
+            self.driver.get(url)
+            time.sleep(3)  # Wait for JavaScript to load
+            return self.driver.page_source
+    
+    def _count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+    
+    def close(self):
+        self.pool.shutdown()
+        if self.driver is not None:
+            self.driver.quit()
+
+
+def load_enrichment_cache():
+    """Load the enrichment cache: {event ID: {"details", "seen"}}"""
+    
+    try:
+        with open(ENRICHMENT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get('version') != ENRICHMENT_CACHE_VERSION:
+        return {}
+    return drop_stale_entries(cache.get('events', {}))
+
+
+def save_enrichment_cache(entries):
+    """Save the enrichment cache to disk"""
+    
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(ENRICHMENT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": ENRICHMENT_CACHE_VERSION, "events": entries}, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"✗ Error saving enrichment cache: {e}")
+
+
+def apply_details(event, details, site_descriptions=frozenset()):
+    """Copy a detail page's fields onto an event, except a site-wide meta description"""
+    
+    description = details['description']
+    if details.get('description_from_meta') and description in site_descriptions:
+        description = ''
+    if description and not event.description:
+        event.description = description
+    event.runtime = details['runtime']
+    event.format = details['format']
+    event.url = details['url']
+    if details['poster_url'] and not event.poster_url:
+        event.poster_url = details['poster_url']
+
+
+def site_descriptions(details_by_film):
+    """Meta descriptions that detail pages of more than one film share (a site's generic one)"""
+    
+    films_by_description = {}
+    for film, details in details_by_film:
+        if details.get('description_from_meta') and details['description']:
+            films_by_description.setdefault(details['description'], set()).add(film)
+    return {description for description, films in films_by_description.items() if len(films) > 1}
+
+
+def enrich_events(events, run):
+    """Fill in description, runtime, format and canonical URL from detail pages"""
+    
+    events = list(events)
+    cache = load_enrichment_cache()
+    index = run.identity_index
+    today = datetime.now().strftime('%Y-%m-%d')
+    
+    films_by_url = {}
+    for event in events:
+        if event.url:
+            films_by_url.setdefault(event.url, set()).add(event.film_id or event.title)
+    
+    details_by_event = []   # (event, details) to apply once every page is in
+    to_fetch = {}   # url -> events waiting for it
+    reused = 0
+    for event in events:
+        cached = cache.get(event.id)
+        if cached is not None and not (index is not None and index.changed(event.id)):
+            cached['seen'] = today
+            details_by_event.append((event, cached['details']))
+            reused += 1
+        elif event.url and len(films_by_url[event.url]) == 1:
+            to_fetch.setdefault(event.url, []).append(event)
+    
+    if to_fetch:
+        fetcher = DetailFetcher(run.http_cache)
+        try:
+            futures = {url: fetcher.submit(url) for url in to_fetch}
+            for url, future in futures.items():
+                details = future.result()
+                if details is None:
+                    continue
+                for event in to_fetch[url]:
+                    cache[event.id] = {"details": details, "seen": today}
+                    details_by_event.append((event, details))
+        finally:
+            fetcher.close()
+        stats = fetcher.stats
+        print(f"Enriched from {len(to_fetch)} detail pages "
+              f"({stats['http']} over HTTP, {stats['browser']} in the browser, {stats['failed']} failed)")
+    
+    generic = site_descriptions((event.film_id or event.title, details) for event, details in details_by_event)
+    for event, details in details_by_event:
+        apply_details(event, details, generic)
+    
+    print(f"Enrichment cache: reused details for {reused} of {len(events)} events")
+    save_enrichment_cache(cache)
+    yield from events
+
+
+POSTER_DIR = 'posters'          # Committed, so the page can serve the thumbnails
+POSTER_INDEX_FILE = os.path.join(POSTER_DIR, 'index.json')
+POSTER_SIZES = [(160, 240), (320, 480)]   # Thumbnails are cropped to 2:3 at each size
+POSTER_MAX_AGE_DAYS = 90        # Drop posters of films not listed for this long
+POSTER_SEEN_REFRESH_DAYS = 30   # Only move an entry's "seen" date once it's this old
+
+
+def make_thumbnails(content, digest):
+    """Write WebP and JPEG thumbnails of an image at each of POSTER_SIZES"""
+    
+    image = Image.open(io.BytesIO(content)).convert('RGB')
+    for width, height in POSTER_SIZES:
+        thumbnail = None
+        for extension, image_format, options in (('webp', 'WEBP', {"quality": 80}),
+                                                 ('jpg', 'JPEG', {"quality": 82, "optimize": True,
+                                                                  "progressive": True})):
+            path = os.path.join(POSTER_DIR, f"{digest}-{width}.{extension}")
+            if os.path.exists(path):
+                continue
+            if thumbnail is None:
+                thumbnail = ImageOps.fit(image, (width, height), Image.LANCZOS)
+            thumbnail.save(path, image_format, **options)
+
+
+def download_poster(http_cache, url):
+    """Fetch a poster image and write its thumbnails; returns its content hash"""
+    
+    response = http_cache.get(url)
+    if response.status != 200:
+        raise ValueError(f"HTTP {response.status}")
+    digest = hashlib.sha1(response.content).hexdigest()[:16]
+    make_thumbnails(response.content, digest)
+    return digest
+
+
+def load_poster_index():
+    """Load the poster index: {image URL: {"hash", "seen"}}"""
+    
+    try:
+        with open(POSTER_INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_poster_index(index):
+    """Save the poster index, dropping stale entries and thumbnails no entry uses"""
+    
+    cutoff = (datetime.now() - timedelta(days=POSTER_MAX_AGE_DAYS)).strftime('%Y-%m-%d')
+    stale = {url: entry for url, entry in index.items() if entry['seen'] < cutoff}
+    for url in stale:
+        del index[url]
+    
+    in_use = {entry['hash'] for entry in index.values()}
+    for digest in {entry['hash'] for entry in stale.values()} - in_use:
+        for width, _ in POSTER_SIZES:
+            for extension in ('webp', 'jpg'):
+                try:
+                    os.remove(os.path.join(POSTER_DIR, f"{digest}-{width}.{extension}"))
+                except OSError:
+                    pass
+    
+    try:
+        with open(POSTER_INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+    except Exception as e:
+        print(f"✗ Error saving poster index: {e}")
+
+
+def fetch_posters(events, run):
+    """Give each film a local poster thumbnail, downloading new images once"""
+    
+    events = list(events)
+    os.makedirs(POSTER_DIR, exist_ok=True)
+    if Image is None:
+        print("Pillow is not installed, skipping posters")
+        yield from events
+        return
+    
+    index = load_poster_index()
+    today = datetime.now().strftime('%Y-%m-%d')
+    
+    film_posters = {}
+    for event in events:
+        if event.poster_url:
+            film_posters.setdefault(event.film_id or event.id, event.poster_url)
+    
+    to_fetch = set(film_posters.values()) - index.keys()
+    failed = 0
+    if to_fetch:
+        pool = HostPool()
+        http_cache = run.http_cache
+        try:
+            futures = {url: pool.submit(url, lambda url: download_poster(http_cache, url)) for url in to_fetch}
+            for url, future in futures.items():
+                try:
+                    index[url] = {"hash": future.result(), "seen": today}
+                except Exception as e:
+                    print(f"    ✗ Could not load poster {url}: {e}")
+                    failed += 1
+        finally:
+            pool.shutdown()
+    
+    # Moving "seen" only when it's getting old keeps the committed index from
+    # changing on every run
+    refresh = (datetime.now() - timedelta(days=POSTER_SEEN_REFRESH_DAYS)).strftime('%Y-%m-%d')
+    for event in events:
+        entry = index.get(film_posters.get(event.film_id or event.id))
+        if entry is not None:
+            if entry['seen'] < refresh:
+                entry['seen'] = today
+            event.poster = f"{POSTER_DIR}/{entry['hash']}"
+    
+    save_poster_index(index)
+    print(f"Posters: {len(film_posters)} films, {len(to_fetch) - failed} new images, {failed} failed")
+    yield from events
+
+
+def event_order(event):
+    """Sort key for events.json: start, then venue, then title"""
+    
+    return (event.start, event.venue, event.title)
+
+
+def sort_events(events, run):
+    """Order events by start, then venue, then title"""
+    
+    yield from sorted(events, key=event_order)
+
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+
+def iter_json_records(filename, chunk_size=JSON_CHUNK_SIZE):
+    """Yield the items of a JSON array file (or the values of an NDJSON file) one at a time"""
+    
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        array = None   # True for a JSON array, False for NDJSON, None before the first value
+        while True:
+            # Skip whitespace (and, in an array, the commas between items), reading more as needed
+            separators = ' \t\r\n,' if array else ' \t\r\n'
+            while position < len(buffer) and buffer[position] in separators:
+                position += 1
+            if position == len(buffer):
+                buffer, position = f.read(chunk_size), 0
+                if not buffer:
+                    if array:
+                        raise ValueError(f"{filename}: unterminated JSON array")
+                    return
+                continue
+            
+            if array is None:
+                array = buffer[position] == '['
+                if array:
+                    position += 1
+                    continue
+            if array and buffer[position] == ']':
+                return
+            
+            # Decode the next value, reading more while it runs past the buffer
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    end = None
+                # Done unless the value runs to the end of the buffer, or is a number
+                # cut short by it ("-7." decodes as -7 but may be "-7.5e3")
+                if end is not None and end < len(buffer) and buffer[end] not in '0123456789.eE+-':
+                    break
+                chunk = f.read(chunk_size)
+                if chunk:
+                    buffer, position = buffer[position:] + chunk, 0
+                    continue
+                if end is None:
+                    raise ValueError(f"{filename}: invalid JSON at the end of the file")
+                break
+            yield value
+            position = end
+
+
+def iter_event_records(filename='events.json'):
+    """The records of an existing events.json, one at a time (none if there is no readable file)"""
+    
+    try:
+        yield from iter_json_records(filename)
+    except OSError:
+        return
+    except ValueError as e:
+        print(f"✗ Could not read {e}")
+
+
+def diff_events(previous_records, current_records):
+    """Compare a run's events.json records with the previous ones and return the changes.json dict"""
+    
+    earliest = earliest_upcoming_start()
+    previous = {}   # ID -> (venue short name, normalized title, start, record digest)
+    expired = []
+    invalid = []
+    for record in previous_records:
+        try:
+            event = Event.from_dict(record)
+        except (KeyError, ValueError):
+            invalid.append(record)   # Not a listing we could have produced (e.g. "All Day")
+            continue
+        event_id = record.get('id') or event.id
+        if event.start >= earliest:
+            previous[event_id] = (event.venue_short, normalize_title(event.title), event.start,
+                                  canonical_hash([record]))
+        else:
+            expired.append(event_id)
+    
+    counts = {}
+    
+    def count(venue_short, kind):
+        venue_counts = counts.setdefault(venue_short, {"added": 0, "removed": 0, "rescheduled": 0,
+                                                       "retitled": 0, "modified": 0})
+        venue_counts[kind] += 1
+    
+    # Same ID, different record; what's left of previous afterwards was removed
+    added = []
+    modified = []
+    for record in current_records:
+        entry = previous.pop(record['id'], None)
+        if entry is None:
+            added.append(record)
+        elif entry[3] != canonical_hash([record]):
+            modified.append({"id": record['id'], "record": record})
+            count(record['venueShort'], "modified")
+    removed = previous
+    
+    # Same venue and title at a new time
+    by_title = {}
+    for event_id, (venue_short, title, start, _) in removed.items():
+        by_title.setdefault((venue_short, title), []).append(event_id)
+    rescheduled = []
+    unmatched = []
+    for record in added:
+        candidates = by_title.get((record['venueShort'], normalize_title(record['title'])))
+        if candidates:
+            old_id = candidates.pop()
+            del removed[old_id]
+            rescheduled.append({"id": record['id'], "previousId": old_id, "date": record['date'],
+                                "time": record['time'], "start": record['start'], "record": record})
+            count(record['venueShort'], "rescheduled")
+        else:
+            unmatched.append(record)
+    
+    # Same venue and start under a new title
+    by_start = {}
+    for event_id, (venue_short, title, start, _) in removed.items():
+        by_start.setdefault((venue_short, start), []).append(event_id)
+    retitled = []
+    added = []
+    for record in unmatched:
+        candidates = by_start.get((record['venueShort'], record['start']))
+        if candidates:
+            old_id = candidates.pop()
+            del removed[old_id]
+            retitled.append({"id": record['id'], "previousId": old_id, "title": record['title'],
+                             "record": record})
+            count(record['venueShort'], "retitled")
+        else:
+            added.append(record)
+            count(record['venueShort'], "added")
+    
+    for venue_short, title, start, _ in removed.values():
+        count(venue_short, "removed")
+    removed = list(removed)
+    for record in invalid:
+        removed.append(record.get('id'))
+        count(record.get('venueShort'), "removed")
+    
+    return {
+        "generated": datetime.now(VENUE_TIMEZONE).isoformat(timespec='seconds'),
+        "counts": counts,
+        "added": added,
+        "removed": removed,
+        "rescheduled": rescheduled,
+        "retitled": retitled,
+        "modified": modified,
+        "expired": expired,
+    }
+
+
+def record_order(record):
+    """event_order for an events.json record"""
     
-    # Remove duplicates (same title, venue, date, and time)
-    unique_events = []
-    seen = set()
-    duplicates_count = 0
+    return (record.get('start', 0), record.get('venue', ''), record.get('title', ''))
+
+
+def apply_changes(previous_records, changes):
+    """Rebuild the new events.json records from the previous ones and a change feed"""
+    
+    dropped = set(changes["removed"]) | set(changes["expired"])
+    dropped.update(entry["previousId"] for entry in changes["rescheduled"] + changes["retitled"])
+    replaced = {entry["id"]: entry["record"] for entry in changes["modified"]}
+    inserted = changes["added"] + [entry["record"] for entry in changes["rescheduled"] + changes["retitled"]]
+    
+    kept = (replaced.get(record.get('id'), record) for record in previous_records
+            if record.get('id') not in dropped)
+    yield from heapq.merge(kept, sorted(inserted, key=record_order), key=record_order)
+
+
+def save_changes(changes, filename='changes.json', sizes=None):
+    """Write the change feed compactly (it's meant to be fetched often)"""
+    
+    try:
+        write_output(changes, filename, sizes, **COMPACT_JSON_OPTIONS)
+        kinds = ('added', 'removed', 'rescheduled', 'retitled', 'modified')
+        summary = ", ".join(f"{len(changes[kind])} {kind}" for kind in kinds)
+        print(f"✓ Changes saved to {filename}: {summary}")
+    except Exception as e:
+        print(f"✗ Error saving changes: {e}")
+
+
+def merge_previous_events(events, previous_records, scrape_status):
+    """Add the previous run's events for venues this run didn't scrape completely"""
+    
+    earliest = earliest_upcoming_start()
+    ids = {event.id for event in events}
+    kept = {}
+    
+    merged = list(events)
+    for record in previous_records:
+        venue_short = record.get('venueShort')
+        if scrape_status.get(venue_short):
+            continue
+        try:
+            event = Event.from_dict(record)
+        except (KeyError, ValueError):
+            continue
+        if event.start >= earliest and event.id not in ids:
+            ids.add(event.id)
+            merged.append(event)
+            kept[venue_short] = kept.get(venue_short, 0) + 1
+    
+    for venue_short, count in kept.items():
+        print(f"Kept {count} previous events for {venue_short} (not rescraped)")
+    return sorted(merged, key=event_order)
+
+
+def canonical_hash(records):
+    """Hash of event records that ignores formatting and key order"""
+    
+    digest = hashlib.sha1(b'[')
+    for index, record in enumerate(records):
+        if index:
+            digest.update(b',')
+        digest.update(json.dumps(record, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+    digest.update(b']')
+    return digest.hexdigest()
+
+
+# How .min.json copies are written; outputs already written this way don't get one
+COMPACT_JSON_OPTIONS = {"separators": (',', ':'), "ensure_ascii": False}
+
+
+def minified_name(filename):
+    """events.json -> events.min.json"""
+    
+    return re.sub(r'\.json$', '.min.json', filename)
+
+
+class JsonArrayWriter:
+    """Writes a JSON array to a file one item at a time"""
+    
+    def __init__(self, f, indent=None, level=0, **options):
+        self.f = f
+        self.encoder = json.JSONEncoder(indent=indent, **options)
+        self.pad = '' if indent is None else '\n' + ' ' * indent * (level + 1)
+        self.end = ']' if indent is None else '\n' + ' ' * indent * level + ']'
+        self.count = 0
+    
+    def write(self, record):
+        text = self.encoder.encode(record)
+        if self.pad:
+            text = self.pad + text.replace('\n', self.pad)
+        self.f.write(self.encoder.item_separator + text if self.count else '[' + text)
+        self.count += 1
+    
+    def close(self):
+        self.f.write(self.end if self.count else '[]')
+
+
+class JsonObjectWriter:
+    """Writes a JSON object to a file one member at a time (same text as json.dump)"""
+    
+    def __init__(self, f, indent=None, **options):
+        self.f = f
+        self.indent = indent
+        self.options = options
+        self.encoder = json.JSONEncoder(indent=indent, **options)
+        self.pad = '' if indent is None else '\n' + ' ' * indent
+        self.count = 0
+    
+    def _key(self, key):
+        start = self.encoder.item_separator if self.count else '{'
+        self.f.write(start + self.pad + self.encoder.encode(key) + self.encoder.key_separator)
+        self.count += 1
     
-    for event in future_events:
-        # Create a unique key for each event
-        key = (event['title'], event['venue'], event['date'], event['time'])
-        if key not in seen:
-            seen.add(key)
-            unique_events.append(event)
+    def write(self, key, value):
+        self._key(key)
+        text = self.encoder.encode(value)
+        self.f.write(text.replace('\n', self.pad) if self.pad else text)
+    
+    def array(self, key):
+        self._key(key)
+        return JsonArrayWriter(self.f, indent=self.indent, level=1, **self.options)
+    
+    def close(self):
+        if not self.count:
+            self.f.write('{}')
         else:
-            duplicates_count += 1
+            self.f.write(self.pad[:1] + '}')
+
+
+def write_json_streams(data, outputs):
+    """Write data to each (file, options) in outputs in one pass over it"""
     
-    if duplicates_count > 0:
-        print(f"Removed {duplicates_count} duplicate events")
+    if not isinstance(data, dict):
+        arrays = [JsonArrayWriter(f, **options) for f, options in outputs]
+        for item in data:
+            for array in arrays:
+                array.write(item)
+        for array in arrays:
+            array.close()
+        return
+    
+    objects = [JsonObjectWriter(f, **options) for f, options in outputs]
+    for key, value in data.items():
+        if isinstance(value, (list, Iterator)):
+            arrays = [members.array(key) for members in objects]
+            for item in value:
+                for array in arrays:
+                    array.write(item)
+            for array in arrays:
+                array.close()
+        else:
+            for members in objects:
+                members.write(key, value)
+    for members in objects:
+        members.close()
+
+
+def write_output(data, filename, sizes=None, **options):
+    """Write a published JSON file plus a .min.json copy unless it's already compact, recording sizes in sizes"""
+    
+    files = output_files(filename, options)
+    handles = [open(f"{name}.tmp", 'w', encoding='utf-8') for name in files]
+    try:
+        write_json_streams(data, list(zip(handles, [options, COMPACT_JSON_OPTIONS])))
+        for f in handles:
+            f.flush()
+            os.fsync(f.fileno())
+    finally:
+        for f in handles:
+            f.close()
+    for name in files:
+        os.replace(f"{name}.tmp", name)
+    
+    # Drop siblings this file no longer gets, e.g. the .gz/.br earlier runs wrote
+    remove_output(filename, keep=files)
+    if sizes is not None:
+        sizes[filename] = dict(zip(("pretty", "min") if len(files) > 1 else ("min",),
+                                   (os.path.getsize(name) for name in files)))
+
+
+def output_files(filename, options):
+    """The files write_output(data, filename, **options) writes"""
+    
+    if options.get('indent') is None and options.get('separators') == COMPACT_JSON_OPTIONS['separators']:
+        return [filename]
+    return [filename, minified_name(filename)]
+
+
+def output_exists(filename, **options):
+    """True if the files write_output(data, filename, **options) writes are all there"""
+    
+    return all(os.path.exists(name) for name in output_files(filename, options))
+
+
+def remove_output(filename, keep=()):
+    """Delete filename and its write_output siblings, except those in keep"""
+    
+    minified = minified_name(filename)
+    for sibling in (filename, minified, f"{minified}.gz", f"{minified}.br"):
+        if sibling in keep:
+            continue
+        try:
+            os.remove(sibling)
+        except OSError:
+            pass
+
+
+def report_output_sizes(output_sizes):
+    """Print the sizes of the files written this run (totals for event partitions)"""
+    
+    if not output_sizes:
+        return
+    
+    def row(label, sizes, count=1):
+        columns = [f"{sizes[kind] / 1024:7.1f} KB {kind}" for kind in ('pretty', 'min') if kind in sizes]
+        suffix = f" ({count} files)" if count > 1 else ""
+        print(f"  {label + suffix:32} " + "  ".join(columns))
+    
+    print("Output sizes:")
+    partitions = {}
+    for filename, sizes in output_sizes.items():
+        if filename.startswith(f"{SHARD_DIR}/") and filename != MANIFEST_FILE:
+            for kind, size in sizes.items():
+                partitions[kind] = partitions.get(kind, 0) + size
+            partitions.setdefault("files", 0)
+            partitions["files"] += 1
+        else:
+            row(filename, sizes)
+    if partitions:
+        row(f"{SHARD_DIR}/*.json", partitions, partitions["files"])
+
+
+SHARD_DIR = 'events'
+MANIFEST_FILE = f"{SHARD_DIR}/manifest.json"
+MANIFEST_VERSION = 2   # 2: partitions are in the compact encoding
+
+
+def venue_slug(venue_short):
+    """File-name-safe form of a venue short name ("Los Feliz 3" -> "los-feliz-3")"""
+    
+    return re.sub(r'[^a-z0-9]+', '-', venue_short.lower()).strip('-')
+
+
+def load_manifest():
+    """Load events/manifest.json, or an empty manifest if there is none"""
+    
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION}
+    
+    if manifest.get('version') != MANIFEST_VERSION:
+        manifest = {kind: {name: {"file": entry['file']} for name, entry in entries.items()}
+                    for kind, entries in manifest.items() if isinstance(entries, dict)}
+        manifest['version'] = MANIFEST_VERSION
+    return manifest
+
+
+def write_partitions(kind, records, partition_file, manifest, sizes=None):
+    """Split records, grouped by partition, into files by partition_file(record) listed in manifest[kind]"""
+    
+    previous = manifest.get(kind, {})
+    entries = {}
+    written = 0
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    
+    def flush(name, filename, partition):
+        nonlocal written
+        if name in entries:
+            raise ValueError(f"{kind} partition {name} isn't contiguous")
+        content_hash = canonical_hash(partition)
+        if (previous.get(name, {}).get('hash') != content_hash
+                or not output_exists(filename, **COMPACT_JSON_OPTIONS)):
+            write_output(encode_compact(partition), filename, sizes, **COMPACT_JSON_OPTIONS)
+            written += 1
+        entries[name] = {"file": filename, "hash": content_hash, "count": len(partition),
+                         "first": partition[0]['date'], "last": partition[-1]['date']}
+    
+    current = None
+    partition = []
+    for record in records:
+        key = partition_file(record)
+        if key != current and partition:
+            flush(*current, partition)
+            partition = []
+        current = key
+        partition.append(record)
+    if partition:
+        flush(*current, partition)
+    
+    for name, entry in previous.items():
+        if name not in entries:
+            remove_output(entry['file'])
+    
+    manifest[kind] = entries
+    print(f"✓ {SHARD_DIR}/ by {kind[:-1]}: {written} of {len(entries)} files rewritten")
+
+
+def week_partition(record):
+    """events/2026-W07.json, one file per ISO week (Monday to Sunday, local time)"""
+    
+    year, week, _ = local_time(record['start']).isocalendar()
+    name = f"{year}-W{week:02d}"
+    return name, f"{SHARD_DIR}/{name}.json"
+
+
+def write_manifest(manifest, previous_manifest, sizes=None):
+    """Write events/manifest.json if it changed"""
+    
+    if manifest == previous_manifest and output_exists(MANIFEST_FILE):
+        return
+    try:
+        write_output(manifest, MANIFEST_FILE, sizes, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"✗ Error saving manifest: {e}")
+
+
+FEED_DIR = 'feeds'
+FEED_ALL_FILE = f"{FEED_DIR}/all.ics"
+FEED_DEFAULT_MINUTES = 120   # length of events without a known runtime
+CNAME_FILE = 'CNAME'
+FEED_TIMEZONE = """BEGIN:VTIMEZONE
+TZID:America/Los_Angeles
+X-LIC-LOCATION:America/Los_Angeles
+BEGIN:DAYLIGHT
+TZOFFSETFROM:-0800
+TZOFFSETTO:-0700
+TZNAME:PDT
+DTSTART:19700308T020000
+RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU
+END:DAYLIGHT
+BEGIN:STANDARD
+TZOFFSETFROM:-0700
+TZOFFSETTO:-0800
+TZNAME:PST
+DTSTART:19701101T020000
+RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU
+END:STANDARD
+END:VTIMEZONE""".splitlines()
+
+
+def feed_domain():
+    """The site's domain (from CNAME), which makes event UIDs globally unique"""
+    
+    try:
+        with open(CNAME_FILE, 'r', encoding='utf-8') as f:
+            return f.read().strip() or 'la-events-calendar'
+    except OSError:
+        return 'la-events-calendar'
+
+
+def ics_text(value):
+    """Escape a TEXT property value (RFC 5545 3.3.11)"""
+    
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def ics_line(line):
+    """A content line folded to 75 octets, without splitting UTF-8 characters, ending in CRLF"""
+    
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    limit = 75
+    current = ''
+    size = 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > limit:
+            parts.append(current)
+            current, size, limit = '', 0, 74   # continuation lines start with a space
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def ics_event_lines(record, domain, stamp):
+    """The VEVENT content lines of an events.json record"""
+    
+    description = record['description']
+    if record['format']:
+        description = f"{record['format']}\n\n{description}" if description else record['format']
+    
+    lines = ["BEGIN:VEVENT",
+             f"UID:{record['id']}@{domain}",
+             f"DTSTAMP:{stamp}"]
+    if record.get('timeDefaulted'):
+        # No listed showtime: an all-day event rather than the placeholder time
+        day = local_time(record['start']).date()
+        lines += [f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                  f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}"]
+        description = f"Time TBA\n\n{description}" if description else "Time TBA"
+    else:
+        minutes = record['runtime'] or FEED_DEFAULT_MINUTES
+        lines += [f"DTSTART;TZID=America/Los_Angeles:{local_time(record['start']):%Y%m%dT%H%M%S}",
+                  f"DTEND;TZID=America/Los_Angeles:{local_time(record['start'] + minutes * 60):%Y%m%dT%H%M%S}"]
+    lines += [f"SUMMARY:{ics_text(record['title'])}",
+             f"LOCATION:{ics_text(record['venue'])}",
+             f"CATEGORIES:{ics_text(record['type'])}"]
+    if description:
+        lines.append(f"DESCRIPTION:{ics_text(description)}")
+    if record['url']:
+        lines.append(f"URL:{record['url']}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def write_feed(filename, name, records, domain):
+    """Stream an iCalendar file of events.json records to filename, replacing it atomically"""
+    
+    stamp = datetime.now(ZoneInfo('UTC')).strftime('%Y%m%dT%H%M%SZ')
+    header = ["BEGIN:VCALENDAR",
+              "VERSION:2.0",
+              "PRODID:-//LA Events Calendar//scraper_v10//EN",
+              "CALSCALE:GREGORIAN",
+              "METHOD:PUBLISH",
+              f"X-WR-CALNAME:{ics_text(name)}",
+              "X-WR-TIMEZONE:America/Los_Angeles",
+              "REFRESH-INTERVAL;VALUE=DURATION:PT12H",
+              "X-PUBLISHED-TTL:PT12H"] + FEED_TIMEZONE
+    
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, 'w', encoding='utf-8', newline='') as f:
+        f.writelines(ics_line(line) for line in header)
+        for record in records:
+            f.writelines(ics_line(line) for line in ics_event_lines(record, domain, stamp))
+        f.write(ics_line("END:VCALENDAR"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_filename, filename)
+
+
+def write_feeds(venue_records, all_records, manifest):
+    """Write feeds/<venue>.ics for each venue and feeds/all.ics, listing them in manifest["feeds"]"""
+    
+    domain = feed_domain()
+    os.makedirs(FEED_DIR, exist_ok=True)
+    previous = manifest.get('feeds', {})
+    entries = {}
+    written = 0
+    for venue_short, records in itertools.groupby(venue_records, key=lambda record: record['venueShort']):
+        records = list(records)
+        filename = f"{FEED_DIR}/{venue_slug(venue_short)}.ics"
+        content_hash = canonical_hash(records)
+        entries[venue_short] = {"file": filename, "hash": content_hash, "count": len(records)}
+        if previous.get(venue_short, {}).get('hash') == content_hash and os.path.exists(filename):
+            continue
+        write_feed(filename, f"LA Events: {records[0]['venue']}", records, domain)
+        written += 1
+    
+    for venue_short, entry in previous.items():
+        if venue_short not in entries:
+            try:
+                os.remove(entry['file'])
+            except OSError:
+                pass
+    
+    if written or set(previous) != set(entries) or not os.path.exists(FEED_ALL_FILE):
+        write_feed(FEED_ALL_FILE, "LA Events", all_records, domain)
+        written += 1
+    manifest['feeds'] = entries
+    print(f"✓ {FEED_DIR}/: {written} of {len(entries) + 1} calendars rewritten")
+
+
+COMPACT_FILE = 'events.compact.json'
+COMPACT_VERSION = 2   # 2 added timeDefaulted; version 1 rows are version 2 rows without it
+COMPACT_FIELDS = ["id", "title", "venue", "type", "startDelta", "date", "minute",
+                  "urlPrefix", "urlPath", "urlQuery", "description", "runtime", "format", "timeDefaulted"]
+COMPACT_DEFAULTS = ["", None, "", 0]   # description, runtime, format, timeDefaulted: dropped from the end of rows
+COMPACT_TITLE_DEFAULTS = [None, None]   # filmId, poster: dropped from the end of title entries
+
+
+def trim_defaults(row, defaults):
+    """Drop trailing values of row that equal their defaults (the last len(defaults) fields)"""
+    
+    offset = len(row) - len(defaults)
+    while len(row) > offset and row[-1] == defaults[len(row) - 1 - offset]:
+        row.pop()
+    return row
+
+
+def split_url(url):
+    """Split a URL into (prefix, path, query) for the compact encoding"""
+    
+    base, question, query = url.partition('?')
+    cut = base.rstrip('/').rfind('/') + 1
+    return base[:cut], base[cut:], question + query
+
+
+def encode_compact(records):
+    """The compact events.compact.json encoding of events.json records (in order)"""
+    
+    tables = {name: [] for name in ("venues", "types", "titles", "urlPrefixes", "urlQueries", "dates")}
+    codes = {name: {} for name in tables}
+    
+    def code(table, value, entry=None):
+        index = codes[table].get(value)
+        if index is None:
+            index = codes[table][value] = len(tables[table])
+            tables[table].append(value if entry is None else entry)
+        return index
+    
+    def rows():
+        previous_start = 0
+        for record in records:
+            wall = local_time(record['start'])
+            prefix, path, query = split_url(record['url'])
+            title = (record['title'], record['filmId'], record['poster'])
+            venue = (record['venue'], record['venueShort'])
+            yield trim_defaults([
+                record['id'],
+                code("titles", title, trim_defaults(list(title), COMPACT_TITLE_DEFAULTS)),
+                code("venues", venue, list(venue)),
+                code("types", record['type']),
+                (record['start'] - previous_start) // 60,
+                code("dates", record['date']),
+                wall.hour * 60 + wall.minute,
+                code("urlPrefixes", prefix),
+                path,
+                code("urlQueries", query),
+                record['description'],
+                record['runtime'],
+                record['format'],
+                int(record.get('timeDefaulted', False)),
+            ], COMPACT_DEFAULTS)
+            previous_start = record['start']
+    
+    data = {"format": "la-events-compact", "version": COMPACT_VERSION, "fields": COMPACT_FIELDS, "events": rows()}
+    data.update(tables)
+    return data
+
+
+def decode_compact(data):
+    """events.json records from the compact encoding (see encode_compact)"""
+    
+    if data.get("format") != "la-events-compact" or data.get("version") not in (1, COMPACT_VERSION):
+        raise ValueError("Unsupported compact events format")
+    
+    records = []
+    start = 0
+    for row in data["events"]:
+        padded = row + COMPACT_DEFAULTS[len(row) + len(COMPACT_DEFAULTS) - len(COMPACT_FIELDS):]
+        (event_id, title, venue, event_type, start_delta, date, minute,
+         url_prefix, url_path, url_query, description, runtime, film_format, time_defaulted) = padded
+        start += start_delta * 60
+        entry = data["titles"][title]
+        title, film_id, poster = entry + COMPACT_TITLE_DEFAULTS[len(entry) - 1:]
+        venue, venue_short = data["venues"][venue]
+        hour = minute // 60
+        record = {
+            "id": event_id,
+            "title": title,
+            "venue": venue,
+            "venueShort": venue_short,
+            "type": data["types"][event_type],
+            "date": data["dates"][date],
+            "time": f"{hour % 12 or 12}:{minute % 60:02d} {'AM' if hour < 12 else 'PM'}",
+            "start": start,
+            "description": description,
+            "url": data["urlPrefixes"][url_prefix] + url_path + data["urlQueries"][url_query],
+            "runtime": runtime,
+            "format": film_format,
+            "poster": poster,
+            "filmId": film_id,
+        }
+        if time_defaulted:
+            record["timeDefaulted"] = True
+        records.append(record)
+    return records
+
+
+STORE_FILE = 'data/events.db'     # Working copy, not committed: rebuilt from the dump when missing
+STORE_DUMP_DIR = 'data'           # Committed text dump of the store, one <table>.jsonl per table
+STORE_DUMP_TABLES = [("runs", "id"), ("venues", "short"), ("events", "id")]   # (table, sort key)
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    scraped INTEGER NOT NULL,
+    current INTEGER,
+    hash TEXT
+);
+CREATE TABLE IF NOT EXISTS venues (
+    short TEXT PRIMARY KEY,
+    name TEXT,
+    last_attempted INTEGER REFERENCES runs(id),
+    last_scraped INTEGER REFERENCES runs(id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    film_id TEXT,
+    title TEXT NOT NULL,
+    venue TEXT NOT NULL,
+    venue_short TEXT NOT NULL,
+    type TEXT NOT NULL,
+    start_time INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    description TEXT NOT NULL,
+    url TEXT NOT NULL,
+    runtime INTEGER,
+    format TEXT NOT NULL,
+    poster TEXT,
+    time_defaulted INTEGER NOT NULL DEFAULT 0,
+    first_seen INTEGER NOT NULL REFERENCES runs(id),
+    last_seen INTEGER NOT NULL REFERENCES runs(id)
+);
+CREATE INDEX IF NOT EXISTS events_start ON events (start_time);
+CREATE INDEX IF NOT EXISTS events_venue_start ON events (venue, start_time);
+CREATE INDEX IF NOT EXISTS events_title ON events (title);
+"""
+# Full-text index over the events table, kept in step by triggers as the run upserts events
+STORE_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_search USING fts5 (
+    title, description, venue, venue_short, format,
+    content = 'events', content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS events_search_insert AFTER INSERT ON events BEGIN
+    INSERT INTO events_search (rowid, title, description, venue, venue_short, format)
+    VALUES (new.rowid, new.title, new.description, new.venue, new.venue_short, new.format);
+END;
+CREATE TRIGGER IF NOT EXISTS events_search_delete AFTER DELETE ON events BEGIN
+    INSERT INTO events_search (events_search, rowid, title, description, venue, venue_short, format)
+    VALUES ('delete', old.rowid, old.title, old.description, old.venue, old.venue_short, old.format);
+END;
+CREATE TRIGGER IF NOT EXISTS events_search_update AFTER UPDATE ON events
+WHEN old.title IS NOT new.title OR old.description IS NOT new.description OR old.venue IS NOT new.venue
+     OR old.venue_short IS NOT new.venue_short OR old.format IS NOT new.format
+BEGIN
+    INSERT INTO events_search (events_search, rowid, title, description, venue, venue_short, format)
+    VALUES ('delete', old.rowid, old.title, old.description, old.venue, old.venue_short, old.format);
+    INSERT INTO events_search (rowid, title, description, venue, venue_short, format)
+    VALUES (new.rowid, new.title, new.description, new.venue, new.venue_short, new.format);
+END;
+"""
+STORE_VERSION = 3   # PRAGMA user_version; 2 added events_search, 3 events.time_defaulted
+# An event is current if it's upcoming and seen since its venue's last complete scrape
+STORE_CURRENT = "e.start_time >= ? AND (v.last_scraped IS NULL OR e.last_seen >= v.last_scraped)"
+STORE_COLUMNS = ["id", "film_id", "title", "venue", "venue_short", "type", "start_time", "date", "time",
+                 "description", "url", "runtime", "format", "poster", "time_defaulted"]
+
+
+class EventStore:
+    """SQLite store of every event the scraper has seen, with the run history"""
+    
+    def __init__(self, filename=STORE_FILE, dump_dir=STORE_DUMP_DIR):
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        self.db = sqlite3.connect(filename)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(STORE_SCHEMA)
+        self.db.executescript(STORE_SEARCH_SCHEMA)
+        version = self.db.execute('PRAGMA user_version').fetchone()[0]
+        if version < STORE_VERSION:
+            with self.db:
+                if version < 2:
+                    # The search index was added to an existing store: index the events it already has
+                    self.db.execute("INSERT INTO events_search (events_search) VALUES ('rebuild')")
+                columns = {row['name'] for row in self.db.execute('PRAGMA table_info(events)')}
+                if 'time_defaulted' not in columns:
+                    self.db.execute('ALTER TABLE events ADD COLUMN time_defaulted INTEGER NOT NULL DEFAULT 0')
+                self.db.execute(f'PRAGMA user_version = {STORE_VERSION}')
+        if dump_dir and self.is_empty():
+            self.load_dump(dump_dir)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self.db.close()
+    
+    def is_empty(self):
+        return self.db.execute('SELECT 1 FROM runs LIMIT 1').fetchone() is None
+    
+    def dump(self, directory=STORE_DUMP_DIR):
+        """Write each table to <directory>/<table>.jsonl, one row object per line in key order"""
+        
+        os.makedirs(directory, exist_ok=True)
+        for table, key in STORE_DUMP_TABLES:
+            filename = os.path.join(directory, f"{table}.jsonl")
+            cursor = self.db.execute(f'SELECT * FROM {table} ORDER BY {key}')
+            columns = [column[0] for column in cursor.description]
+            with open(f"{filename}.tmp", 'w', encoding='utf-8') as f:
+                for row in cursor:
+                    f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                    f.write('\n')
+            os.replace(f"{filename}.tmp", filename)
+    
+    def load_dump(self, directory=STORE_DUMP_DIR):
+        """Fill the store from a dump() in directory, if there is one"""
+        
+        loaded = 0
+        with self.db:
+            for table, _ in STORE_DUMP_TABLES:
+                try:
+                    f = open(os.path.join(directory, f"{table}.jsonl"), 'r', encoding='utf-8')
+                except FileNotFoundError:
+                    continue
+                with f:
+                    rows = (json.loads(line) for line in f if line.strip())
+                    first = next(rows, None)
+                    if first is None:
+                        continue
+                    columns = list(first)
+                    self.db.executemany(
+                        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                        ([row[column] for column in columns] for row in itertools.chain([first], rows)))
+                    loaded += 1
+        if loaded:
+            print(f"Loaded {STORE_FILE} from the dump in {directory}")
+    
+    def import_records(self, records):
+        """Seed an empty store with an existing events.json as one complete run of every venue in it"""
+        
+        events = []
+        for record in records:
+            try:
+                events.append(Event.from_dict(record))
+            except (KeyError, ValueError):
+                continue
+        if not events:
+            return
+        status = {event.venue_short: True for event in events}
+        self.record_run(events, status, earliest_upcoming_start())
+        print(f"Imported {len(events)} events from the previous events.json into {STORE_FILE}")
+    
+    def record_run(self, events, status, earliest):
+        """Write one run (events may be any iterable) and return its ID"""
+        
+        names = {}
+        scraped = 0
+        
+        def rows(run):
+            nonlocal scraped
+            for event in events:
+                names[event.venue_short] = event.venue
+                scraped += 1
+                yield (event.id, event.film_id, event.title, event.venue, event.venue_short, event.type,
+                       event.start, event.date, event.time, event.description, event.url, event.runtime,
+                       event.format, event.poster, int(event.time_defaulted), run, run)
+        
+        with self.db:
+            run = self.db.execute('INSERT INTO runs (time, status, scraped) VALUES (?, ?, 0)',
+                                  (int(time.time()), json.dumps(status, sort_keys=True))).lastrowid
+            
+            self.db.executemany(f"""
+                INSERT INTO events ({', '.join(STORE_COLUMNS)}, first_seen, last_seen)
+                VALUES ({', '.join('?' * len(STORE_COLUMNS))}, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    {', '.join(f'{column} = excluded.{column}' for column in STORE_COLUMNS[1:])},
+                    last_seen = excluded.last_seen
+            """, rows(run))
+            
+            self.db.executemany("""
+                INSERT INTO venues (short, name, last_attempted, last_scraped) VALUES (?, ?, ?, ?)
+                ON CONFLICT (short) DO UPDATE SET
+                    name = COALESCE(excluded.name, name),
+                    last_attempted = excluded.last_attempted,
+                    last_scraped = COALESCE(excluded.last_scraped, last_scraped)
+            """, [(short, names.get(short), run, run if ok else None) for short, ok in status.items()])
+            
+            current = self.db.execute(f"""
+                SELECT count(*) FROM events e LEFT JOIN venues v ON v.short = e.venue_short WHERE {STORE_CURRENT}
+            """, (earliest,)).fetchone()[0]
+            content_hash = canonical_hash(self.current_records(earliest))
+            self.db.execute('UPDATE runs SET scraped = ?, current = ?, hash = ? WHERE id = ?',
+                            (scraped, current, content_hash, run))
+            
+            kept = self.db.execute(f"""
+                SELECT e.venue_short, count(*) FROM events e LEFT JOIN venues v ON v.short = e.venue_short
+                WHERE {STORE_CURRENT} AND e.last_seen != ?
+                GROUP BY e.venue_short ORDER BY e.venue_short
+            """, (earliest, run)).fetchall()
+        
+        for venue_short, count in kept:
+            print(f"Kept {count} previous events for {venue_short} (not rescraped)")
+        return run
+    
+    def current_records(self, earliest, by_venue=False):
+        """Yield the current upcoming events' records from a cursor, in events.json order"""
+        
+        order = 'e.venue_short, ' if by_venue else ''
+        cursor = self.db.execute(f"""
+            SELECT {', '.join(f'e.{column}' for column in STORE_COLUMNS)}
+            FROM events e LEFT JOIN venues v ON v.short = e.venue_short
+            WHERE {STORE_CURRENT}
+            ORDER BY {order}e.start_time, e.venue, e.title
+        """, (earliest,))
+        for row in cursor:
+            yield store_record(row)
+    
+    def history(self, title=None, venue=None, since=None, until=None):
+        """Every stored event (current or not) matching the filters, with when it was first and last seen"""
+        
+        return self._find((('e.title = ?', title), ('e.venue = ?', venue),
+                           ('e.start_time >= ?', since), ('e.start_time < ?', until)),
+                          order='e.start_time, e.venue, e.title')
+    
+    def search(self, text, venue=None, since=None, until=None, limit=50):
+        """Stored events (current or not) whose title, description, venue or format contain every word of text"""
+        
+        return self._find((('events_search MATCH ?', search_query(text)),
+                           ('lower(?) IN (lower(e.venue_short), lower(e.venue))', venue),
+                           ('e.start_time >= ?', since), ('e.start_time < ?', until)),
+                          order='e.start_time DESC, e.venue, e.title', limit=limit,
+                          join='JOIN events_search ON events_search.rowid = e.rowid')
+    
+    def _find(self, filters, order, limit=None, join=''):
+        clauses, params = [], []
+        for clause, value in filters:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        rows = self.db.execute(f"""
+            SELECT {', '.join(f'e.{column}' for column in STORE_COLUMNS)},
+                   first.time AS first_seen, last.time AS last_seen
+            FROM events e
+            {join}
+            JOIN runs first ON first.id = e.first_seen
+            JOIN runs last ON last.id = e.last_seen
+            {where}
+            ORDER BY {order}
+            {'LIMIT ?' if limit else ''}
+        """, params + ([limit] if limit else [])).fetchall()
+        return [dict(store_record(row), firstSeen=row['first_seen'], lastSeen=row['last_seen']) for row in rows]
+
+
+def search_query(text):
+    """An FTS5 query matching every word of text, so punctuation in titles can't be read as query syntax"""
+    
+    words = re.findall(r'\w+', text)
+    if not words:
+        raise ValueError("Nothing to search for")
+    return ' '.join(f'"{word}"' for word in words)
+
+
+def search_day(value):
+    """argparse type for --since/--until: a YYYY-MM-DD date, checked and returned as is"""
+    
+    try:
+        parse_start(value, '12:00 AM')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM-DD date: {value!r}")
+    return value
+
+
+def search_events(text, venue=None, since=None, until=None, limit=50):
+    """The search command: print stored screenings matching text, latest first"""
+    
+    if not os.path.exists(STORE_FILE) and not os.path.exists(os.path.join(STORE_DUMP_DIR, 'events.jsonl')):
+        print(f"✗ No {STORE_FILE} yet; run the scraper first")
+        return []
+    
+    start = parse_start(since, '12:00 AM') if since else None
+    end = None
+    if until:
+        next_day = datetime.strptime(until, '%Y-%m-%d') + timedelta(days=1)
+        end = parse_start(next_day.strftime('%Y-%m-%d'), '12:00 AM')
+    
+    with EventStore() as store:
+        results = store.search(text, venue, start, end, limit)
+    
+    for record in results:
+        film_format = f"  [{record['format']}]" if record['format'] else ''
+        print(f"{record['date']} {record['time']:>8}  {record['venueShort']:<12}  {record['title']}{film_format}")
+    print(f"\n{len(results)} screening{'' if len(results) == 1 else 's'} found")
+    return results
+
+
+def store_record(row):
+    """The events.json record of an events table row"""
+    
+    record = {
+        "id": row['id'],
+        "title": row['title'],
+        "venue": row['venue'],
+        "venueShort": row['venue_short'],
+        "type": row['type'],
+        "date": row['date'],
+        "time": row['time'],
+        "start": row['start_time'],
+        "description": row['description'],
+        "url": row['url'],
+        "runtime": row['runtime'],
+        "format": row['format'],
+        "poster": row['poster'],
+        "filmId": row['film_id'],
+    }
+    if row['time_defaulted']:
+        record["timeDefaulted"] = True
+    return record
+
+
+def store_events(events, filename, earliest, scrape_status):
+    """Record this run in the SQLite store; returns (store, current)"""
+    
+    store = None
+    try:
+        store = EventStore()
+        if store.is_empty():
+            store.import_records(iter_event_records(filename))
+        store.record_run(events, scrape_status, earliest)
+        try:
+            store.dump()
+        except OSError as e:
+            print(f"✗ Error writing the store dump to {STORE_DUMP_DIR}: {e}")
+        return store, lambda by_venue=False: store.current_records(earliest, by_venue)
+    except sqlite3.Error as e:
+        print(f"✗ Error writing {STORE_FILE}: {e}")
+        if store is not None:
+            store.close()
+        merged = merge_previous_events(events, iter_event_records(filename), scrape_status)
+        
+        def current(by_venue=False):
+            ordered = sorted(merged, key=lambda event: event.venue_short) if by_venue else merged
+            return (event.to_dict() for event in ordered)
+        return None, current
+
+
+def write_event_files(current, filename, changes_filename, base_hash, content_hash, sizes):
+    """Write the change feed against the previous filename, then filename and the compact file"""
+    
+    changes = diff_events(iter_event_records(filename), current())
+    # Only promise base -> hash if applying the feed really gives the new file
+    if canonical_hash(apply_changes(iter_event_records(filename), changes)) == content_hash:
+        changes["base"] = base_hash
+        changes["hash"] = content_hash
+    else:
+        print(f"✗ {changes_filename} doesn't rebuild {filename}; written without base/hash")
+    save_changes(changes, changes_filename, sizes)
+    save_events_to_json(current(), filename, sizes)
+    try:
+        write_output(encode_compact(current()), COMPACT_FILE, sizes, **COMPACT_JSON_OPTIONS)
+    except Exception as e:
+        print(f"✗ Error saving {COMPACT_FILE}: {e}")
+
+
+def write_events(events, run, filename='events.json', changes_filename='changes.json'):
+    """Sink stage: record the run in the store, then export events.json and its derivatives"""
+    
+    earliest = earliest_upcoming_start()
+    # Kept for the fallback merge if the store fails; dropped once the run is recorded
+    events = list(events)
+    store, current = store_events(events, filename, earliest, run.scrape_status)
+    del events
+    
+    try:
+        # The previous file is read record by record each time it's needed rather than held in memory
+        base_hash = canonical_hash(iter_event_records(filename))
+        content_hash = canonical_hash(current())
+        if (content_hash == base_hash and output_exists(filename)
+                and output_exists(COMPACT_FILE, **COMPACT_JSON_OPTIONS)):
+            print(f"\n✓ {filename} is unchanged, not rewritten")
+        else:
+            write_event_files(current, filename, changes_filename, base_hash, content_hash, run.output_sizes)
+        
+        previous_manifest = load_manifest()
+        manifest = json.loads(json.dumps(previous_manifest))
+        # Per-venue partitions are no longer published
+        for entry in manifest.pop('venues', {}).values():
+            remove_output(entry['file'])
+        write_partitions('weeks', current(), week_partition, manifest, run.output_sizes)
+        try:
+            write_feeds(current(by_venue=True), current(), manifest)
+        except Exception as e:
+            print(f"✗ Error saving calendar feeds: {e}")
+        write_manifest(manifest, previous_manifest, run.output_sizes)
+        report_output_sizes(run.output_sizes)
+        
+        for record in current():
+            yield Event.from_dict(record)
+    finally:
+        if store is not None:
+            store.close()
+
+
+# Post-scrape stages, in order. Each takes an iterator of Events and the
+# run's PipelineRun and yields Events, so stages can be added, removed or
+# reordered freely.
+PIPELINE_STAGES = [
+    ("normalize", normalize_events),
+    ("filter past", filter_past_events),
+    ("dedup", dedupe_events),
+    ("cluster", cluster_events),
+    ("index", index_events),
+    ("enrich", enrich_events),
+    ("posters", fetch_posters),
+    ("sort", sort_events),
+    ("write", write_events),
+]
+
+
+def timed(events, timings, name):
+    """Pass events through, adding the time spent producing them to timings[name]"""
+    
+    iterator = iter(events)
+    while True:
+        started = time.perf_counter()
+        try:
+            event = next(iterator)
+        except StopIteration:
+            timings[name] += time.perf_counter() - started
+            return
+        timings[name] += time.perf_counter() - started
+        yield event
+
+
+def run_pipeline(source, stages, run):
+    """Chain the stages onto the source lazily, run it with run, and report stage timings"""
+    
+    timings = {"scrape": 0.0}
+    timings.update((name, 0.0) for name, stage in stages)
+    
+    events = timed(source, timings, "scrape")
+    for name, stage in stages:
+        events = timed(stage(events, run), timings, name)
+    
+    results = list(events)
+    
+    print("Pipeline stage timings:")
+    upstream = 0.0
+    for name, total in timings.items():
+        print(f"  {name}: {total - upstream:.3f}s")
+        upstream = total
+    
+    return results
+
+
+ARCHIVE_DIR = 'archive'
+
+
+def archive_schema():
+    """Schema of the archive's snapshot files (run_date comes from the directory)"""
+    
+    category = pa.dictionary(pa.int32(), pa.string())
+    timestamp = pa.timestamp('s', tz='America/Los_Angeles')
+    return pa.schema([
+        ("run_time", timestamp),
+        ("id", pa.string()),
+        ("film_id", pa.string()),
+        ("title", category),
+        ("venue", category),
+        ("venue_short", category),
+        ("type", category),
+        ("start", timestamp),
+        ("runtime", pa.int32()),
+        ("format", category),
+        ("description", pa.string()),
+        ("url", pa.string()),
+        ("poster", pa.string()),
+        ("time_defaulted", pa.bool_()),
+    ])
+
+
+def archive_events(events, run_time=None):
+    """Append a snapshot of events to archive/run_date=YYYY-MM-DD/part-HHMMSS.parquet"""
+    
+    if pa is None:
+        print("Parquet archive skipped (pyarrow not installed)")
+        return None
+    
+    run_time = int(run_time if run_time is not None else time.time())
+    wall = local_time(run_time)
+    directory = os.path.join(ARCHIVE_DIR, f"run_date={wall:%Y-%m-%d}")
+    filename = os.path.join(directory, f"part-{wall:%H%M%S}.parquet")
+    if os.path.exists(filename):
+        print(f"✗ {filename} already exists, not overwritten")
+        return None
+    
+    events = list(events)
+    schema = archive_schema()
+    columns = {
+        "run_time": [run_time] * len(events),
+        "id": [event.id for event in events],
+        "film_id": [event.film_id for event in events],
+        "title": [event.title for event in events],
+        "venue": [event.venue for event in events],
+        "venue_short": [event.venue_short for event in events],
+        "type": [event.type for event in events],
+        "start": [event.start for event in events],
+        "runtime": [event.runtime for event in events],
+        "format": [event.format for event in events],
+        "description": [event.description for event in events],
+        "url": [event.url for event in events],
+        "poster": [event.poster for event in events],
+        "time_defaulted": [event.time_defaulted for event in events],
+    }
+    table = pa.table({name: pa.array(values, type=schema.field(name).type) for name, values in columns.items()},
+                     schema=schema)
+    
+    os.makedirs(directory, exist_ok=True)
+    pq.write_table(table, f"{filename}.tmp", compression='zstd')
+    os.replace(f"{filename}.tmp", filename)
+    print(f"✓ Archived {len(events)} events to {filename} ({os.path.getsize(filename):,} bytes)")
+    return filename
+
+
+def load_archive(since=None, until=None, columns=None, directory=ARCHIVE_DIR):
+    """Read archive snapshots from run dates since..until (YYYY-MM-DD, inclusive) into a pyarrow Table"""
+    
+    if pa is None:
+        raise RuntimeError("pyarrow is needed to read the archive")
+    
+    partitioning = ds.partitioning(pa.schema([("run_date", pa.string())]), flavor='hive')
+    dataset = ds.dataset(directory, format='parquet', partitioning=partitioning,
+                         schema=archive_schema().append(pa.field("run_date", pa.string())))
+    run_date = ds.field("run_date")
+    condition = None
+    if since is not None:
+        condition = run_date >= since
+    if until is not None:
+        condition = run_date <= until if condition is None else condition & (run_date <= until)
+    if columns is not None:
+        columns = list(columns) + ["run_date"]
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+def scrape_all_venues(stages=PIPELINE_STAGES, venues=None):
+    """Scrape all venues (or just venues) and stream the events through the pipeline stages"""
+    
+    print("=" * 60)
+    print("Starting LA Events Calendar Scraper v10")
+    print("=" * 60)
+    print()
+    
+    run = PipelineRun()
+    events = run_pipeline(iter_scraped_events(VENUES if venues is None else venues, run), stages, run)
+    run.close()
+    
+    try:
+        archive_events(events)
+    except Exception as e:
+        print(f"✗ Error archiving events: {e}")
     
     print("=" * 60)
-    print(f"Total unique upcoming events: {len(unique_events)}")
-    print(f"Current Pacific Time: {datetime.now(pst)}")
+    print(f"Total unique upcoming events: {len(events)}")
+    print(f"Current Pacific Time: {datetime.now(VENUE_TIMEZONE)}")
     print("=" * 60)
     
-    return unique_events
+    return events
 
 
-def save_events_to_json(events, filename='events.json'):
-    """Save events to a JSON file"""
+def save_events_to_json(records, filename='events.json', sizes=None):
+    """Save events.json records (any iterable) to a JSON file, with its siblings (see write_output)"""
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(events, f, indent=2, ensure_ascii=False)
+        write_output(records, filename, sizes, indent=2, ensure_ascii=False)
         print(f"\n✓ Events saved to {filename}")
         return True
     except Exception as e:
@@ -1002,12 +3610,38 @@ def save_events_to_json(events, filename='events.json'):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape LA venue listings into events.json")
+    parser.add_argument('--venue', action='append', metavar='NAME',
+                        help="only scrape this venue (short or full name; repeatable). "
+                             "Other venues keep their events from events.json")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    search = commands.add_parser('search', help=f"search current and past screenings in {STORE_FILE}")
+    search.add_argument('text', help="words to find in titles, descriptions, venues and formats")
+    search.add_argument('--venue', dest='search_venue', metavar='NAME', help="only this venue (short or full name)")
+    search.add_argument('--since', type=search_day, metavar='YYYY-MM-DD', help="screenings on or after this date")
+    search.add_argument('--until', type=search_day, metavar='YYYY-MM-DD', help="screenings on or before this date")
+    search.add_argument('--limit', type=int, default=50, help="most results to show (default 50)")
+    args = parser.parse_args()
+    
+    if args.command == 'search':
+        try:
+            search_events(args.text, args.search_venue, args.since, args.until, args.limit)
+        except ValueError as e:
+            parser.error(str(e))
+        sys.exit(0)
+    
     print("LA Events Calendar Scraper v9")
     print("Vista Theater + New Beverly + Vidiots + Academy Museum")
     print("Now with clickable event links!")
     print("Fixed: Keeps today's future events!\n")
     
-    events = scrape_all_venues()
-    save_events_to_json(events)
+    venues = None
+    if args.venue:
+        wanted = {name.lower() for name in args.venue}
+        venues = [venue for venue in VENUES if venue['short'].lower() in wanted or venue['name'].lower() in wanted]
+        if not venues:
+            parser.error(f"no venue matches {', '.join(args.venue)}")
+    
+    events = scrape_all_venues(venues=venues)
     
     print("\nDone! Check events.json for the results.")
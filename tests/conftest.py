@@ -0,0 +1,55 @@
+import datetime as dt
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import scraper_v10 as scraper
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Fixture pages and events are dated around this moment
+NOW = dt.datetime(2026, 10, 19, 9, 0, tzinfo=scraper.VENUE_TIMEZONE)
+
+
+class FrozenDatetime(dt.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW.astimezone(tz) if tz else NOW.replace(tzinfo=None)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the scraper's clock, which the year of undated listings, the horizon and "upcoming" depend on"""
+
+    monkeypatch.setattr(scraper, 'datetime', FrozenDatetime)
+    monkeypatch.setattr(scraper, 'SCRAPE_HORIZON_DAYS', 60)
+
+
+@pytest.fixture(autouse=True)
+def empty_card_cache():
+    """Parsers reuse cards through the module's card cache; start every test without one"""
+
+    scraper.card_cache.clear()
+    yield
+    scraper.card_cache.clear()
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def make_event(title, venue_short="Vista", date="2026-11-15", time="7:30 PM", **fields):
+    """An Event at one of the real venues, e.g. make_event("Heat", "New Bev")"""
+
+    venue = {
+        "Vista": "The Vista Theater",
+        "New Bev": "The New Beverly Theater",
+        "Vidiots": "Vidiots",
+        "Academy": "Academy Museum",
+        "Los Feliz 3": "American Cinematheque at Los Feliz 3",
+    }[venue_short]
+    return scraper.Event.from_strings(title, venue, venue_short, "film", date, time, **fields)
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import NOW, make_event
+
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def test_archive_round_trip():
+    heat = make_event("Heat", description="Michael Mann, 1995")
+    heat.runtime = 170
+    heat.film_id = "853911dc66c6"
+    thief = make_event("Thief", "New Bev", "2026-11-13", time_defaulted=True)
+    run_time = int(NOW.timestamp())
+
+    filename = scraper.archive_events(iter([heat, thief]), run_time)
+
+    assert filename == os.path.join("archive", "run_date=2026-10-19", "part-090000.parquet")
+    table = scraper.load_archive()
+    rows = table.to_pylist()
+    assert [row["id"] for row in rows] == [heat.id, thief.id]
+    assert rows[0]["title"] == "Heat" and rows[0]["runtime"] == 170 and rows[0]["film_id"] == "853911dc66c6"
+    assert [int(row["start"].timestamp()) for row in rows] == [heat.start, thief.start]
+    assert [row["time_defaulted"] for row in rows] == [False, True]
+    assert {row["run_date"] for row in rows} == {"2026-10-19"}
+
+
+def test_archive_never_overwrites_a_snapshot():
+    run_time = int(NOW.timestamp())
+    scraper.archive_events([make_event("Heat")], run_time)
+
+    assert scraper.archive_events([make_event("Thief")], run_time) is None
+    assert scraper.load_archive().column("title").to_pylist() == ["Heat"]
+
+
+def test_load_archive_filters_run_dates():
+    day = 24 * 60 * 60
+    for offset, title in enumerate(["Heat", "Thief", "Ran"]):
+        scraper.archive_events([make_event(title)], int(NOW.timestamp()) + offset * day)
+
+    table = scraper.load_archive(since="2026-10-20", until="2026-10-21", columns=["title"])
+
+    assert sorted(table.column("title").to_pylist()) == ["Ran", "Thief"]
+    assert table.column_names == ["title", "run_date"]
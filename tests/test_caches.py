@@ -0,0 +1,82 @@
+import pytest
+
+import scraper_v10 as scraper
+
+
+PAGE = """<html><head><meta name="csrf-token" content="{token}"><link rel="stylesheet" href="/site.css?v={token}">
+<script nonce="{token}">window.renderedAt = {token};</script></head>
+<body><form><input type="hidden" name="_token" value="{token}"></form>
+<div class="card" data-ts="{token}"><h3>Thief</h3><span>Nov 18</span>
+<a href="/now-showing/thief-11-18-26-730pm/">View Event Details</a></div></body></html>"""
+
+
+def test_page_hash_ignores_volatile_markup():
+    assert scraper.page_hash(PAGE.format(token="1792400000")) == scraper.page_hash(PAGE.format(token="1792400123"))
+    assert scraper.page_hash(PAGE.format(token="a")) == scraper.page_hash(PAGE.format(token="a").replace('\n', '\n  '))
+
+
+@pytest.mark.parametrize('old, new', [
+    ("thief-11-18-26-730pm", "thief-11-18-26-930pm"),   # time in an href
+    ("Nov 18", "Nov 19"),                                # date in the text
+    ("2026-11-18T19:30:00-08:00", "2026-11-18T21:30:00-08:00"),   # machine-readable showtime
+    ("1795059000", "1795066200"),                                  # epoch start in a ticket link
+])
+def test_page_hash_covers_listing_content(old, new):
+    page = PAGE.format(token="x").replace(
+        '<span>Nov 18</span>',
+        '<span>Nov 18</span><time datetime="2026-11-18T19:30:00-08:00"></time><a href="/tickets?start=1795059000">x</a>')
+
+    assert scraper.page_hash(page) != scraper.page_hash(page.replace(old, new))
+
+
+def test_card_key():
+    assert scraper.card_key("Vista", ["<h3>Heat</h3>", "<p>7:30 PM</p>"]) == \
+        scraper.card_key("Vista", ["<h3>Heat</h3>", "<p>7:30  PM</p>"])
+    assert scraper.card_key("Vista", ["<h3>Heat</h3>", "<p>7:30 PM</p>"]) != \
+        scraper.card_key("Vista", ["<h3>Heat</h3>", "<p>9:30 PM</p>"])
+    assert scraper.card_key("Vista", ["<h3>Heat</h3>"]) != scraper.card_key("New Bev", ["<h3>Heat</h3>"])
+    # Parts are separated, so moving text between them changes the key
+    assert scraper.card_key("Vista", ["ab", "c"]) != scraper.card_key("Vista", ["a", "bc"])
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(scraper, 'CARD_CACHE_FILE', str(tmp_path / 'card_cache.json'))
+    monkeypatch.setattr(scraper, 'PAGE_CACHE_FILE', str(tmp_path / 'page_cache.json'))
+    return tmp_path
+
+
+def test_page_cache_round_trip_drops_stale_entries(cache_dir):
+    pages = {
+        "Vista|https://a": {"hash": "1", "events": [], "seen": "2026-10-19"},
+        "Vista|https://b": {"hash": "2", "events": [], "seen": "2026-10-05"},   # 14 days: kept
+        "Vista|https://c": {"hash": "3", "events": [], "seen": "2026-10-04"},
+    }
+
+    scraper.save_page_cache(pages)
+
+    assert set(scraper.load_page_cache()) == {"Vista|https://a", "Vista|https://b"}
+
+
+def test_card_cache_round_trip(cache_dir):
+    cards = {"k": {"events": [["Heat"]], "seen": "2026-10-19"}}
+
+    scraper.save_card_cache(cards)
+
+    assert scraper.load_card_cache() == cards
+
+
+def test_caches_from_another_version_are_ignored(cache_dir, monkeypatch):
+    scraper.save_card_cache({"k": {"events": [], "seen": "2026-10-19"}})
+    scraper.save_page_cache({"Vista|https://a": {"hash": "1", "events": [], "seen": "2026-10-19"}})
+    monkeypatch.setattr(scraper, 'CARD_CACHE_VERSION', scraper.CARD_CACHE_VERSION + 1)
+    monkeypatch.setattr(scraper, 'PAGE_CACHE_VERSION', scraper.PAGE_CACHE_VERSION + 1)
+
+    assert scraper.load_card_cache() == {}
+    assert scraper.load_page_cache() == {}
+
+
+def test_missing_caches_load_empty(cache_dir):
+    assert scraper.load_card_cache() == {}
+    assert scraper.load_page_cache() == {}
@@ -0,0 +1,86 @@
+import scraper_v10 as scraper
+from conftest import make_event
+
+
+def records(*events):
+    return [event.to_dict() for event in sorted(events, key=scraper.event_order)]
+
+
+def diff(previous, current):
+    changes = scraper.diff_events(iter(previous), iter(current))
+    # apply_changes must turn the previous file into the current one exactly
+    assert list(scraper.apply_changes(iter(previous), changes)) == current
+    return changes
+
+
+def test_unchanged():
+    events = records(make_event("Heat"), make_event("Thief", "New Bev"))
+
+    changes = diff(events, events)
+
+    assert changes["counts"] == {}
+    assert not any(changes[kind] for kind in ("added", "removed", "rescheduled", "retitled", "modified", "expired"))
+
+
+def test_added_and_removed():
+    heat = make_event("Heat")
+    thief = make_event("Thief", "New Bev")
+    ran = make_event("Ran", "Vidiots", "2026-11-14", "8:00 PM")
+
+    changes = diff(records(heat, thief), records(heat, ran))
+
+    assert [record["title"] for record in changes["added"]] == ["Ran"]
+    assert changes["removed"] == [thief.id]
+    assert changes["counts"] == {
+        "Vidiots": {"added": 1, "removed": 0, "rescheduled": 0, "retitled": 0, "modified": 0},
+        "New Bev": {"added": 0, "removed": 1, "rescheduled": 0, "retitled": 0, "modified": 0},
+    }
+
+
+def test_rescheduled_and_retitled():
+    heat = make_event("Heat", time="7:30 PM")
+    heat_later = make_event("Heat", time="9:45 PM")
+    oz = make_event("Wizard of Ozin 4K", "Academy", "2026-11-16", "2:30 PM")
+    oz_fixed = make_event("Wizard of Oz in 4K", "Academy", "2026-11-16", "2:30 PM")
+
+    changes = diff(records(heat, oz), records(heat_later, oz_fixed))
+
+    assert [(entry["previousId"], entry["id"], entry["time"]) for entry in changes["rescheduled"]] == [
+        (heat.id, heat_later.id, "9:45 PM")]
+    assert [(entry["previousId"], entry["title"]) for entry in changes["retitled"]] == [
+        (oz.id, "Wizard of Oz in 4K")]
+    assert changes["added"] == changes["removed"] == []
+
+
+def test_modified_keeps_the_id():
+    heat = make_event("Heat")
+    enriched = make_event("Heat", description="Michael Mann, 1995")
+    enriched.runtime = 170
+
+    changes = diff(records(heat), records(enriched))
+
+    assert changes["modified"] == [{"id": heat.id, "record": enriched.to_dict()}]
+    assert changes["counts"]["Vista"]["modified"] == 1
+
+
+def test_expired_events_are_not_removals():
+    # Started before the frozen "now" (2026-10-19 9:00)
+    matinee = make_event("Heat", date="2026-10-18", time="1:00 PM")
+    thief = make_event("Thief", "New Bev")
+
+    changes = diff(records(matinee, thief), records(thief))
+
+    assert changes["expired"] == [matinee.id]
+    assert changes["removed"] == []
+    assert changes["counts"] == {}
+
+
+def test_unreadable_previous_records_are_removed():
+    thief = make_event("Thief", "New Bev")
+    all_day = {"id": "x", "title": "Festival", "venue": "Vidiots", "venueShort": "Vidiots", "type": "film",
+               "date": "2026-11-14", "time": "All Day"}
+
+    changes = scraper.diff_events(iter([all_day] + records(thief)), iter(records(thief)))
+
+    assert changes["removed"] == ["x"]
+    assert changes["counts"]["Vidiots"]["removed"] == 1
@@ -0,0 +1,121 @@
+from concurrent.futures import Future
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event, read_fixture
+
+
+def test_detail_page_reads_the_credits_not_the_site_chrome():
+    details = scraper.parse_detail_page(read_fixture('detail_new_beverly.html'), "https://thenewbev.com/program/heat")
+
+    # Not "Doors open 30 minutes", the "35mm Prints" nav link or the theater's meta description
+    assert details["runtime"] == 170
+    assert details["format"] == "DCP"
+    assert details["description"].startswith("A group of professional bank robbers")
+    assert not details["description_from_meta"]
+    assert details["url"] == "https://thenewbev.com/program/heat/"
+    assert details["poster_url"] == "https://thenewbev.com/wp-content/uploads/heat.jpg"
+
+
+def test_detail_page_reads_next_to_the_title():
+    details = scraper.parse_detail_page(read_fixture('detail_academy_museum.html'),
+                                        "https://www.academymuseum.org/en/programs/detail/x")
+
+    assert details["runtime"] == 102
+    assert details["format"] == "4K"
+    assert details["description"].startswith("Dorothy and Toto")
+    assert details["description_from_meta"]
+    assert details["url"] == "https://www.academymuseum.org/en/programs/detail/the-wizard-of-oz"
+
+
+def test_detail_page_without_details():
+    html = """<html><body><nav>Now in 70mm!</nav><main><h1>Heat</h1>
+    <p>Join us for a Q&amp;A. Doors open 45 minutes early.</p></main></body></html>"""
+
+    details = scraper.parse_detail_page(html, "https://example.com/heat")
+
+    assert (details["runtime"], details["format"], details["description"]) == (None, "", "")
+
+
+class FakeDetailFetcher:
+    """Stands in for DetailFetcher, serving pages from {url: html}"""
+
+    pages = {}
+    fetched = []
+
+    def __init__(self, http_cache):
+        self.stats = {"http": 0, "browser": 0, "failed": 0}
+
+    def submit(self, url):
+        FakeDetailFetcher.fetched.append(url)
+        future = Future()
+        future.set_result(scraper.parse_detail_page(self.pages[url], url))
+        return future
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, 'ENRICHMENT_CACHE_FILE', str(tmp_path / 'enrichment.json'))
+    monkeypatch.setattr(scraper, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(scraper, 'DetailFetcher', FakeDetailFetcher)
+    FakeDetailFetcher.pages = {}
+    FakeDetailFetcher.fetched = []
+    return FakeDetailFetcher
+
+
+def test_enrich_events_fills_in_details_once(fetcher):
+    fetcher.pages = {"https://thenewbev.com/program/heat": read_fixture('detail_new_beverly.html')}
+    showtimes = [make_event("Heat", "New Bev", time=time, url="https://thenewbev.com/program/heat")
+                 for time in ("2:00 PM", "7:30 PM")]
+
+    events = list(scraper.enrich_events(iter(showtimes), scraper.PipelineRun()))
+
+    assert fetcher.fetched == ["https://thenewbev.com/program/heat"]
+    assert [(event.runtime, event.format, event.url) for event in events] == \
+        [(170, "DCP", "https://thenewbev.com/program/heat/")] * 2
+
+    # The next run reuses the cached details
+    again = [make_event("Heat", "New Bev", time="2:00 PM", url="https://thenewbev.com/program/heat")]
+    assert list(scraper.enrich_events(iter(again), scraper.PipelineRun()))[0].runtime == 170
+    assert fetcher.fetched == ["https://thenewbev.com/program/heat"]
+
+
+def test_enrich_events_refetches_changed_events(fetcher, tmp_path):
+    url = "https://thenewbev.com/program/heat"
+    fetcher.pages = {url: read_fixture('detail_new_beverly.html')}
+    list(scraper.enrich_events(iter([make_event("Heat", "New Bev", url=url)]), scraper.PipelineRun()))
+
+    # The identity index reports the showtime as new, so its cached details aren't trusted
+    run = scraper.PipelineRun()
+    run.identity_index = scraper.IdentityIndex(str(tmp_path / 'identity_index.json'))
+    run.identity_index.observe(make_event("Heat", "New Bev", url=url))
+    list(scraper.enrich_events(iter([make_event("Heat", "New Bev", url=url)]), run))
+
+    assert fetcher.fetched == [url, url]
+
+
+def test_enrich_events_drops_a_site_wide_meta_description(fetcher):
+    generic = '<meta name="description" content="Revival cinema in Los Angeles since 1978, showing films on 35mm.">'
+    fetcher.pages = {
+        f"https://thenewbev.com/program/{slug}": f"<html><head>{generic}</head><body><main><h1>{title}</h1>"
+                                                 f"<p>Michael Mann, 1981, 35mm, 122 min</p></main></body></html>"
+        for slug, title in (("thief", "Thief"), ("manhunter", "Manhunter"))
+    }
+    events = [make_event("Thief", "New Bev", url="https://thenewbev.com/program/thief"),
+              make_event("Manhunter", "New Bev", url="https://thenewbev.com/program/manhunter")]
+
+    events = list(scraper.enrich_events(iter(events), scraper.PipelineRun()))
+
+    assert [(event.description, event.runtime, event.format) for event in events] == [("", 122, "35mm")] * 2
+
+
+def test_enrich_events_skips_urls_shared_by_films(fetcher):
+    listing = "https://ticketing.uswest.veezi.com/sessions/?siteToken=abc"
+    events = [make_event("Heat", url=listing), make_event("Thief", url=listing)]
+
+    assert list(scraper.enrich_events(iter(events), scraper.PipelineRun())) == events
+    assert fetcher.fetched == []
@@ -0,0 +1,79 @@
+import scraper_v10 as scraper
+from conftest import make_event
+
+STAMP = "20261019T160000Z"
+
+
+def test_ics_text_escapes():
+    assert scraper.ics_text("Heat; Thief, and\nRan\\") == "Heat\\; Thief\\, and\\nRan\\\\"
+
+
+def test_ics_line_folds_at_75_octets():
+    line = "DESCRIPTION:" + "é" * 60
+
+    folded = scraper.ics_line(line)
+
+    parts = folded[:-2].split('\r\n')
+    assert folded.endswith('\r\n') and len(parts) > 1
+    assert all(len(part.encode('utf-8')) <= 75 for part in parts)
+    assert all(part.startswith(' ') for part in parts[1:])
+    assert ''.join([parts[0]] + [part[1:] for part in parts[1:]]) == line
+    assert scraper.ics_line("SUMMARY:Heat") == "SUMMARY:Heat\r\n"
+
+
+def test_ics_event_lines():
+    event = make_event("Heat", date="2026-11-01", time="11:00 PM", url="https://vistatheaterhollywood.com/heat",
+                       description="Michael Mann, 1995")
+    event.runtime = 170
+    event.format = "35mm"
+
+    lines = scraper.ics_event_lines(event.to_dict(), "example.com", STAMP)
+
+    assert lines == [
+        "BEGIN:VEVENT",
+        f"UID:{event.id}@example.com",
+        f"DTSTAMP:{STAMP}",
+        # Local wall-clock times, ending past midnight after the switch to PST
+        "DTSTART;TZID=America/Los_Angeles:20261101T230000",
+        "DTEND;TZID=America/Los_Angeles:20261102T015000",
+        "SUMMARY:Heat",
+        "LOCATION:The Vista Theater",
+        f"CATEGORIES:{event.type}",
+        "DESCRIPTION:35mm\\n\\nMichael Mann\\, 1995",
+        "URL:https://vistatheaterhollywood.com/heat",
+        "END:VEVENT",
+    ]
+
+
+def test_ics_event_lines_defaults():
+    record = make_event("Heat", description="", url="").to_dict()
+
+    lines = scraper.ics_event_lines(record, "example.com", STAMP)
+
+    assert "DTEND;TZID=America/Los_Angeles:20261115T213000" in lines
+    assert not [line for line in lines if line.startswith(("DESCRIPTION", "URL"))]
+
+
+def test_ics_event_without_a_showtime_is_all_day():
+    record = make_event("Heat", date="2026-11-15", description="", time_defaulted=True).to_dict()
+
+    lines = scraper.ics_event_lines(record, "example.com", STAMP)
+
+    assert lines[3:5] == ["DTSTART;VALUE=DATE:20261115", "DTEND;VALUE=DATE:20261116"]
+    assert "DESCRIPTION:Time TBA" in lines
+
+
+def test_write_feed(tmp_path):
+    records = [make_event("Heat").to_dict(), make_event("Thief", "New Bev", time="9:00 PM").to_dict()]
+    filename = str(tmp_path / 'all.ics')
+
+    scraper.write_feed(filename, "LA Events", iter(records), "example.com")
+
+    with open(filename, 'rb') as f:
+        content = f.read().decode('utf-8')
+    lines = content.split('\r\n')
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-2:] == ["END:VCALENDAR", ""]
+    assert "BEGIN:VTIMEZONE" in lines
+    assert [line for line in lines if line.startswith("SUMMARY")] == ["SUMMARY:Heat", "SUMMARY:Thief"]
+    assert '\n' not in content.replace('\r\n', '')
+    assert not (tmp_path / 'all.ics.tmp').exists()
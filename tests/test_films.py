@@ -0,0 +1,58 @@
+import pytest
+
+import scraper_v10 as scraper
+
+
+@pytest.mark.parametrize('title, key', [
+    ("The Wizard of Oz", "wizard of oz"),
+    ("Wizard of Oz in 4K", "wizard of oz"),
+    ("WIZARD OF OZ (35mm)", "wizard of oz"),
+    ("Jaws - 70mm", "jaws"),
+    ("Alien on 35mm", "alien"),
+    # Titles ending in "in" keep it
+    ("Frankenstein 35mm", "frankenstein"),
+    ("Berlin 4K", "berlin"),
+    ("A", "a"),
+])
+def test_film_key(title, key):
+    assert scraper.film_key(title) == key
+
+
+def test_cluster_films_groups_variants():
+    films = scraper.cluster_films([
+        "The Wizard of Oz", "Wizard of Oz in 4K", "WIZARD OF OZ (35mm)",
+        "Frankenstein", "Frankenstein 35mm",
+        "Heat", "Thief",
+    ])
+
+    assert films["The Wizard of Oz"] == films["Wizard of Oz in 4K"] == films["WIZARD OF OZ (35mm)"]
+    assert films["Frankenstein"] == films["Frankenstein 35mm"]
+    assert len({films["The Wizard of Oz"], films["Frankenstein"], films["Heat"], films["Thief"]}) == 4
+
+
+def test_cluster_films_splits_glued_formats():
+    # The "in" of "in 4K" lost its space on the page, at any venue
+    films = scraper.cluster_films(["Wizard of Ozin 4K", "The Wizard of Oz", "Berlin 4K", "Berlin"])
+
+    assert films["Wizard of Ozin 4K"] == films["The Wizard of Oz"]
+    assert films["Berlin 4K"] == films["Berlin"]
+
+
+def test_film_key_splits_glued_formats_only_into_known_keys():
+    assert scraper.film_key("Wizard of Ozin 4K", {"wizard of oz"}) == "wizard of oz"
+    assert scraper.film_key("Wizard of Ozin 4K") == "wizard of ozin"
+    assert scraper.film_key("Berlin 4K", {"berlin", "wizard of oz"}) == "berlin"
+
+
+def test_cluster_films_keeps_sequels_apart():
+    films = scraper.cluster_films(["Heat", "Heat 2", "The Godfather Part II", "The Godfather Part III"])
+
+    assert films["Heat"] != films["Heat 2"]
+    assert films["The Godfather Part II"] != films["The Godfather Part III"]
+
+
+def test_cluster_films_ids_are_stable():
+    titles = ["Thief", "Heat", "The Wizard of Oz", "Wizard of Oz in 4K"]
+
+    assert scraper.cluster_films(titles) == scraper.cluster_films(list(reversed(titles)))
+
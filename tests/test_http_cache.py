@@ -0,0 +1,145 @@
+import http.server
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import scraper_v10 as scraper
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Serves "page <path>" with an ETag; /fresh is cacheable, /aged spent its max-age in a proxy"""
+
+    requests = []
+
+    def do_GET(self):
+        Handler.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            return
+        body = f"page {self.path}".encode('utf-8')
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Type', 'text/html')
+        if self.path == '/fresh':
+            self.send_header('Cache-Control', 'max-age=600')
+        elif self.path == '/aged':
+            self.send_header('Cache-Control', 'max-age=600')
+            self.send_header('Age', '900')
+        elif self.path == '/private':
+            self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = []
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return scraper.HttpCache(str(tmp_path / 'http'))
+
+
+def test_fresh_response_served_from_disk(server, cache):
+    first = cache.get(f"{server}/fresh")
+    second = cache.get(f"{server}/fresh")
+
+    assert (first.content, first.from_cache) == (b"page /fresh", False)
+    assert (second.content, second.from_cache) == (b"page /fresh", True)
+    assert Handler.requests == [("/fresh", None)]
+    assert cache.stats["fresh"] == 1
+
+
+def test_stale_response_revalidated(server, cache):
+    cache.get(f"{server}/plain")
+    response = cache.get(f"{server}/plain")
+
+    assert (response.status, response.content, response.from_cache) == (200, b"page /plain", True)
+    assert Handler.requests == [("/plain", None), ("/plain", '"v1"')]
+    assert cache.stats["revalidated"] == 1
+
+
+def test_age_counts_against_max_age(server, cache):
+    cache.get(f"{server}/aged")
+    cache.get(f"{server}/aged")
+
+    # Already older than its max-age when it arrived, so it's revalidated
+    assert Handler.requests == [("/aged", None), ("/aged", '"v1"')]
+
+
+def test_no_store_is_not_written(server, cache):
+    cache.get(f"{server}/private")
+    cache.get(f"{server}/private")
+
+    assert f"{server}/private" not in cache.index
+    assert Handler.requests == [("/private", None), ("/private", None)]
+
+
+def test_evicted_body_is_a_miss(server, cache):
+    cache.get(f"{server}/fresh")
+    os.remove(cache._path(cache.index[f"{server}/fresh"]))
+
+    response = cache.get(f"{server}/fresh")
+
+    assert (response.content, response.from_cache) == (b"page /fresh", False)
+
+
+def test_body_evicted_during_revalidation_is_refetched(server, cache, monkeypatch):
+    url = f"{server}/plain"
+    cache.get(url)
+    path = cache._path(cache.index[url])
+    # The body disappears after the lookup but before the 304 is handled
+    real_session = cache._session
+
+    def session():
+        if os.path.exists(path):
+            os.remove(path)
+        return real_session()
+    monkeypatch.setattr(cache, '_session', session)
+
+    response = cache.get(url)
+
+    assert (response.status, response.content, response.from_cache) == (200, b"page /plain", False)
+    assert Handler.requests == [("/plain", None), ("/plain", '"v1"'), ("/plain", None)]
+
+
+def test_lru_eviction(server, tmp_path):
+    cache = scraper.HttpCache(str(tmp_path / 'http'), max_bytes=len(b"page /a") * 2)
+    for path in ('/a', '/b', '/c'):
+        cache.get(f"{server}{path}")
+
+    assert sorted(cache.index) == [f"{server}/b", f"{server}/c"]
+    assert len(os.listdir(tmp_path / 'http')) == 2
+
+
+def test_index_persists(server, tmp_path):
+    cache = scraper.HttpCache(str(tmp_path / 'http'))
+    cache.get(f"{server}/fresh")
+    cache.save()
+
+    reloaded = scraper.HttpCache(str(tmp_path / 'http'))
+
+    assert reloaded.get(f"{server}/fresh").from_cache
+    assert len(Handler.requests) == 1
+
+
+def test_one_session_per_thread(cache):
+    with ThreadPoolExecutor(4) as pool:
+        sessions = list(pool.map(lambda _: cache._session(), range(32)))
+
+    assert len({id(session) for session in sessions}) <= 4
+    assert cache._session() is cache._session()
@@ -0,0 +1,36 @@
+import scraper_v10 as scraper
+from conftest import make_event
+
+
+def test_observe_classifies_events(tmp_path):
+    filename = str(tmp_path / 'identity_index.json')
+    index = scraper.IdentityIndex(filename)
+
+    assert index.observe(make_event("Heat")) == "new"
+    index.save()
+
+    index = scraper.IdentityIndex(filename)
+    assert index.observe(make_event("Heat")) == "unchanged"
+    assert index.observe(make_event("Heat", url="https://vistatheaterhollywood.com/heat")) == "updated"
+    assert index.observe(make_event("Thief", "New Bev")) == "new"
+
+    assert index.changed(make_event("Heat").id)
+    assert index.changed(make_event("Thief", "New Bev").id)
+    assert not index.changed(make_event("Ran").id)
+
+
+def test_save_drops_entries_not_seen_recently(tmp_path):
+    filename = str(tmp_path / 'identity_index.json')
+    index = scraper.IdentityIndex(filename)
+    index.observe(make_event("Heat"))
+    index.observe(make_event("Thief", "New Bev"))
+    old = (scraper.datetime.now() - scraper.timedelta(days=scraper.IDENTITY_INDEX_MAX_AGE_DAYS + 1))
+    index.entries[make_event("Thief", "New Bev").id]['last_seen'] = old.strftime('%Y-%m-%d')
+
+    index.save()
+
+    assert list(scraper.IdentityIndex(filename).entries) == [make_event("Heat").id]
+
+
+def test_missing_index_loads_empty(tmp_path):
+    assert scraper.IdentityIndex(str(tmp_path / 'missing.json')).entries == {}
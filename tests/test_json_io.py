@@ -0,0 +1,154 @@
+import io
+import json
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event
+
+
+RECORDS = [
+    {"id": "a", "title": "Ran", "start": 1794776400, "runtime": 162, "rating": -7.5, "score": 1e-3},
+    {"id": "b", "title": "Éloge de l'amour \"2001\"", "tags": ["35mm", None, True], "nested": {"x": []}},
+    {"id": "c", "title": "", "empty": {}, "numbers": [0, -0.25, 12345678901234, 6.02e23]},
+]
+
+
+def write_json(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 64 * 1024])
+@pytest.mark.parametrize('options', [{}, {"indent": 2}, {"separators": (',', ':')}])
+def test_iter_json_records_reads_arrays(tmp_path, chunk_size, options):
+    filename = write_json(tmp_path / 'events.json', json.dumps(RECORDS, **options))
+
+    assert list(scraper.iter_json_records(filename, chunk_size=chunk_size)) == RECORDS
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64 * 1024])
+def test_iter_json_records_reads_ndjson(tmp_path, chunk_size):
+    filename = write_json(tmp_path / 'events.ndjson', ''.join(json.dumps(record) + '\n' for record in RECORDS))
+
+    assert list(scraper.iter_json_records(filename, chunk_size=chunk_size)) == RECORDS
+
+
+def test_iter_json_records_numbers_across_chunks(tmp_path):
+    # "-7." must not be taken for -7 when the chunk ends inside the number
+    filename = write_json(tmp_path / 'numbers.json', '[-7.25, 1e5, 300]')
+
+    assert list(scraper.iter_json_records(filename, chunk_size=3)) == [-7.25, 1e5, 300]
+
+
+def test_iter_json_records_empty_and_truncated(tmp_path):
+    assert list(scraper.iter_json_records(write_json(tmp_path / 'empty.json', '[ ]'))) == []
+
+    with pytest.raises(ValueError):
+        list(scraper.iter_json_records(write_json(tmp_path / 'cut.json', '[{"id": "a"}, {"id": '), chunk_size=4))
+
+
+def test_iter_event_records_without_file(tmp_path):
+    assert list(scraper.iter_event_records(str(tmp_path / 'missing.json'))) == []
+
+
+@pytest.mark.parametrize('options', [{}, {"indent": 2, "ensure_ascii": False}, {"separators": (',', ':')}])
+@pytest.mark.parametrize('data', [
+    [],
+    RECORDS,
+    {"version": 1, "events": RECORDS, "empty": [], "meta": {"k": [1, 2]}},
+    {},
+])
+def test_write_json_streams_matches_json_dump(data, options):
+    f = io.StringIO()
+    streamed = {key: iter(value) if isinstance(value, list) else value for key, value in data.items()} \
+        if isinstance(data, dict) else iter(data)
+
+    scraper.write_json_streams(streamed, [(f, options)])
+
+    assert f.getvalue() == json.dumps(data, **options)
+
+
+def test_write_output_round_trip(tmp_path):
+    filename = str(tmp_path / 'events.json')
+
+    scraper.write_output(iter(RECORDS), filename, indent=2, ensure_ascii=False)
+
+    minified = scraper.minified_name(filename)
+    assert list(scraper.iter_json_records(filename)) == RECORDS
+    with open(minified, 'r', encoding='utf-8') as f:
+        assert f.read() == json.dumps(RECORDS, **scraper.COMPACT_JSON_OPTIONS)
+    assert scraper.output_exists(filename, indent=2)
+
+
+def test_compact_output_gets_no_minified_copy(tmp_path):
+    filename = str(tmp_path / 'changes.json')
+    # Left over from when outputs were precompressed
+    for stale in ('changes.min.json', 'changes.min.json.gz', 'changes.min.json.br'):
+        (tmp_path / stale).write_text('[]', encoding='utf-8')
+
+    scraper.write_output(iter(RECORDS), filename, **scraper.COMPACT_JSON_OPTIONS)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['changes.json']
+    assert scraper.output_exists(filename, **scraper.COMPACT_JSON_OPTIONS)
+    assert not scraper.output_exists(filename, indent=2)
+
+
+def test_canonical_hash_ignores_formatting_and_key_order():
+    reordered = [dict(reversed(list(record.items()))) for record in RECORDS]
+
+    assert scraper.canonical_hash(iter(reordered)) == scraper.canonical_hash(RECORDS)
+    assert scraper.canonical_hash(RECORDS[:2]) != scraper.canonical_hash(RECORDS)
+
+
+def event_records():
+    events = [
+        make_event("Thief", "New Bev", "2026-11-13", "7:30 PM", url="https://thenewbev.com/program/thief"),
+        make_event("Thief", "Los Feliz 3", "2026-11-18", "7:30 PM",
+                   url="https://www.americancinematheque.com/now-showing/thief-11-18-26-730pm/"),
+        make_event("Heat", "Vista", "2026-11-15", "1:00 PM", description="Michael Mann, 1995",
+                   url="https://ticketing.uswest.veezi.com/purchase/124?siteToken=abc"),
+        make_event("Wizard of Oz in 4K", "Academy", "2026-11-16", "2:30 PM"),
+        make_event("Ran", "Vidiots", "2026-11-14", "8:00 PM", url="https://vidiotsfoundation.org/ticket/ran?x=1"),
+        make_event("Alien", "New Bev", "2026-11-17", "7:30 PM", time_defaulted=True),
+    ]
+    events[0].film_id = events[1].film_id = "c9fdea28cd1f"
+    events[0].poster = events[1].poster = "posters/0123456789abcdef"
+    events[2].runtime = 170
+    events[3].format = "4K"
+    return [event.to_dict() for event in sorted(events, key=scraper.event_order)]
+
+
+def test_compact_round_trip(tmp_path):
+    records = event_records()
+    filename = str(tmp_path / 'events.compact.json')
+
+    scraper.write_output(scraper.encode_compact(iter(records)), filename, separators=(',', ':'))
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    assert scraper.decode_compact(data) == records
+    # Titles, venues and URL prefixes shared by events are stored once
+    assert len(data["titles"]) == 5
+    assert len(data["venues"]) == 5
+    assert [record.get("timeDefaulted") for record in records].count(True) == 1
+
+
+def test_compact_reads_version_1():
+    records = [record for record in event_records() if not record.get("timeDefaulted")]
+    data = json.loads(json.dumps(scraper.encode_compact(iter(records)), default=list))
+    data["version"] = 1
+    data["fields"] = data["fields"][:-1]
+
+    assert scraper.decode_compact(data) == records
+
+
+def test_compact_round_trip_without_events():
+    data = json.loads(json.dumps(scraper.encode_compact(iter([])), default=list))
+
+    assert scraper.decode_compact(data) == []
+
+
+def test_decode_compact_rejects_other_formats():
+    with pytest.raises(ValueError):
+        scraper.decode_compact({"format": "la-events-compact", "version": scraper.COMPACT_VERSION + 1})
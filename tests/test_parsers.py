@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event, read_fixture
+
+
+def parse(parse_function, fixture):
+    """Run a parser the way the worker pool does: (events, card updates, truncated)"""
+
+    return scraper.parse_page(parse_function, read_fixture(fixture))
+
+
+def listing(events):
+    return [(event.title, event.venue_short, event.date, event.time, event.url) for event in events]
+
+
+def test_vista_theater():
+    events, cards, truncated = parse(scraper.parse_vista_theater, 'vista_theater.html')
+
+    assert listing(events) == [
+        ("Thief", "Vista", "2026-11-14", "7:30 PM",
+         "https://ticketing.uswest.veezi.com/purchase/123?siteToken=abc"),
+        ("Heat", "Vista", "2026-11-15", "1:00 PM",
+         "https://ticketing.uswest.veezi.com/purchase/124?siteToken=abc"),
+    ]
+    assert len(cards) == 2
+    assert not truncated
+
+
+def test_new_beverly():
+    events, _, _ = parse(scraper.parse_new_beverly, 'new_beverly.html')
+
+    assert listing(events) == [
+        ("Thief", "New Bev", "2026-11-13", "7:30 PM", "https://thenewbev.com/program/thief"),
+        ("Manhunter", "New Bev", "2026-11-14", "7:30 PM", "https://thenewbev.com/event/manhunter"),
+    ]
+    # No time on the card: the default showtime is flagged
+    assert [event.time_defaulted for event in events] == [False, True]
+
+
+def test_vidiots():
+    events, _, _ = parse(scraper.parse_vidiots, 'vidiots.html')
+
+    # The section heading is not a film
+    assert listing(events) == [
+        ("Ran", "Vidiots", "2026-11-14", "8:00 PM", "https://vidiotsfoundation.org/ticket/ran"),
+    ]
+
+
+def test_academy_museum():
+    events, cards, truncated = parse(scraper.parse_academy_museum, 'academy_museum.html')
+
+    assert listing(events) == [
+        ("Wizard of Oz in 4K", "Academy", "2026-11-16", "2:30 PM",
+         "https://www.academymuseum.org/en/programs/detail/x"),
+        ("Heat", "Academy", "2026-11-17", "7:00 PM", "https://www.academymuseum.org/en/programs/detail/y"),
+    ]
+    # Each program gets the image from its own card only
+    assert [event.poster_url for event in events] == ["https://www.academymuseum.org/images/oz.jpg", ""]
+    # Kwaidan (March 2027) is past the 60-day horizon
+    assert len(cards) == 2
+    assert truncated
+
+
+def test_academy_museum_card_key_covers_poster():
+    html = read_fixture('academy_museum.html')
+    scraper.parse_page(scraper.parse_academy_museum, html)
+    _, before, _ = scraper.parse_page(scraper.parse_academy_museum, html)
+    _, after, _ = scraper.parse_page(scraper.parse_academy_museum, html.replace('oz.jpg', 'oz-restored.jpg'))
+
+    assert len(set(before) & set(after)) == 1
+
+
+def test_american_cinematheque():
+    events, _, _ = parse(scraper.parse_american_cinematheque, 'american_cinematheque.html')
+
+    assert listing(events) == [
+        ("Thief", "Los Feliz 3", "2026-11-18", "7:30 PM",
+         "https://www.americancinematheque.com/now-showing/thief-11-18-26-730pm/"),
+        ("The Keep", "Los Feliz 3", "2026-11-19", "8:15 PM",
+         "https://www.americancinematheque.com/now-showing/the-keep-11-19-26/"),
+    ]
+
+
+def test_cached_cards_are_reused():
+    html = read_fixture('vista_theater.html')
+    events, cards, _ = scraper.parse_page(scraper.parse_vista_theater, html)
+    scraper.card_cache.update({key: {"events": records, "seen": "2026-10-19"} for key, records in cards.items()})
+
+    cached_events, cached_cards, _ = scraper.parse_page(scraper.parse_vista_theater, html)
+
+    assert [event.to_dict() for event in cached_events] == [event.to_dict() for event in events]
+    assert cached_cards == cards
+
+
+@pytest.mark.parametrize('parse_function', [
+    scraper.parse_vista_theater,
+    scraper.parse_new_beverly,
+    scraper.parse_vidiots,
+    scraper.parse_academy_museum,
+    scraper.parse_american_cinematheque,
+])
+def test_empty_page(parse_function):
+    events, cards, truncated = scraper.parse_page(parse_function, '<html><body></body></html>')
+
+    assert (events, cards, truncated) == ([], {}, False)
+
+
+@pytest.mark.parametrize('date, time, utc', [
+    ("2026-10-31", "7:30 PM", "2026-11-01T02:30"),   # PDT, UTC-7
+    ("2026-11-01", "7:30 PM", "2026-11-02T03:30"),   # PST from 2 AM that day, UTC-8
+    ("2026-11-01", "1:30 AM", "2026-11-01T08:30"),   # repeated hour: the first (PDT) one
+    ("2027-03-14", "3:30 AM", "2027-03-14T10:30"),   # PDT again from 2 AM
+    ("2026-11-15", "12:00 AM", "2026-11-15T08:00"),
+    ("2026-11-15", "12:15 PM", "2026-11-15T20:15"),
+])
+def test_parse_start_across_dst(date, time, utc):
+    start = scraper.parse_start(date, time)
+
+    assert datetime.fromtimestamp(start, timezone.utc).strftime('%Y-%m-%dT%H:%M') == utc
+    # The listed wall-clock time round-trips
+    event = make_event("Heat", date=date, time=time)
+    assert (event.start, event.date, event.time) == (start, date, time)
+
+
+@pytest.mark.parametrize('date, time', [("2026-02-30", "7:30 PM"), ("2026-11-15", "TBA")])
+def test_parse_start_rejects_invalid(date, time):
+    with pytest.raises(ValueError):
+        scraper.parse_start(date, time)
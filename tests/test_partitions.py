@@ -0,0 +1,138 @@
+import json
+import os
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event
+
+
+@pytest.fixture(autouse=True)
+def site(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def records(*events):
+    return [event.to_dict() for event in sorted(events, key=scraper.event_order)]
+
+
+def read(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_partition(filename):
+    return scraper.decode_compact(read(filename))
+
+
+HEAT = make_event("Heat", date="2026-11-15")          # Sunday: the end of ISO week 46
+THIEF = make_event("Thief", "New Bev", date="2026-11-13")
+RAN = make_event("Ran", "Vidiots", date="2026-11-16")  # Monday: week 47
+
+
+def test_week_partition():
+    assert scraper.week_partition(HEAT.to_dict()) == ("2026-W46", "events/2026-W46.json")
+    assert scraper.week_partition(RAN.to_dict()) == ("2026-W47", "events/2026-W47.json")
+    # 11:30 PM local is already the next day in UTC
+    late = make_event("Heat", date="2026-11-15", time="11:30 PM")
+    assert scraper.week_partition(late.to_dict())[0] == "2026-W46"
+
+
+def test_write_partitions_and_manifest():
+    manifest = scraper.load_manifest()
+
+    scraper.write_partitions('weeks', records(HEAT, THIEF, RAN), scraper.week_partition, manifest)
+    scraper.write_manifest(manifest, {})
+
+    assert read_partition("events/2026-W46.json") == records(HEAT, THIEF)
+    assert read_partition("events/2026-W47.json") == records(RAN)
+    assert read(scraper.MANIFEST_FILE) == manifest == {"version": 2, "weeks": {
+        "2026-W46": {"file": "events/2026-W46.json", "hash": scraper.canonical_hash(records(HEAT, THIEF)),
+                     "count": 2, "first": "2026-11-13", "last": "2026-11-15"},
+        "2026-W47": {"file": "events/2026-W47.json", "hash": scraper.canonical_hash(records(RAN)),
+                     "count": 1, "first": "2026-11-16", "last": "2026-11-16"},
+    }}
+
+
+def test_only_changed_partitions_are_rewritten():
+    manifest = scraper.load_manifest()
+    scraper.write_partitions('weeks', records(HEAT, THIEF, RAN), scraper.week_partition, manifest)
+    os.utime("events/2026-W46.json", (0, 0))
+    os.utime("events/2026-W47.json", (0, 0))
+
+    # Ran moved to Tuesday and Heat is gone
+    tuesday = make_event("Ran", "Vidiots", date="2026-11-17")
+    scraper.write_partitions('weeks', records(THIEF, tuesday), scraper.week_partition, manifest)
+
+    assert os.path.getmtime("events/2026-W46.json") > 0
+    assert os.path.getmtime("events/2026-W47.json") > 0
+    assert read_partition("events/2026-W47.json") == records(tuesday)
+
+    scraper.write_partitions('weeks', records(THIEF), scraper.week_partition, manifest)
+    os.utime("events/2026-W46.json", (0, 0))
+    scraper.write_partitions('weeks', records(THIEF), scraper.week_partition, manifest)
+
+    assert os.path.getmtime("events/2026-W46.json") == 0
+    assert sorted(os.listdir("events")) == ["2026-W46.json"]
+    assert list(manifest["weeks"]) == ["2026-W46"]
+
+
+def test_manifest_from_another_version_rewrites_partitions():
+    os.makedirs("events")
+    for name in ("2026-W46.json", "2026-W46.min.json", "2026-W44.json", "2026-W44.min.json", "vista.json"):
+        with open(f"events/{name}", 'w', encoding='utf-8') as f:
+            f.write('[]')
+    with open(scraper.MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({"version": 1,
+                   "weeks": {week: {"file": f"events/{week}.json", "hash": scraper.canonical_hash(records(HEAT))}
+                             for week in ("2026-W44", "2026-W46")},
+                   "venues": {"Vista": {"file": "events/vista.json", "hash": "x"}}}, f)
+
+    manifest = scraper.load_manifest()
+    assert manifest == {"version": 2, "weeks": {"2026-W44": {"file": "events/2026-W44.json"},
+                                                "2026-W46": {"file": "events/2026-W46.json"}},
+                        "venues": {"Vista": {"file": "events/vista.json"}}}
+    scraper.write_partitions('weeks', records(HEAT), scraper.week_partition, manifest)
+
+    assert read_partition("events/2026-W46.json") == records(HEAT)
+    assert sorted(os.listdir("events")) == ["2026-W46.json", "manifest.json", "vista.json"]
+
+
+def test_partitions_must_be_contiguous():
+    with pytest.raises(ValueError):
+        scraper.write_partitions('weeks', [HEAT.to_dict(), RAN.to_dict(), THIEF.to_dict()],
+                                 scraper.week_partition, {})
+
+
+def test_unchanged_manifest_is_not_rewritten():
+    manifest = scraper.load_manifest()
+    scraper.write_partitions('weeks', records(HEAT), scraper.week_partition, manifest)
+    scraper.write_manifest(manifest, {})
+    os.utime(scraper.MANIFEST_FILE, (0, 0))
+
+    scraper.write_manifest(manifest, json.loads(json.dumps(manifest)))
+
+    assert os.path.getmtime(scraper.MANIFEST_FILE) == 0
+
+
+def test_write_feeds_rewrites_changed_venues():
+    manifest = {}
+    venue_records = sorted(records(HEAT, THIEF, RAN), key=lambda record: record['venueShort'])
+    scraper.write_feeds(venue_records, records(HEAT, THIEF, RAN), manifest)
+
+    assert sorted(os.listdir("feeds")) == ["all.ics", "new-bev.ics", "vidiots.ics", "vista.ics"]
+    assert manifest["feeds"]["Vista"] == {"file": "feeds/vista.ics", "hash": scraper.canonical_hash(records(HEAT)),
+                                          "count": 1}
+    for name in os.listdir("feeds"):
+        os.utime(f"feeds/{name}", (0, 0))
+
+    # Vidiots has no events left and Vista changed
+    heat = make_event("Heat", date="2026-11-15", description="Michael Mann, 1995")
+    scraper.write_feeds(records(THIEF, heat), records(THIEF, heat), manifest)
+
+    assert sorted(os.listdir("feeds")) == ["all.ics", "new-bev.ics", "vista.ics"]
+    assert os.path.getmtime("feeds/new-bev.ics") == 0
+    assert os.path.getmtime("feeds/vista.ics") > 0
+    assert os.path.getmtime("feeds/all.ics") > 0
+    assert list(manifest["feeds"]) == ["New Bev", "Vista"]
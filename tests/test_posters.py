@@ -0,0 +1,98 @@
+import io
+import os
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def poster_bytes(color, size=(600, 800)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class FakeHttpCache:
+    """Serves images from {url: bytes}, recording the URLs requested"""
+
+    def __init__(self, images):
+        self.images = images
+        self.fetched = []
+
+    def get(self, url):
+        self.fetched.append(url)
+        if url not in self.images:
+            return scraper.HttpResponse(url, 404, b"", "text/html", False)
+        return scraper.HttpResponse(url, 200, self.images[url], "image/png", False)
+
+
+@pytest.fixture
+def poster_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, 'POSTER_DIR', str(tmp_path))
+    monkeypatch.setattr(scraper, 'POSTER_INDEX_FILE', str(tmp_path / 'index.json'))
+    return tmp_path
+
+
+def serve(images):
+    cache = FakeHttpCache(images)
+    return cache, scraper.PipelineRun(http_cache=cache)
+
+
+def test_make_thumbnails(poster_dir):
+    scraper.make_thumbnails(poster_bytes('red', (1000, 1000)), 'abc')
+
+    assert sorted(os.listdir(poster_dir)) == ['abc-160.jpg', 'abc-160.webp', 'abc-320.jpg', 'abc-320.webp']
+    for width, height in scraper.POSTER_SIZES:
+        for extension in ('webp', 'jpg'):
+            with Image.open(poster_dir / f'abc-{width}.{extension}') as thumbnail:
+                assert thumbnail.size == (width, height)
+
+
+def test_fetch_posters_downloads_each_image_once(poster_dir):
+    cache, run = serve({"https://a/heat.png": poster_bytes('red'), "https://a/thief.png": poster_bytes('blue')})
+    events = [make_event("Heat", poster_url="https://a/heat.png"),
+              make_event("Heat", time="9:30 PM", poster_url="https://a/heat.png"),
+              make_event("Thief", "New Bev", poster_url="https://a/thief.png"),
+              make_event("Ran", "Vidiots", poster_url="https://a/missing.png")]
+    for event in events:
+        event.film_id = event.title
+
+    events = list(scraper.fetch_posters(iter(events), run))
+
+    assert sorted(cache.fetched) == ["https://a/heat.png", "https://a/missing.png", "https://a/thief.png"]
+    assert events[0].poster == events[1].poster != events[2].poster
+    assert events[0].poster.startswith(f"{poster_dir}/")
+    assert events[3].poster is None
+    assert os.path.exists(f"{events[0].poster}-160.webp")
+
+    # The next run finds both images in the index
+    cache, run = serve({})
+    again = list(scraper.fetch_posters(iter([make_event("Heat", poster_url="https://a/heat.png")]), run))
+    assert cache.fetched == []
+    assert again[0].poster == events[0].poster
+
+
+def test_identical_images_share_thumbnails(poster_dir):
+    _, run = serve({"https://a/1.png": poster_bytes('red'), "https://b/1.png": poster_bytes('red')})
+
+    events = list(scraper.fetch_posters(iter([make_event("Heat", poster_url="https://a/1.png"),
+                                              make_event("Thief", "New Bev", poster_url="https://b/1.png")]), run))
+
+    assert events[0].poster == events[1].poster
+    assert len([name for name in os.listdir(poster_dir) if name != 'index.json']) == 4
+
+
+def test_save_poster_index_drops_stale_entries(poster_dir):
+    scraper.make_thumbnails(poster_bytes('red'), 'old')
+    scraper.make_thumbnails(poster_bytes('blue'), 'new')
+    old = (scraper.datetime.now() - scraper.timedelta(days=scraper.POSTER_MAX_AGE_DAYS + 1)).strftime('%Y-%m-%d')
+
+    scraper.save_poster_index({"https://a/old.png": {"hash": "old", "seen": old},
+                               "https://a/new.png": {"hash": "new", "seen": "2026-10-19"}})
+
+    assert scraper.load_poster_index() == {"https://a/new.png": {"hash": "new", "seen": "2026-10-19"}}
+    assert sorted(os.listdir(poster_dir)) == ['index.json', 'new-160.jpg', 'new-160.webp', 'new-320.jpg',
+                                              'new-320.webp']
@@ -0,0 +1,130 @@
+import os
+import sqlite3
+
+import pytest
+
+import scraper_v10 as scraper
+from conftest import make_event
+
+
+@pytest.fixture
+def store(tmp_path):
+    with scraper.EventStore(str(tmp_path / 'events.db'), dump_dir=None) as store:
+        yield store
+
+
+def current_titles(store):
+    return [record["title"] for record in store.current_records(scraper.earliest_upcoming_start())]
+
+
+def test_current_records_in_events_json_order(store):
+    events = [make_event("Thief", "New Bev", "2026-11-13"), make_event("Heat", "Vista", "2026-11-15"),
+              make_event("Alien", "Academy", "2026-11-13")]
+
+    store.record_run(events, {"New Bev": True, "Vista": True, "Academy": True}, scraper.earliest_upcoming_start())
+
+    records = list(store.current_records(scraper.earliest_upcoming_start()))
+    assert records == [event.to_dict() for event in sorted(events, key=scraper.event_order)]
+    by_venue = store.current_records(scraper.earliest_upcoming_start(), by_venue=True)
+    assert [record["venueShort"] for record in by_venue] == ["Academy", "New Bev", "Vista"]
+
+
+def test_failed_venue_keeps_its_events(store):
+    earliest = scraper.earliest_upcoming_start()
+    store.record_run([make_event("Heat"), make_event("Thief", "New Bev")], {"Vista": True, "New Bev": True}, earliest)
+
+    # New Bev failed this run; Vista was scraped and no longer lists Heat
+    store.record_run([make_event("Ran", "Vista", "2026-11-14")], {"Vista": True, "New Bev": False}, earliest)
+
+    assert current_titles(store) == ["Ran", "Thief"]
+    assert {record["title"] for record in store.history(venue="The Vista Theater")} == {"Heat", "Ran"}
+
+
+def test_run_row_matches_export(store):
+    earliest = scraper.earliest_upcoming_start()
+    run = store.record_run([make_event("Heat")], {"Vista": True}, earliest)
+
+    row = store.db.execute('SELECT scraped, current, hash FROM runs WHERE id = ?', (run,)).fetchone()
+    assert tuple(row) == (1, 1, scraper.canonical_hash(store.current_records(earliest)))
+
+
+def test_rescraped_event_updates_in_place(store):
+    earliest = scraper.earliest_upcoming_start()
+    store.record_run([make_event("Heat")], {"Vista": True}, earliest)
+    enriched = make_event("Heat", description="Michael Mann, 1995")
+    store.record_run([enriched], {"Vista": True}, earliest)
+
+    records = list(store.current_records(earliest))
+    assert records == [enriched.to_dict()]
+    first_seen, last_seen = store.db.execute('SELECT first_seen, last_seen FROM events').fetchone()
+    assert (first_seen, last_seen) == (1, 2)
+
+
+def test_time_defaulted_round_trips(store):
+    events = [make_event("Heat"), make_event("Thief", "New Bev", time_defaulted=True)]
+    store.record_run(events, {"Vista": True, "New Bev": True}, scraper.earliest_upcoming_start())
+
+    records = list(store.current_records(scraper.earliest_upcoming_start()))
+
+    assert records == [event.to_dict() for event in sorted(events, key=scraper.event_order)]
+    assert [record.get("timeDefaulted") for record in records] == [True, None]
+    assert [scraper.Event.from_dict(record).time_defaulted for record in records] == [True, False]
+
+
+def test_store_from_version_2_gains_time_defaulted(tmp_path):
+    filename = str(tmp_path / 'events.db')
+    db = sqlite3.connect(filename)
+    db.executescript(scraper.STORE_SCHEMA.replace("    time_defaulted INTEGER NOT NULL DEFAULT 0,\n", ""))
+    db.executescript(scraper.STORE_SEARCH_SCHEMA)
+    db.execute('PRAGMA user_version = 2')
+    db.close()
+
+    with scraper.EventStore(filename, dump_dir=None) as store:
+        store.record_run([make_event("Heat", time_defaulted=True)], {"Vista": True}, scraper.earliest_upcoming_start())
+
+        records = list(store.current_records(scraper.earliest_upcoming_start()))
+        assert [record.get("timeDefaulted") for record in records] == [True]
+        assert store.db.execute('PRAGMA user_version').fetchone()[0] == scraper.STORE_VERSION
+
+
+def test_search(store):
+    store.record_run([make_event("Heat", description="Michael Mann's crime epic"),
+                      make_event("Thief", "New Bev", description="Michael Mann's first feature"),
+                      make_event("Ran", "Vidiots")],
+                     {"Vista": True, "New Bev": True, "Vidiots": True}, scraper.earliest_upcoming_start())
+
+    assert {record["title"] for record in store.search("michael mann")} == {"Heat", "Thief"}
+    assert [record["title"] for record in store.search("mann", venue="new bev")] == ["Thief"]
+    assert store.search("kurosawa") == []
+
+
+def test_dump_and_load(tmp_path):
+    earliest = scraper.earliest_upcoming_start()
+    dump_dir = str(tmp_path / 'data')
+    with scraper.EventStore(str(tmp_path / 'first.db'), dump_dir=dump_dir) as store:
+        store.record_run([make_event("Heat"), make_event("Thief", "New Bev")], {"Vista": True, "New Bev": True},
+                         earliest)
+        store.dump(dump_dir)
+        exported = list(store.current_records(earliest))
+
+    assert sorted(os.listdir(dump_dir)) == ["events.jsonl", "runs.jsonl", "venues.jsonl"]
+
+    with scraper.EventStore(str(tmp_path / 'second.db'), dump_dir=dump_dir) as store:
+        assert list(store.current_records(earliest)) == exported
+        assert [record["title"] for record in store.search("thief")] == ["Thief"]
+        # New runs continue the numbering
+        assert store.record_run([make_event("Heat")], {"Vista": True}, earliest) == 2
+
+        store.dump(dump_dir)
+    with open(os.path.join(dump_dir, 'runs.jsonl'), 'r', encoding='utf-8') as f:
+        assert len(f.readlines()) == 2
+
+
+def test_merge_previous_events_keeps_venues_not_scraped():
+    previous = [make_event("Heat").to_dict(), make_event("Thief", "New Bev").to_dict(),
+                make_event("Ran", "Vidiots", "2026-10-18").to_dict()]   # past
+
+    merged = scraper.merge_previous_events([make_event("Alien", "Vista")], previous,
+                                           {"Vista": True, "New Bev": False})
+
+    assert [event.title for event in merged] == ["Thief", "Alien"]